@@ -5,12 +5,14 @@ This module provides customer-facing endpoints for browsing items,
 placing orders, and managing their convenience store orders.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
 
 from app.core.database import get_db
+from app.core.pagination import CursorQuery
+from app.api.v1.responses import model_json_response, paginated_json_response
 from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.schemas.convenience import (
@@ -19,12 +21,13 @@ from app.schemas.convenience import (
     ConvenienceOrderCreate,
     ConvenienceOrderResponse,
     ConvenienceOrderList,
-    ConvenienceOrderSummary,
     OrderCancelRequest,
     OrderRatingCreate,
     CategoriesResponse,
     ConvenienceStoreConfigResponse,
     ConvenienceItemCategory,
+    ITEM_LIST_ADAPTER,
+    ORDER_SUMMARY_LIST_ADAPTER,
 )
 from app.services.convenience_service import (
     ConvenienceItemService,
@@ -44,6 +47,7 @@ def browse_items(
     search: Optional[str] = Query(None, description="Search in name/description"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: CursorQuery = None,
     db: Session = Depends(get_db),
 ):
     """
@@ -52,21 +56,25 @@ def browse_items(
     Returns only active items. Customers can filter by category and search by name/description.
     Public endpoint - no authentication required.
     """
-    items, total = ConvenienceItemService.list_items(
+    items, total, next_cursor = ConvenienceItemService.list_items(
         db=db,
         venue_id=venue_id,
         category=category,
         is_active=True,  # Only show active items to customers
         search=search,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        cursor=cursor
     )
 
-    return ConvenienceItemList(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size
+    return paginated_json_response(
+        "items",
+        ITEM_LIST_ADAPTER,
+        items,
+        total,
+        page,
+        page_size,
+        next_cursor=next_cursor,
     )
 
 
@@ -139,15 +147,8 @@ def get_venue_info(
 
     Public endpoint - no authentication required.
     """
-    config = ConvenienceConfigService.get_or_create_config(db=db, venue_id=venue_id)
-
-    if not config.is_enabled:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Convenience store not available at this venue"
-        )
-
-    return config
+    content = ConvenienceConfigService.get_public_config_json(db=db, venue_id=venue_id)
+    return Response(content=content, media_type="application/json")
 
 
 # Order Management Endpoints
@@ -204,7 +205,7 @@ def get_order_details(
             detail="You can only view your own orders"
         )
 
-    return order
+    return model_json_response(order)
 
 
 @router.get("/my-orders", response_model=ConvenienceOrderList)
@@ -212,6 +213,7 @@ def get_my_orders(
     status: Optional[str] = Query(None, description="Filter by order status"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Orders per page"),
+    cursor: CursorQuery = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -223,33 +225,23 @@ def get_my_orders(
 
     Requires: Authenticated user
     """
-    orders, total = ConvenienceOrderService.list_user_orders(
+    orders, total, next_cursor = ConvenienceOrderService.list_user_orders(
         db=db,
         user_id=current_user.id,
         status=status,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        cursor=cursor
     )
 
-    # Convert to summary format
-    summaries = []
-    for order in orders:
-        summaries.append(ConvenienceOrderSummary(
-            id=order.id,
-            order_number=order.order_number,
-            venue_name=order.venue_name,
-            status=order.status,
-            total_amount=order.total_amount,
-            item_count=len(order.items),
-            estimated_ready_time=order.estimated_ready_time,
-            created_at=order.created_at
-        ))
-
-    return ConvenienceOrderList(
-        orders=summaries,
-        total=total,
-        page=page,
-        page_size=page_size
+    return paginated_json_response(
+        "orders",
+        ORDER_SUMMARY_LIST_ADAPTER,
+        orders,
+        total,
+        page,
+        page_size,
+        next_cursor=next_cursor,
     )
 
 
@@ -270,7 +262,7 @@ def cancel_order(
 
     Requires: Authenticated user (order owner)
     """
-    order = ConvenienceOrderService.get_order(db=db, order_id=order_id)
+    order = ConvenienceOrderService.get_order_refs(db=db, order_id=order_id)
 
     # Verify order belongs to user
     if order.user_id != current_user.id:
@@ -304,7 +296,7 @@ def rate_order(
 
     Requires: Authenticated user (order owner)
     """
-    order = ConvenienceOrderService.get_order(db=db, order_id=order_id)
+    order = ConvenienceOrderService.get_order_refs(db=db, order_id=order_id)
 
     # Verify order belongs to user
     if order.user_id != current_user.id:
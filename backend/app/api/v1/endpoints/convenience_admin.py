@@ -13,6 +13,8 @@ from typing import List, Optional
 from uuid import UUID
 
 from app.core.database import get_db
+from app.core.pagination import CursorQuery
+from app.api.v1.responses import model_json_response, paginated_json_response
 from app.core.dependencies import get_current_user
 from app.models.user import User, UserRole
 from app.models.venue import Venue, VenueStaff
@@ -23,7 +25,6 @@ from app.schemas.convenience import (
     ConvenienceItemList,
     ConvenienceOrderResponse,
     ConvenienceOrderList,
-    ConvenienceOrderSummary,
     ConvenienceStoreConfigResponse,
     ConvenienceStoreConfigUpdate,
     ItemBulkImportRequest,
@@ -31,6 +32,8 @@ from app.schemas.convenience import (
     CategoriesResponse,
     OrderRefundRequest,
     ConvenienceItemCategory,
+    ITEM_LIST_ADAPTER,
+    ORDER_SUMMARY_LIST_ADAPTER,
 )
 from app.services.convenience_service import (
     ConvenienceItemService,
@@ -40,6 +43,11 @@ from app.services.convenience_service import (
 
 router = APIRouter(tags=["convenience-admin"])
 
+# Category list never changes at runtime; build the response once
+_ALL_CATEGORIES = CategoriesResponse(
+    categories=[category.value for category in ConvenienceItemCategory]
+)
+
 
 def check_admin_permissions(current_user: User, venue_id: UUID, db: Session) -> None:
     """
@@ -90,6 +98,7 @@ def list_venue_items(
     search: Optional[str] = Query(None, description="Search in name/description"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: CursorQuery = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -103,21 +112,25 @@ def list_venue_items(
     """
     check_admin_permissions(current_user, venue_id, db)
 
-    items, total = ConvenienceItemService.list_items(
+    items, total, next_cursor = ConvenienceItemService.list_items(
         db=db,
         venue_id=venue_id,
         category=category,
         is_active=is_active,
         search=search,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        cursor=cursor
     )
 
-    return ConvenienceItemList(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size
+    return paginated_json_response(
+        "items",
+        ITEM_LIST_ADAPTER,
+        items,
+        total,
+        page,
+        page_size,
+        next_cursor=next_cursor,
     )
 
 
@@ -228,15 +241,8 @@ def delete_item(
     """
     check_admin_permissions(current_user, venue_id, db)
 
-    # Verify item belongs to venue
-    item = ConvenienceItemService.get_item(db=db, item_id=item_id)
-    if item.venue_id != venue_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item not found"
-        )
-
-    ConvenienceItemService.delete_item(db=db, item_id=item_id)
+    # Scoped to the venue: an item from another venue is reported as not found
+    ConvenienceItemService.delete_item(db=db, item_id=item_id, venue_id=venue_id)
 
 
 @router.patch("/venues/{venue_id}/items/{item_id}/toggle", response_model=ConvenienceItemResponse)
@@ -392,6 +398,7 @@ def list_venue_orders(
     status: Optional[str] = Query(None, description="Filter by order status"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Orders per page"),
+    cursor: CursorQuery = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -405,33 +412,23 @@ def list_venue_orders(
     """
     check_admin_permissions(current_user, venue_id, db)
 
-    orders, total = ConvenienceOrderService.list_venue_orders(
+    orders, total, next_cursor = ConvenienceOrderService.list_venue_orders(
         db=db,
         venue_id=venue_id,
         status=status,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        cursor=cursor
     )
 
-    # Convert to summary format
-    summaries = []
-    for order in orders:
-        summaries.append(ConvenienceOrderSummary(
-            id=order.id,
-            order_number=order.order_number,
-            venue_name=order.venue_name,
-            status=order.status,
-            total_amount=order.total_amount,
-            item_count=len(order.items),
-            estimated_ready_time=order.estimated_ready_time,
-            created_at=order.created_at
-        ))
-
-    return ConvenienceOrderList(
-        orders=summaries,
-        total=total,
-        page=page,
-        page_size=page_size
+    return paginated_json_response(
+        "orders",
+        ORDER_SUMMARY_LIST_ADAPTER,
+        orders,
+        total,
+        page,
+        page_size,
+        next_cursor=next_cursor,
     )
 
 
@@ -460,7 +457,7 @@ def get_venue_order(
             detail="Order not found"
         )
 
-    return order
+    return model_json_response(order)
 
 
 @router.patch("/venues/{venue_id}/orders/{order_id}/refund", response_model=ConvenienceOrderResponse)
@@ -481,17 +478,18 @@ def refund_order(
     """
     check_admin_permissions(current_user, venue_id, db)
 
-    order = ConvenienceOrderService.get_order(db=db, order_id=order_id)
+    # Lock the order so the refund can't interleave with a staff transition
+    db_order = ConvenienceOrderService._lock_order_detail(db, order_id)
 
     # Verify order belongs to venue
-    if order.venue_id != venue_id:
+    if not db_order or db_order.venue_id != venue_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Order not found"
         )
 
     # Validate refund amount
-    if refund_data.refund_amount > order.total_amount:
+    if refund_data.refund_amount > db_order.total_amount:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Refund amount cannot exceed order total"
@@ -499,29 +497,27 @@ def refund_order(
 
     # TODO: Implement actual refund logic with payment processor
     # For now, just update the order
-    from app.models.convenience import ConvenienceOrder, ConvenienceOrderEvent, ConvenienceOrderStatus
+    from app.models.convenience import ConvenienceOrderEvent, ConvenienceOrderStatus
     from uuid import uuid4
     from datetime import datetime
 
-    db_order = db.query(ConvenienceOrder).filter(ConvenienceOrder.id == order_id).first()
     db_order.status = ConvenienceOrderStatus.REFUNDED.value
     db_order.refund_amount = refund_data.refund_amount
     db_order.refund_reason = refund_data.refund_reason
 
     # Log event
-    event = ConvenienceOrderEvent(
+    db_order.events.append(ConvenienceOrderEvent(
         id=uuid4(),
         order_id=order_id,
         status=ConvenienceOrderStatus.REFUNDED.value,
         notes=f"Refund processed: ${refund_data.refund_amount} - {refund_data.refund_reason}",
         created_by_id=current_user.id,
-    )
-    db.add(event)
+    ))
 
+    response = ConvenienceOrderService._flush_and_build_response(db, db_order)
     db.commit()
-    db.refresh(db_order)
 
-    return ConvenienceOrderService.get_order(db=db, order_id=order_id)
+    return response
 
 
 @router.get("/categories", response_model=CategoriesResponse)
@@ -535,5 +531,4 @@ def get_categories(
 
     Requires: Any authenticated user
     """
-    categories = [category.value for category in ConvenienceItemCategory]
-    return CategoriesResponse(categories=categories)
+    return _ALL_CATEGORIES
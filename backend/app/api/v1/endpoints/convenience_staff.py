@@ -14,22 +14,26 @@ from typing import List, Optional
 from uuid import UUID
 
 from app.core.database import get_db
+from app.api.v1.responses import model_json_response, paginated_json_response
 from app.core.dependencies import get_current_user
+from app.core.pagination import CursorQuery, paginate
 from app.models.user import User, UserRole
 from app.models.venue import VenueStaff
 from app.models.convenience import ConvenienceOrder, ConvenienceOrderStatus, OrderItemStatus
 from app.schemas.convenience import (
     ConvenienceOrderResponse,
     ConvenienceOrderList,
-    ConvenienceOrderSummary,
     OrderAcceptRequest,
     OrderStartShoppingRequest,
     OrderCompleteShoppingRequest,
     OrderStoreRequest,
     OrderDeliverRequest,
     OrderItemUpdateStatus,
+    ORDER_SUMMARY_LIST_ADAPTER,
 )
 from app.services.convenience_service import (
+    ORDER_SORT,
+    ORDER_SUMMARY_LOADS,
     ConvenienceOrderService,
     ConvenienceStaffService,
 )
@@ -86,6 +90,7 @@ def get_venue_order_queue(
     assigned_to_me: bool = Query(False, description="Show only orders assigned to me"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Orders per page"),
+    cursor: CursorQuery = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -113,33 +118,21 @@ def get_venue_order_queue(
     if assigned_to_me:
         query = query.filter(ConvenienceOrder.assigned_staff_id == current_user.id)
 
-    # Get orders
-    total = query.count()
-    offset = (page - 1) * page_size
-    orders = query.order_by(ConvenienceOrder.created_at).offset(offset).limit(page_size).all()
-
-    # Convert to response format
-    order_responses = [ConvenienceOrderService._build_order_response(db, order) for order in orders]
-
-    # Convert to summary format
-    summaries = []
-    for order in order_responses:
-        summaries.append(ConvenienceOrderSummary(
-            id=order.id,
-            order_number=order.order_number,
-            venue_name=order.venue_name,
-            status=order.status,
-            total_amount=order.total_amount,
-            item_count=len(order.items),
-            estimated_ready_time=order.estimated_ready_time,
-            created_at=order.created_at
-        ))
-
-    return ConvenienceOrderList(
-        orders=summaries,
-        total=total,
-        page=page,
-        page_size=page_size
+    # Oldest first, so the queue reads in the order customers placed them
+    orders, total, next_cursor = paginate(
+        query.options(*ORDER_SUMMARY_LOADS), ORDER_SORT, cursor, page, page_size
+    )
+
+    summaries = [ConvenienceOrderService._build_order_summary(order) for order in orders]
+
+    return paginated_json_response(
+        "orders",
+        ORDER_SUMMARY_LIST_ADAPTER,
+        summaries,
+        total,
+        page,
+        page_size,
+        next_cursor=next_cursor,
     )
 
 
@@ -164,7 +157,7 @@ def get_order_for_staff(
     # Check venue access
     check_staff_permissions(current_user, order.venue_id, db)
 
-    return order
+    return model_json_response(order)
 
 
 # Order Fulfillment Workflow Endpoints
@@ -189,7 +182,7 @@ def accept_order(
     check_staff_permissions(current_user, db=db)
 
     # Get order to check venue
-    order = ConvenienceOrderService.get_order(db=db, order_id=order_id)
+    order = ConvenienceOrderService.get_order_refs(db=db, order_id=order_id)
     check_staff_permissions(current_user, order.venue_id, db)
 
     return ConvenienceStaffService.accept_order(
@@ -217,7 +210,7 @@ def start_shopping(
     """
     check_staff_permissions(current_user, db=db)
 
-    order = ConvenienceOrderService.get_order(db=db, order_id=order_id)
+    order = ConvenienceOrderService.get_order_refs(db=db, order_id=order_id)
     check_staff_permissions(current_user, order.venue_id, db)
 
     return ConvenienceStaffService.start_shopping(
@@ -247,7 +240,7 @@ def complete_shopping(
     """
     check_staff_permissions(current_user, db=db)
 
-    order = ConvenienceOrderService.get_order(db=db, order_id=order_id)
+    order = ConvenienceOrderService.get_order_refs(db=db, order_id=order_id)
     check_staff_permissions(current_user, order.venue_id, db)
 
     return ConvenienceStaffService.complete_shopping(
@@ -278,7 +271,7 @@ def store_items(
     """
     check_staff_permissions(current_user, db=db)
 
-    order = ConvenienceOrderService.get_order(db=db, order_id=order_id)
+    order = ConvenienceOrderService.get_order_refs(db=db, order_id=order_id)
     check_staff_permissions(current_user, order.venue_id, db)
 
     return ConvenienceStaffService.store_order(
@@ -309,7 +302,7 @@ def deliver_order(
     """
     check_staff_permissions(current_user, db=db)
 
-    order = ConvenienceOrderService.get_order(db=db, order_id=order_id)
+    order = ConvenienceOrderService.get_order_refs(db=db, order_id=order_id)
     check_staff_permissions(current_user, order.venue_id, db)
 
     return ConvenienceStaffService.deliver_order(
@@ -345,17 +338,16 @@ def update_order_item_status(
     """
     check_staff_permissions(current_user, db=db)
 
-    order = ConvenienceOrderService.get_order(db=db, order_id=order_id)
-    check_staff_permissions(current_user, order.venue_id, db)
-
-    # Get the order item
-    from app.models.convenience import ConvenienceOrderItem
-    from datetime import datetime
+    db_order = ConvenienceOrderService._lock_order_detail(db, order_id)
+    if not db_order:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Order not found"
+        )
+    check_staff_permissions(current_user, db_order.venue_id, db)
 
-    order_item = db.query(ConvenienceOrderItem).filter(
-        ConvenienceOrderItem.id == item_id,
-        ConvenienceOrderItem.order_id == order_id
-    ).first()
+    # Get the order item (the locked order already has its items loaded)
+    order_item = next((item for item in db_order.items if item.id == item_id), None)
 
     if not order_item:
         raise HTTPException(
@@ -374,19 +366,19 @@ def update_order_item_status(
     from app.models.convenience import ConvenienceOrderEvent
     from uuid import uuid4
 
-    event = ConvenienceOrderEvent(
+    db_order.events.append(ConvenienceOrderEvent(
         id=uuid4(),
         order_id=order_id,
         status=f"item_update_{item_update.status.value}",
         notes=f"Item '{order_item.item_name}' marked as {item_update.status.value}" +
               (f": {item_update.substitution_notes}" if item_update.substitution_notes else ""),
         created_by_id=current_user.id,
-    )
-    db.add(event)
+    ))
 
+    response = ConvenienceOrderService._flush_and_build_response(db, db_order)
     db.commit()
 
-    return ConvenienceOrderService.get_order(db=db, order_id=order_id)
+    return response
 
 
 @router.post("/orders/{order_id}/upload-receipt", response_model=ConvenienceOrderResponse)
@@ -406,20 +398,15 @@ def upload_receipt(
     """
     check_staff_permissions(current_user, db=db)
 
-    order = ConvenienceOrderService.get_order(db=db, order_id=order_id)
-    check_staff_permissions(current_user, order.venue_id, db)
-
-    # Update receipt URL
-    db_order = db.query(ConvenienceOrder).filter(
-        ConvenienceOrder.id == order_id
-    ).first()
-
+    db_order = ConvenienceOrderService._lock_order_detail(db, order_id)
     if not db_order:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Order not found"
         )
+    check_staff_permissions(current_user, db_order.venue_id, db)
 
+    # Update receipt URL
     db_order.receipt_photo_url = receipt_url
 
     # Log event
@@ -427,16 +414,16 @@ def upload_receipt(
     from uuid import uuid4
     from datetime import datetime
 
-    event = ConvenienceOrderEvent(
+    db_order.events.append(ConvenienceOrderEvent(
         id=uuid4(),
         order_id=order_id,
         status=db_order.status,
         notes="Receipt photo uploaded",
         photo_url=receipt_url,
         created_by_id=current_user.id,
-    )
-    db.add(event)
+    ))
 
+    response = ConvenienceOrderService._flush_and_build_response(db, db_order)
     db.commit()
 
-    return ConvenienceOrderService.get_order(db=db, order_id=order_id)
+    return response
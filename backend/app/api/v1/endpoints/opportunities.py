@@ -140,6 +140,9 @@ async def update_opportunity_preferences(
         if value is not None:
             if field == 'frequency_preference' and value:
                 setattr(preferences, field, value.value)
+            elif field == 'blocked_partner_ids':
+                # Drop duplicates, keeping the order the user sent
+                setattr(preferences, field, list(dict.fromkeys(value)))
             else:
                 setattr(preferences, field, value)
 
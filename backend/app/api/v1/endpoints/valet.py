@@ -5,6 +5,7 @@ from datetime import datetime
 from uuid import UUID
 
 from app.core.database import get_db
+from app.api.v1.responses import paginated_json_response
 from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.models.valet import SavedVehicle
@@ -18,6 +19,7 @@ from app.schemas.valet import (
     ValetHistory,
     SavedVehicleCreate,
     SavedVehicleResponse,
+    VALET_HISTORY_ITEM_LIST_ADAPTER,
 )
 from app.services.valet_service import ValetService
 
@@ -335,7 +337,7 @@ def get_valet_history(
     Authentication:
     - Required - returns only user's own sessions
     """
-    return ValetService.get_user_history(
+    history = ValetService.get_user_history(
         db,
         user_id=current_user.id,
         page=page,
@@ -343,6 +345,10 @@ def get_valet_history(
         status_filter=status_filter
     )
 
+    return paginated_json_response(
+        "sessions", VALET_HISTORY_ITEM_LIST_ADAPTER, history.sessions, history.total, page, page_size
+    )
+
 
 @router.get("/venues/{venue_id}/availability", response_model=ValetAvailability)
 def check_valet_availability(
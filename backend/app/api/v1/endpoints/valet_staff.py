@@ -10,13 +10,14 @@ All endpoints require authentication and staff-level permissions (venue_staff, v
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, desc
+from sqlalchemy import Integer, and_, or_, func, desc
 from typing import List, Optional
 from datetime import datetime, timedelta
 from uuid import UUID
 from decimal import Decimal
 
 from app.core.database import get_db
+from app.api.v1.responses import list_json_response, model_json_response
 from app.core.dependencies import get_current_user
 from app.models.user import User, UserRole
 from app.models.valet import (
@@ -42,6 +43,7 @@ from app.schemas.valet import (
     KeyStorageConfigUpdate,
     KeyManagement,
     KeyStorageLocation,
+    VALET_SEARCH_RESULT_LIST_ADAPTER,
 )
 from app.services.valet_service import ValetService
 
@@ -120,7 +122,7 @@ def get_active_valet_queue(
     # Get queue from service
     queue = ValetService.get_staff_queue(db, venue_id)
 
-    return queue
+    return model_json_response(queue)
 
 
 @router.patch("/sessions/{session_id}/status", response_model=ValetSessionResponse)
@@ -498,53 +500,46 @@ def get_performance_metrics(
     )
 
     # Volume metrics
-    total_sessions = sessions_query.count()
-    completed_sessions = sessions_query.filter(
+    total_sessions, completed_sessions, cancelled_sessions = sessions_query.with_entities(
+        func.count(ValetSession.id),
+        func.count(ValetSession.id).filter(ValetSession.status == ValetStatus.COMPLETED.value),
+        func.count(ValetSession.id).filter(ValetSession.status == ValetStatus.CANCELLED.value),
+    ).one()
+
+    # Time, financial and quality metrics for completed sessions, aggregated
+    # in one pass by the database instead of loading every row
+    def avg_minutes(end, start):
+        # AVG skips NULLs, so sessions missing either timestamp are ignored
+        return func.avg(func.extract("epoch", end - start) / 60)
+
+    (
+        avg_parking_time,
+        avg_retrieval_time,
+        avg_wait_time,
+        total_revenue,
+        total_tips,
+        avg_rating,
+        total_ratings,
+        peak_occupancy,
+    ) = sessions_query.filter(
         ValetSession.status == ValetStatus.COMPLETED.value
-    ).count()
-    cancelled_sessions = sessions_query.filter(
-        ValetSession.status == ValetStatus.CANCELLED.value
-    ).count()
-
-    # Get completed sessions for detailed metrics
-    completed = sessions_query.filter(
-        ValetSession.status == ValetStatus.COMPLETED.value
-    ).all()
-
-    # Time metrics (in minutes)
-    parking_times = []
-    retrieval_times = []
-    wait_times = []
-
-    for session in completed:
-        # Parking time: check-in to parked
-        if session.check_in_time and session.parked_time:
-            parking_delta = session.parked_time - session.check_in_time
-            parking_times.append(parking_delta.total_seconds() / 60)
-
-        # Retrieval time: retrieval requested to ready
-        if session.retrieval_requested_time and session.ready_time:
-            retrieval_delta = session.ready_time - session.retrieval_requested_time
-            retrieval_times.append(retrieval_delta.total_seconds() / 60)
-
-        # Wait time: check-in to check-out
-        if session.check_in_time and session.check_out_time:
-            wait_delta = session.check_out_time - session.check_in_time
-            wait_times.append(wait_delta.total_seconds() / 60)
-
-    avg_parking_time = sum(parking_times) / len(parking_times) if parking_times else None
-    avg_retrieval_time = sum(retrieval_times) / len(retrieval_times) if retrieval_times else None
-    avg_wait_time = sum(wait_times) / len(wait_times) if wait_times else None
-
-    # Financial metrics
-    total_revenue = sum(s.total_price for s in completed if s.total_price)
-    total_tips = sum(s.tip_amount for s in completed if s.tip_amount)
-    avg_session_value = total_revenue / len(completed) if completed else None
-
-    # Quality metrics
-    rated_sessions = [s for s in completed if s.rating is not None]
-    avg_rating = sum(s.rating for s in rated_sessions) / len(rated_sessions) if rated_sessions else None
-    total_ratings = len(rated_sessions)
+    ).with_entities(
+        avg_minutes(ValetSession.parked_time, ValetSession.check_in_time),
+        avg_minutes(ValetSession.ready_time, ValetSession.retrieval_requested_time),
+        avg_minutes(ValetSession.check_out_time, ValetSession.check_in_time),
+        func.coalesce(func.sum(ValetSession.total_price), 0),
+        func.coalesce(func.sum(ValetSession.tip_amount), 0),
+        func.avg(ValetSession.rating),
+        func.count(ValetSession.rating),
+        func.max(ValetSession.additional_metadata["occupancy_snapshot"].astext.cast(Integer)),
+    ).one()
+
+    avg_parking_time = float(avg_parking_time) if avg_parking_time is not None else None
+    avg_retrieval_time = float(avg_retrieval_time) if avg_retrieval_time is not None else None
+    avg_wait_time = float(avg_wait_time) if avg_wait_time is not None else None
+    avg_session_value = total_revenue / completed_sessions if completed_sessions else None
+    avg_rating = float(avg_rating) if avg_rating is not None else None
+    peak_occupancy = peak_occupancy or 0
 
     # Incident count
     incident_count = db.query(func.count(ValetIncident.id)).filter(
@@ -555,12 +550,6 @@ def get_performance_metrics(
         )
     ).scalar() or 0
 
-    # Capacity metrics (approximations based on sessions)
-    peak_occupancy = max(
-        (s.metadata.get("occupancy_snapshot", 0) for s in completed if s.metadata),
-        default=0
-    )
-
     # Get current capacity for avg calculation
     capacity = db.query(ValetCapacity).filter(
         ValetCapacity.venue_id == venue_id
@@ -570,7 +559,7 @@ def get_performance_metrics(
     avg_occupancy = float(completed_sessions / 2) if completed_sessions > 0 else 0
     utilization_rate = (avg_occupancy / capacity.total_capacity) if capacity and capacity.total_capacity > 0 else 0
 
-    return ValetMetricsResponse(
+    metrics = ValetMetricsResponse(
         venue_id=venue_id,
         period_start=period_start,
         period_end=period_end,
@@ -592,6 +581,8 @@ def get_performance_metrics(
         utilization_rate=round(utilization_rate, 2)
     )
 
+    return model_json_response(metrics)
+
 
 @router.post("/sessions/{session_id}/payment/retry", response_model=dict)
 def retry_failed_payment(
@@ -873,7 +864,7 @@ def search_sessions(
             checked_in_at=session.check_in_time
         ))
 
-    return results
+    return list_json_response(VALET_SEARCH_RESULT_LIST_ADAPTER, results)
 
 
 def _build_valet_session_response(session: ValetSession, db: Session) -> ValetSessionResponse:
@@ -0,0 +1,85 @@
+"""
+JSON response helpers for hot read endpoints.
+
+These endpoints return schema objects the service layer has already built.
+Re-validating them through FastAPI's response_model just to serialize them
+is wasted work, so these helpers serialize with pydantic-core (or a cached
+TypeAdapter plus orjson for paginated lists) and return the bytes directly.
+Routes keep their response_model so the OpenAPI schema is unchanged.
+"""
+
+from typing import Any, List, Optional
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+def model_json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model straight to JSON.
+
+    Args:
+        model: Fully built response model
+
+    Returns:
+        JSON response produced by model_dump_json
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def list_json_response(adapter: TypeAdapter, rows: List[Any]) -> Response:
+    """
+    Serialize a plain list response with a cached TypeAdapter.
+
+    Args:
+        adapter: Cached TypeAdapter for the list of row schemas
+        rows: Row schema instances
+
+    Returns:
+        JSON response produced by the adapter's dump_json
+    """
+    return Response(content=adapter.dump_json(rows), media_type="application/json")
+
+
+# Default for next_cursor, so None can still mean "last page" for cursor lists
+_NO_CURSOR: Any = object()
+
+
+def paginated_json_response(
+    key: str,
+    adapter: TypeAdapter,
+    rows: List[Any],
+    total: Optional[int],
+    page: int,
+    page_size: int,
+    *,
+    next_cursor: Optional[str] = _NO_CURSOR,
+) -> Response:
+    """
+    Build a paginated JSON response without a wrapper model.
+
+    Pass next_cursor only when the wrapper model declares that field. It is
+    then always emitted, null on the last page; otherwise it is left out.
+
+    Args:
+        key: Name of the list field (e.g. "items", "orders")
+        adapter: Cached TypeAdapter for the list of row schemas
+        rows: Row schema instances
+        total: Total number of rows matching the query (None when paging by cursor)
+        page: Page number
+        page_size: Rows per page
+        next_cursor: Cursor for the next page, or None on the last page
+
+    Returns:
+        JSON response with the same shape as the wrapper model
+    """
+    body = {
+        key: adapter.dump_python(rows, mode="json"),
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+    }
+    if next_cursor is not _NO_CURSOR:
+        body["next_cursor"] = next_cursor
+    return Response(content=orjson.dumps(body), media_type="application/json")
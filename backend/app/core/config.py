@@ -20,6 +20,11 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # Password hashing: when enabled, Argon2 parameters are calibrated at
+    # startup to the largest cost whose median hash time stays under the target
+    PASSWORD_HASH_CALIBRATE: bool = False
+    PASSWORD_HASH_TARGET_MS: int = 250
+
     # CORS
     ALLOWED_ORIGINS: str = ""
 
@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
@@ -17,6 +19,21 @@ engine = create_engine(
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for work that runs on the event loop (background tasks), so
+# queries there don't block request handling. Same database, asyncpg driver.
+ASYNC_DATABASE_URL = make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg")
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=5,
+    max_overflow=10,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 # Create base class for models
 Base = declarative_base()
 
@@ -1,6 +1,8 @@
 import logging
+import queue
 import sys
 import uuid
+from logging.handlers import QueueHandler, QueueListener
 from contextvars import ContextVar
 from typing import Optional
 
@@ -10,6 +12,9 @@ from app.core.config import settings
 # Context variable for correlation ID
 correlation_id: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
 
+# Background thread that writes queued log records to the real handlers
+_log_listener: Optional[QueueListener] = None
+
 
 class CorrelationIdFilter(logging.Filter):
     """Add correlation ID to log records."""
@@ -20,7 +25,16 @@ class CorrelationIdFilter(logging.Filter):
 
 
 def setup_logging():
-    """Configure application logging."""
+    """
+    Configure application logging.
+
+    Loggers only enqueue records; a QueueListener thread formats and writes
+    them, so request threads never block on stdout. The correlation ID
+    filter runs on the QueueHandler, in the caller's context, where the
+    context variable is set.
+    """
+    global _log_listener
+
     log_level = logging.DEBUG if settings.DEBUG else logging.INFO
 
     # Create formatter with correlation ID
@@ -32,18 +46,33 @@ def setup_logging():
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    console_handler.addFilter(CorrelationIdFilter())
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(CorrelationIdFilter())
+
+    _log_listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _log_listener.start()
 
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(queue_handler)
 
     # Set levels for third-party loggers
     logging.getLogger("uvicorn").setLevel(logging.INFO)
     logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
 
 
+def shutdown_logging():
+    """Stop the log listener after writing out any queued records."""
+    global _log_listener
+
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
 def get_correlation_id() -> str:
     """Get or create correlation ID."""
     corr_id = correlation_id.get()
@@ -0,0 +1,155 @@
+"""
+Keyset (cursor) pagination helpers.
+
+OFFSET pagination makes the database read and discard every row before the
+requested page, and the accompanying COUNT(*) scans the whole filtered set.
+Keyset pagination instead remembers the sort key of the last row served and
+asks for rows strictly after it, which is a single index seek per page.
+
+A cursor is the last row's sort-key values, JSON-encoded and base64url'd so
+clients treat it as opaque.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Annotated, Any, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from fastapi import Query as QueryParam
+from sqlalchemy import asc, desc, tuple_
+from sqlalchemy.orm import Query
+
+
+# Query parameter for list endpoints that accept a keyset cursor
+CursorQuery = Annotated[
+    Optional[str],
+    QueryParam(
+        description="Cursor from a previous page's next_cursor (skips the total count)"
+    ),
+]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode a row's sort-key values as an opaque cursor."""
+    raw = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else str(v) for v in values]
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> List[Any]:
+    """
+    Decode a cursor back into values typed for the given sort columns.
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if len(raw) != len(columns):
+            raise ValueError("cursor length mismatch")
+
+        values = []
+        for column, value in zip(columns, raw):
+            python_type = column.type.python_type
+            if python_type is datetime:
+                values.append(datetime.fromisoformat(value))
+            elif python_type is UUID:
+                values.append(UUID(value))
+            else:
+                values.append(value)
+        return values
+    except (ValueError, TypeError, NotImplementedError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def keyset_page(
+    query: Query,
+    columns: Sequence[Any],
+    cursor: Optional[str],
+    page_size: int,
+    descending: bool = False,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Fetch one page of a query ordered by columns, starting after cursor.
+
+    columns must end in a unique column (normally the primary key) so every
+    row has a distinct position.
+
+    Args:
+        query: Filtered query without ORDER BY/LIMIT
+        columns: Sort columns, most significant first
+        cursor: Cursor from the previous page, or None for the first page
+        page_size: Rows per page
+        descending: Sort newest/largest first
+
+    Returns:
+        Tuple of (rows, next page cursor or None on the last page)
+    """
+    if cursor:
+        after = tuple_(*decode_cursor(cursor, columns))
+        key = tuple_(*columns)
+        query = query.filter(key < after if descending else key > after)
+
+    direction = desc if descending else asc
+    rows = query.order_by(*(direction(c) for c in columns)).limit(page_size + 1).all()
+
+    if len(rows) <= page_size:
+        return rows, None
+
+    rows = rows[:page_size]
+    return rows, cursor_for(rows[-1], columns)
+
+
+def cursor_for(row: Any, columns: Sequence[Any]) -> str:
+    """Build the cursor pointing just past row."""
+    return encode_cursor([getattr(row, c.key) for c in columns])
+
+
+def paginate(
+    query: Query,
+    columns: Sequence[Any],
+    cursor: Optional[str],
+    page: int,
+    page_size: int,
+    descending: bool = False,
+) -> Tuple[List[Any], Optional[int], Optional[str]]:
+    """
+    Page a query by cursor when one is given, otherwise by page number.
+
+    The page-number path keeps the COUNT and OFFSET for existing clients but
+    also hands back a cursor, so a client can switch to keyset paging after
+    the first page. The cursor path skips the COUNT and returns no total.
+
+    Args:
+        query: Filtered query without ORDER BY/LIMIT
+        columns: Sort columns, most significant first, ending in a unique one
+        cursor: Cursor from a previous page's next_cursor
+        page: Page number (ignored when cursor is given)
+        page_size: Rows per page
+        descending: Sort newest/largest first
+
+    Returns:
+        Tuple of (rows, total count or None, next page cursor or None)
+    """
+    if cursor:
+        rows, next_cursor = keyset_page(query, columns, cursor, page_size, descending)
+        return rows, None, next_cursor
+
+    total = query.count()
+    offset = (page - 1) * page_size
+    direction = desc if descending else asc
+    rows = (
+        query.order_by(*(direction(c) for c in columns))
+        .offset(offset)
+        .limit(page_size)
+        .all()
+    )
+
+    next_cursor = cursor_for(rows[-1], columns) if rows and offset + len(rows) < total else None
+    return rows, total, next_cursor
@@ -1,5 +1,7 @@
 import redis
-from typing import Optional
+from redis.client import Pipeline
+from redis.commands.core import Script
+from typing import Dict, Iterator, Optional
 from app.core.config import settings
 
 
@@ -37,6 +39,37 @@ class RedisClient:
         """Increment key value."""
         return self.client.incr(key)
 
+    def zadd(self, key: str, mapping: Dict[str, float]) -> int:
+        """Add members to a sorted set (or update their scores)."""
+        return self.client.zadd(key, mapping)
+
+    def zrem(self, key: str, *members: str) -> int:
+        """Remove members from a sorted set."""
+        return self.client.zrem(key, *members)
+
+    def zremrangebyscore(self, key: str, min_score: float, max_score: float) -> int:
+        """Remove sorted set members with scores in [min_score, max_score]."""
+        return self.client.zremrangebyscore(key, min_score, max_score)
+
+    def next_score_after(self, key: str, after: float) -> Optional[float]:
+        """Get the lowest sorted set score strictly greater than after."""
+        entries = self.client.zrangebyscore(
+            key, f"({after}", "+inf", start=0, num=1, withscores=True
+        )
+        return entries[0][1] if entries else None
+
+    def scan_iter(self, match: str, count: int = 500) -> Iterator[str]:
+        """Iterate over keys matching a pattern without blocking Redis."""
+        return self.client.scan_iter(match=match, count=count)
+
+    def pipeline(self, transaction: bool = False) -> Pipeline:
+        """Start a pipeline that sends queued commands in one round trip."""
+        return self.client.pipeline(transaction=transaction)
+
+    def register_script(self, script: str) -> Script:
+        """Register a Lua script (run via EVALSHA, falling back to EVAL)."""
+        return self.client.register_script(script)
+
     def close(self):
         """Close Redis connection."""
         self.client.close()
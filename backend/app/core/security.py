@@ -1,13 +1,90 @@
+import hashlib
+import logging
+import os
+import statistics
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from passlib.hash import argon2
 from fastapi import HTTPException, status
 
 from app.core.config import settings
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use Argon2id (OWASP's 46 MiB profile). bcrypt stays listed so
+# existing hashes still verify; being non-default it is marked deprecated, and
+# verify_and_update_password() hands back an Argon2id replacement on login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=3,
+    argon2__memory_cost=46 * 1024,
+    argon2__parallelism=1,
+)
+
+logger = logging.getLogger(__name__)
+
+# Argon2 is CPU- and memory-bound. The auth endpoints are sync, so FastAPI
+# already runs them on its threadpool rather than the event loop, but that
+# pool is 40 threads wide; cap concurrent hashes at the core count so a
+# login burst queues instead of oversubscribing CPU and memory.
+_hash_slots = threading.BoundedSemaphore(os.cpu_count() or 1)
+
+# Candidate Argon2id parameters for calibration, as (memory_cost KiB, time_cost)
+ARGON2_MEMORY_COSTS_KIB = (19 * 1024, 32 * 1024, 46 * 1024, 64 * 1024, 96 * 1024)
+ARGON2_TIME_COSTS = (2, 3, 4)
+
+
+def calibrate_password_hashing(target_ms: int, samples: int = 5) -> Tuple[int, int]:
+    """
+    Tune Argon2id parameters to this host and apply them to pwd_context.
+
+    Candidates are tried from cheapest to most expensive; the most expensive
+    one whose median hash time is under target_ms wins (or the cheapest if
+    none are). Trying stops at the first candidate over target, so startup
+    pays for at most one over-budget measurement.
+
+    Existing hashes made with other parameters keep verifying and are
+    re-hashed on the next login.
+
+    Args:
+        target_ms: Maximum median hash time in milliseconds
+        samples: Hashes timed per candidate
+
+    Returns:
+        Chosen (memory_cost, time_cost)
+    """
+    candidates = sorted(
+        ((m, t) for m in ARGON2_MEMORY_COSTS_KIB for t in ARGON2_TIME_COSTS),
+        key=lambda params: params[0] * params[1],
+    )
+    chosen = candidates[0]
+
+    for memory_cost, time_cost in candidates:
+        handler = argon2.using(
+            type="ID", memory_cost=memory_cost, time_cost=time_cost, parallelism=1
+        )
+        timings = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            handler.hash("calibration-password")
+            timings.append((time.perf_counter() - start) * 1000)
+
+        if statistics.median(timings) >= target_ms:
+            break
+        chosen = (memory_cost, time_cost)
+
+    memory_cost, time_cost = chosen
+    pwd_context.update(argon2__memory_cost=memory_cost, argon2__time_cost=time_cost)
+    logger.info(
+        "Argon2id calibrated: memory_cost=%d KiB, time_cost=%d, parallelism=1 (target %d ms)",
+        memory_cost, time_cost, target_ms,
+    )
+    return chosen
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -56,9 +133,34 @@ def verify_token(token: str, token_type: str = "access") -> dict:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    with _hash_slots:
+        return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and upgrade outdated hashes.
+
+    Returns:
+        (is_valid, new_hash) where new_hash is set when the stored hash uses a
+        deprecated scheme or outdated parameters and should be replaced
+    """
+    with _hash_slots:
+        return pwd_context.verify_and_update(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    with _hash_slots:
+        return pwd_context.hash(password)
+
+
+def hash_reset_token(token: str) -> str:
+    """
+    Hash a password reset token for storage.
+
+    Reset tokens are random 256-bit values, so a plain SHA-256 is enough:
+    it keeps a leaked users table from handing out working reset links,
+    and lookups stay a simple equality match on a fixed-length column.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
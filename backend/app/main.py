@@ -4,7 +4,7 @@ from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.core.config import settings
-from app.core.logging_config import setup_logging
+from app.core.logging_config import setup_logging, shutdown_logging
 from app.api.v1.router import api_router
 from app.middleware.correlation_id import CorrelationIdMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
@@ -87,9 +87,19 @@ async def startup_event():
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"Debug mode: {settings.DEBUG}")
 
+    if settings.PASSWORD_HASH_CALIBRATE:
+        from app.core.security import calibrate_password_hashing
+
+        calibrate_password_hashing(settings.PASSWORD_HASH_TARGET_MS)
+
+    # Build the OpenAPI document once up front. FastAPI caches it on the app,
+    # so the first docs/openapi.json request doesn't pay for schema generation.
+    app.openapi()
+
     # Start background tasks for parking system
     BackgroundTasks.start_expiration_checker(check_interval_minutes=5)
     BackgroundTasks.start_expired_session_cleanup(check_interval_minutes=10)
+    BackgroundTasks.start_last_login_flusher(flush_interval_seconds=60)
     logger.info("Started parking background tasks")
 
 
@@ -110,3 +120,6 @@ async def shutdown_event():
     from app.core.redis_client import redis_client
 
     redis_client.close()
+
+    # Last, so the shutdown messages above are written out
+    shutdown_logging()
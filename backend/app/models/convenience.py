@@ -5,7 +5,20 @@ This module defines database models for the on-premise convenience store feature
 allowing parking lot owners to offer shopping and delivery services to parkers.
 """
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Numeric, Boolean, Index, Text, CheckConstraint
+from sqlalchemy import (
+    Column,
+    String,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Numeric,
+    Boolean,
+    Index,
+    Text,
+    CheckConstraint,
+    Computed,
+    Sequence,
+)
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -57,6 +70,11 @@ class OrderItemStatus(str, enum.Enum):
     DELIVERED = "delivered"
 
 
+# Generated column expression for ConvenienceItem.final_price. Keep in sync
+# with scripts/add_convenience_store.py.
+FINAL_PRICE_SQL = "base_price + markup_amount + base_price * markup_percent / 100"
+
+
 class ConvenienceItem(Base):
     """Items available for purchase at a venue."""
 
@@ -75,7 +93,11 @@ class ConvenienceItem(Base):
     base_price = Column(Numeric(10, 2), nullable=False)  # Cost at store
     markup_amount = Column(Numeric(10, 2), default=0, nullable=False)  # Fixed markup
     markup_percent = Column(Numeric(5, 2), default=0, nullable=False)  # Percentage markup
-    final_price = Column(Numeric(10, 2), nullable=False)  # What customer pays
+    final_price = Column(
+        Numeric(10, 2),
+        Computed(FINAL_PRICE_SQL, persisted=True),
+        nullable=False
+    )  # What customer pays, maintained by Postgres
 
     # Source
     source_store = Column(String(200), nullable=False)  # 'Walgreens', 'CVS', etc.
@@ -103,15 +125,32 @@ class ConvenienceItem(Base):
 
     # Indexes
     __table_args__ = (
-        Index('ix_convenience_items_venue_active', 'venue_id', 'is_active'),
+        # Serves list_items: venue (+ active) filter in (name, id) keyset order
+        Index('ix_convenience_items_venue_active_name', 'venue_id', 'is_active', 'name', 'id'),
         Index('ix_convenience_items_category', 'category'),
         Index('ix_convenience_items_source_store', 'source_store'),
+        # Trigram indexes so list_items' ILIKE '%term%' search can use an index
+        Index('ix_convenience_items_name_trgm', 'name',
+              postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('ix_convenience_items_description_trgm', 'description',
+              postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'}),
     )
 
+    # Fetch final_price back in the INSERT/UPDATE's RETURNING clause
+    # rather than with a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<ConvenienceItem {self.name} - ${self.final_price}>"
 
 
+# Source of CS-XXXXX order numbers. Starts past the old random 4-digit
+# range so new numbers never collide with existing orders.
+order_number_seq = Sequence(
+    "convenience_order_number_seq", start=10000, metadata=Base.metadata
+)
+
+
 class ConvenienceOrder(Base):
     """Orders placed by parkers."""
 
@@ -182,11 +221,22 @@ class ConvenienceOrder(Base):
     parking_session = relationship("ValetSession", foreign_keys=[parking_session_id])
     assigned_staff = relationship("User", foreign_keys=[assigned_staff_id])
     items = relationship("ConvenienceOrderItem", back_populates="order", cascade="all, delete-orphan")
-    events = relationship("ConvenienceOrderEvent", back_populates="order", cascade="all, delete-orphan")
+    events = relationship(
+        "ConvenienceOrderEvent",
+        back_populates="order",
+        cascade="all, delete-orphan",
+        order_by="ConvenienceOrderEvent.created_at",
+    )
 
     # Constraints
     __table_args__ = (
-        Index('ix_convenience_orders_venue_status', 'venue_id', 'status'),
+        # Serve the order lists, newest first in (created_at, id) keyset order
+        Index(
+            'ix_convenience_orders_venue_status_created',
+            'venue_id', 'status', 'created_at', 'id',
+        ),
+        Index('ix_convenience_orders_venue_created', 'venue_id', 'created_at', 'id'),
+        Index('ix_convenience_orders_user_created', 'user_id', 'created_at', 'id'),
         Index('ix_convenience_orders_user', 'user_id'),
         Index('ix_convenience_orders_parking_session', 'parking_session_id'),
         Index('ix_convenience_orders_order_number', 'order_number'),
@@ -47,8 +47,9 @@ class Partner(Base):
     contact_email = Column(String(255), nullable=False)
     contact_phone = Column(String(20), nullable=True)
     address = Column(Text, nullable=True)
-    location_lat = Column(Numeric(10, 8), nullable=True)
-    location_lng = Column(Numeric(11, 8), nullable=True)
+    # Stored as NUMERIC for accuracy, loaded as float for distance math and schemas
+    location_lat = Column(Numeric(10, 8, asdecimal=False), nullable=True)
+    location_lng = Column(Numeric(11, 8, asdecimal=False), nullable=True)
 
     # Integration details
     webhook_url = Column(Text, nullable=True)
@@ -108,8 +109,9 @@ class Opportunity(Base):
     # Example: {"discount_percentage": 20, "parking_extension_minutes": 30, "perks": []}
 
     # Location data
-    location_lat = Column(Numeric(10, 8), nullable=True)
-    location_lng = Column(Numeric(11, 8), nullable=True)
+    # Stored as NUMERIC for accuracy, loaded as float for distance math and schemas
+    location_lat = Column(Numeric(10, 8, asdecimal=False), nullable=True)
+    location_lng = Column(Numeric(11, 8, asdecimal=False), nullable=True)
     address = Column(Text, nullable=True)
     walking_distance_meters = Column(Integer, nullable=True)
 
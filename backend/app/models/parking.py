@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Numeric, Boolean, Index
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Numeric, Boolean, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -140,6 +140,11 @@ class ParkingSession(Base):
         Index('ix_parking_sessions_user_status', 'user_id', 'status'),
         Index('ix_parking_sessions_expires_at', 'expires_at'),
         Index('ix_parking_sessions_access_code', 'access_code'),
+        Index(
+            'ix_parking_sessions_active_expires',
+            'expires_at',
+            postgresql_where=text("status IN ('active', 'expiring_soon')"),
+        ),
     )
 
     def __repr__(self):
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum, Text, Index
+from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -61,6 +61,11 @@ class User(Base):
     __table_args__ = (
         Index('ix_users_email_active', 'email', 'is_active'),
         Index('ix_users_role_active', 'role', 'is_active'),
+        Index(
+            'ix_users_reset_token_active',
+            'reset_token',
+            postgresql_where=text('reset_token IS NOT NULL'),
+        ),
     )
 
     def __repr__(self):
@@ -0,0 +1,188 @@
+"""
+Common Schema Types
+
+Reusable annotated types and base classes shared across schema modules.
+Defining each constraint once lets pydantic reuse the same validator for
+every field that uses it instead of building a new one per field.
+"""
+
+import re
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from enum import Enum
+from typing import Annotated, Any, Optional, Type, TypeVar
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    StringConstraints,
+    field_validator,
+)
+from typing_extensions import TypedDict
+
+
+# Response builders nest instances made with model_construct inside other
+# models. revalidate_instances="never" keeps pydantic from validating those
+# nested instances again, so pin it rather than inheriting the default. This
+# only covers validation inside pydantic: routes that return models through
+# FastAPI's response_model are still dumped and validated again, and only the
+# model_json_response / TypeAdapter routes skip that. Don't mutate response
+# models after building them; nothing will re-check the new values.
+
+# Shared config for read-only response models built from ORM rows
+RESPONSE_CONFIG = ConfigDict(from_attributes=True, frozen=True, revalidate_instances="never")
+
+# Shared config for models populated from ORM rows that may still be mutated
+ORM_CONFIG = ConfigDict(from_attributes=True, revalidate_instances="never")
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def from_orm_trusted(model: Type[ModelT], obj: Any) -> ModelT:
+    """
+    Build a model from an ORM row without running field validation.
+
+    Only for rows the service itself loaded or just wrote, whose column
+    types already match the model's fields.
+    """
+    return model.model_construct(**{name: getattr(obj, name) for name in model.model_fields})
+
+
+# Money / percentages
+
+NonNegMoney = Annotated[Decimal, Field(ge=0)]
+PercentMoney = Annotated[Decimal, Field(ge=0, le=100)]
+
+ZERO_DECIMAL = Decimal("0")
+
+
+@lru_cache(maxsize=256, typed=True)
+def to_decimal(v: Any) -> Decimal:
+    """
+    Convert a JSON config value (str/int/float) to Decimal.
+
+    Pricing config holds a handful of distinct values, so results are cached.
+    ``typed=True`` keeps 10 and 10.0 apart, since they format differently.
+    """
+    return Decimal(v) if isinstance(v, str) else Decimal(str(v))
+
+
+# Integers
+
+PosInt100 = Annotated[int, Field(ge=1, le=100)]
+Rating1to5 = Annotated[int, Field(ge=1, le=5)]
+
+
+# Strings
+
+Name200 = Annotated[str, StringConstraints(min_length=1, max_length=200)]
+Code100 = Annotated[str, StringConstraints(max_length=100)]
+Text500 = Annotated[str, StringConstraints(max_length=500)]
+Text1000 = Annotated[str, StringConstraints(max_length=1000)]
+Reason500 = Annotated[str, StringConstraints(min_length=1, max_length=500)]
+
+# Syntax-only email check. Cheaper than EmailStr/email-validator; use it where
+# the address is only used for notifications, not as an account identifier.
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def _check_email(v: str) -> str:
+    if not _EMAIL_RE.fullmatch(v):
+        raise ValueError("value is not a valid email address")
+    return v
+
+
+EmailAddress = Annotated[str, AfterValidator(_check_email)]
+
+
+# Enums
+
+def enum_lookup(enum_cls: Type[Enum]) -> BeforeValidator:
+    """
+    Build a BeforeValidator that maps raw values to enum members.
+
+    A single dict lookup replaces the EnumMeta call for known values; anything
+    else is passed through so the regular enum validator reports the error.
+    """
+    members = {member.value: member for member in enum_cls}
+
+    def _lookup(v: Any) -> Any:
+        try:
+            return members[v]
+        except (KeyError, TypeError):
+            return v
+
+    return BeforeValidator(_lookup)
+
+
+# Timestamps
+
+# Response-only datetime that serializes to JSON with a plain isoformat() call,
+# skipping pydantic's generic datetime serializer. Stored timestamps are naive
+# UTC, so the output matches the default format.
+Timestamp = Annotated[
+    datetime,
+    PlainSerializer(datetime.isoformat, return_type=str, when_used="json"),
+]
+
+
+# Structured JSON shapes
+
+class DayHours(TypedDict, total=False):
+    """Opening hours for one day, e.g. {"open": "08:00", "close": "20:00"}."""
+    open: str
+    close: str
+
+
+class OperatingHours(TypedDict, total=False):
+    """Opening hours keyed by lowercase day name."""
+    monday: DayHours
+    tuesday: DayHours
+    wednesday: DayHours
+    thursday: DayHours
+    friday: DayHours
+    saturday: DayHours
+    sunday: DayHours
+
+
+# Normalizers
+
+_PLATE_TRANS = str.maketrans("", "", " \t\r\n")
+_PHONE_TRANS = str.maketrans("", "", "-() ")
+
+
+def normalize_plate(v: str) -> str:
+    """Normalize a license plate: drop whitespace and uppercase."""
+    return v.translate(_PLATE_TRANS).upper()
+
+
+def normalize_phone(v: Optional[str]) -> Optional[str]:
+    """Strip common phone formatting and default to a US country code."""
+    if not v:
+        return v
+    phone = v.translate(_PHONE_TRANS)
+    return phone if phone.startswith("+") else "+1" + phone
+
+
+# Shared models
+
+class VehicleInfo(BaseModel):
+    """Vehicle information for parking and valet sessions."""
+    plate: str = Field(..., min_length=1, max_length=20, description="License plate number")
+    make: Optional[str] = Field(None, max_length=50, description="Vehicle make (e.g., Toyota)")
+    model: Optional[str] = Field(None, max_length=50, description="Vehicle model (e.g., Camry)")
+    color: Optional[str] = Field(None, max_length=30, description="Vehicle color")
+    year: Optional[int] = Field(None, ge=1900, le=2100, description="Vehicle year")
+    notes: Optional[str] = Field(None, max_length=500, description="Special notes (e.g., scratches, modifications)")
+
+    @field_validator("plate")
+    @classmethod
+    def validate_plate(cls, v):
+        """Validate and normalize license plate."""
+        return normalize_plate(v)
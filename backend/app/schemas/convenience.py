@@ -5,13 +5,29 @@ This module defines Pydantic schemas for the convenience store feature,
 including request/response models for items, orders, and configuration.
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, TypeAdapter
+from pydantic.dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Literal, NamedTuple
 from datetime import datetime
 from uuid import UUID
 from decimal import Decimal
 from enum import Enum
 
+from app.schemas.common import (
+    NonNegMoney,
+    PercentMoney,
+    PosInt100,
+    Rating1to5,
+    Name200,
+    Code100,
+    Text500,
+    Text1000,
+    Reason500,
+    ZERO_DECIMAL,
+    Timestamp,
+    RESPONSE_CONFIG,
+)
+
 
 # Enums
 
@@ -39,6 +55,15 @@ class ConvenienceOrderStatus(str, Enum):
     REFUNDED = "refunded"
 
 
+# Literal mirrors of the enums above, used on response models so validation is
+# a plain string lookup instead of an Enum coercion. Keep in sync with the enums.
+
+OrderStatusStr = Literal[
+    "pending", "confirmed", "shopping", "purchased", "stored",
+    "ready", "delivered", "completed", "cancelled", "refunded",
+]
+
+
 class PaymentStatus(str, Enum):
     """Payment status for orders."""
     PENDING = "pending"
@@ -48,6 +73,9 @@ class PaymentStatus(str, Enum):
     FAILED = "failed"
 
 
+PaymentStatusStr = Literal["pending", "authorized", "captured", "refunded", "failed"]
+
+
 class OrderItemStatus(str, Enum):
     """Status for individual order items."""
     PENDING = "pending"
@@ -57,25 +85,37 @@ class OrderItemStatus(str, Enum):
     DELIVERED = "delivered"
 
 
+OrderItemStatusStr = Literal["pending", "found", "not_found", "substituted", "delivered"]
+
+# Statuses recorded on order events: every order status, plus the per-item
+# updates logged by staff as "item_update_<item status>".
+EventStatusStr = Literal[
+    "pending", "confirmed", "shopping", "purchased", "stored",
+    "ready", "delivered", "completed", "cancelled", "refunded",
+    "item_update_pending", "item_update_found", "item_update_not_found",
+    "item_update_substituted", "item_update_delivered",
+]
+
+
 # Item Schemas
 
 class ConvenienceItemBase(BaseModel):
     """Base schema for convenience items."""
-    name: str = Field(..., min_length=1, max_length=200, description="Item name")
+    name: Name200 = Field(..., description="Item name")
     description: Optional[str] = Field(None, description="Item description")
     image_url: Optional[str] = Field(None, description="URL to item image")
     category: Optional[ConvenienceItemCategory] = Field(None, description="Item category")
-    base_price: Decimal = Field(..., ge=0, description="Base price at store")
-    markup_amount: Decimal = Field(default=Decimal("0"), ge=0, description="Fixed markup amount")
-    markup_percent: Decimal = Field(default=Decimal("0"), ge=0, le=100, description="Percentage markup")
-    source_store: str = Field(..., min_length=1, max_length=200, description="Source store name")
+    base_price: NonNegMoney = Field(..., description="Base price at store")
+    markup_amount: NonNegMoney = Field(default=ZERO_DECIMAL, description="Fixed markup amount")
+    markup_percent: PercentMoney = Field(default=ZERO_DECIMAL, description="Percentage markup")
+    source_store: Name200 = Field(..., description="Source store name")
     source_address: Optional[str] = Field(None, description="Store address")
     estimated_shopping_time_minutes: int = Field(default=15, ge=1, description="Estimated shopping time")
     requires_age_verification: bool = Field(default=False, description="Requires age verification")
-    max_quantity_per_order: int = Field(default=10, ge=1, le=100, description="Max quantity per order")
+    max_quantity_per_order: PosInt100 = Field(default=10, description="Max quantity per order")
     tags: Optional[List[str]] = Field(default=None, description="Item tags")
-    sku: Optional[str] = Field(None, max_length=100, description="SKU")
-    barcode: Optional[str] = Field(None, max_length=100, description="Barcode")
+    sku: Optional[Code100] = Field(None, description="SKU")
+    barcode: Optional[Code100] = Field(None, description="Barcode")
 
 
 class ConvenienceItemCreate(ConvenienceItemBase):
@@ -85,22 +125,22 @@ class ConvenienceItemCreate(ConvenienceItemBase):
 
 class ConvenienceItemUpdate(BaseModel):
     """Update an existing convenience item."""
-    name: Optional[str] = Field(None, min_length=1, max_length=200)
+    name: Optional[Name200] = None
     description: Optional[str] = None
     image_url: Optional[str] = None
     category: Optional[ConvenienceItemCategory] = None
-    base_price: Optional[Decimal] = Field(None, ge=0)
-    markup_amount: Optional[Decimal] = Field(None, ge=0)
-    markup_percent: Optional[Decimal] = Field(None, ge=0, le=100)
-    source_store: Optional[str] = Field(None, min_length=1, max_length=200)
+    base_price: Optional[NonNegMoney] = None
+    markup_amount: Optional[NonNegMoney] = None
+    markup_percent: Optional[PercentMoney] = None
+    source_store: Optional[Name200] = None
     source_address: Optional[str] = None
     estimated_shopping_time_minutes: Optional[int] = Field(None, ge=1)
     requires_age_verification: Optional[bool] = None
-    max_quantity_per_order: Optional[int] = Field(None, ge=1, le=100)
+    max_quantity_per_order: Optional[PosInt100] = None
     is_active: Optional[bool] = None
     tags: Optional[List[str]] = None
-    sku: Optional[str] = Field(None, max_length=100)
-    barcode: Optional[str] = Field(None, max_length=100)
+    sku: Optional[Code100] = None
+    barcode: Optional[Code100] = None
 
 
 class ConvenienceItemResponse(ConvenienceItemBase):
@@ -113,16 +153,16 @@ class ConvenienceItemResponse(ConvenienceItemBase):
     updated_at: datetime
     created_by_id: Optional[UUID]
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class ConvenienceItemList(BaseModel):
     """List of convenience items with pagination."""
     items: List[ConvenienceItemResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Omitted when paging by cursor")
     page: int
     page_size: int
+    next_cursor: Optional[str] = Field(None, description="Pass as cursor to fetch the next page")
 
 
 # Order Item Schemas
@@ -130,11 +170,16 @@ class ConvenienceItemList(BaseModel):
 class OrderItemCreate(BaseModel):
     """Create an order item."""
     item_id: UUID
-    quantity: int = Field(..., ge=1, le=100, description="Quantity to order")
+    quantity: PosInt100 = Field(..., description="Quantity to order")
+
 
+@dataclass(config=ConfigDict(from_attributes=True), slots=True, frozen=True)
+class OrderItemResponse:
+    """
+    Response schema for order item.
 
-class OrderItemResponse(BaseModel):
-    """Response schema for order item."""
+    A slotted dataclass rather than a model: one is built per order line.
+    """
     id: UUID
     order_id: UUID
     item_id: Optional[UUID]
@@ -145,20 +190,17 @@ class OrderItemResponse(BaseModel):
     quantity: int
     unit_price: Decimal
     line_total: Decimal
-    status: OrderItemStatus
+    status: OrderItemStatusStr
     substitution_notes: Optional[str]
     actual_price: Optional[Decimal]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class OrderItemUpdateStatus(BaseModel):
     """Update order item status (staff)."""
     status: OrderItemStatus
     substitution_notes: Optional[str] = Field(None, description="Notes about substitution")
-    actual_price: Optional[Decimal] = Field(None, ge=0, description="Actual price paid at store")
+    actual_price: Optional[NonNegMoney] = Field(None, description="Actual price paid at store")
 
 
 # Order Schemas
@@ -166,18 +208,10 @@ class OrderItemUpdateStatus(BaseModel):
 class ConvenienceOrderCreate(BaseModel):
     """Create a new convenience order."""
     venue_id: UUID
-    items: List[OrderItemCreate] = Field(..., min_items=1, description="Items to order")
+    items: List[OrderItemCreate] = Field(..., min_length=1, description="Items to order")
     parking_session_id: Optional[UUID] = Field(None, description="Associated parking session")
-    delivery_instructions: Optional[str] = Field(None, max_length=1000, description="Delivery instructions")
-    special_instructions: Optional[str] = Field(None, max_length=1000, description="Special instructions")
-
-    @field_validator("items")
-    @classmethod
-    def validate_items(cls, v):
-        """Ensure at least one item."""
-        if not v or len(v) == 0:
-            raise ValueError("At least one item is required")
-        return v
+    delivery_instructions: Optional[Text1000] = Field(None, description="Delivery instructions")
+    special_instructions: Optional[Text1000] = Field(None, description="Special instructions")
 
 
 # Order Event Schema (moved here for forward reference)
@@ -185,16 +219,15 @@ class OrderEventResponse(BaseModel):
     """Response schema for order event."""
     id: UUID
     order_id: UUID
-    status: str
+    status: EventStatusStr
     notes: Optional[str]
     photo_url: Optional[str]
     location: Optional[str]
     created_by_id: Optional[UUID]
     created_by_name: Optional[str]
-    created_at: datetime
+    created_at: Timestamp
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class ConvenienceOrderResponse(BaseModel):
@@ -205,13 +238,13 @@ class ConvenienceOrderResponse(BaseModel):
     venue_name: Optional[str] = None
     user_id: UUID
     parking_session_id: Optional[UUID]
-    status: ConvenienceOrderStatus
+    status: OrderStatusStr
     subtotal: Decimal
     service_fee: Decimal
     tax: Decimal
     tip_amount: Decimal
     total_amount: Decimal
-    payment_status: PaymentStatus
+    payment_status: PaymentStatusStr
     payment_method: Optional[str]
     assigned_staff_id: Optional[UUID]
     assigned_staff_name: Optional[str]
@@ -220,63 +253,65 @@ class ConvenienceOrderResponse(BaseModel):
     special_instructions: Optional[str]
     receipt_photo_url: Optional[str]
     delivery_photo_url: Optional[str]
-    estimated_ready_time: Optional[datetime]
-    confirmed_at: Optional[datetime]
-    shopping_started_at: Optional[datetime]
-    purchased_at: Optional[datetime]
-    stored_at: Optional[datetime]
-    ready_at: Optional[datetime]
-    delivered_at: Optional[datetime]
-    completed_at: Optional[datetime]
-    cancelled_at: Optional[datetime]
+    estimated_ready_time: Optional[Timestamp]
+    confirmed_at: Optional[Timestamp]
+    shopping_started_at: Optional[Timestamp]
+    purchased_at: Optional[Timestamp]
+    stored_at: Optional[Timestamp]
+    ready_at: Optional[Timestamp]
+    delivered_at: Optional[Timestamp]
+    completed_at: Optional[Timestamp]
+    cancelled_at: Optional[Timestamp]
     complimentary_time_added_minutes: int
     rating: Optional[int]
     feedback: Optional[str]
     cancellation_reason: Optional[str]
     refund_amount: Optional[Decimal]
     refund_reason: Optional[str]
-    created_at: datetime
-    updated_at: datetime
+    created_at: Timestamp
+    updated_at: Timestamp
     items: List[OrderItemResponse] = []
     events: List[OrderEventResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
+
 
+@dataclass(config=ConfigDict(from_attributes=True), slots=True, frozen=True)
+class ConvenienceOrderSummary:
+    """
+    Summary of convenience order for list views.
 
-class ConvenienceOrderSummary(BaseModel):
-    """Summary of convenience order for list views."""
+    A slotted dataclass rather than a model: one is built per list row.
+    """
     id: UUID
     order_number: str
     venue_name: Optional[str]
-    status: ConvenienceOrderStatus
+    status: OrderStatusStr
     total_amount: Decimal
     item_count: int
     estimated_ready_time: Optional[datetime]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class ConvenienceOrderList(BaseModel):
     """List of convenience orders with pagination."""
     orders: List[ConvenienceOrderSummary]
-    total: int
+    total: Optional[int] = Field(None, description="Omitted when paging by cursor")
     page: int
     page_size: int
+    next_cursor: Optional[str] = Field(None, description="Pass as cursor to fetch the next page")
 
 
 class OrderCancelRequest(BaseModel):
     """Request to cancel an order."""
-    cancellation_reason: str = Field(..., min_length=1, max_length=500, description="Reason for cancellation")
+    cancellation_reason: Reason500 = Field(..., description="Reason for cancellation")
 
 
 class OrderRatingCreate(BaseModel):
     """Submit rating for completed order."""
-    rating: int = Field(..., ge=1, le=5, description="Rating (1-5 stars)")
-    feedback: Optional[str] = Field(None, max_length=1000, description="Optional feedback")
-    tip_amount: Optional[Decimal] = Field(None, ge=0, description="Optional tip amount")
+    rating: Rating1to5 = Field(..., description="Rating (1-5 stars)")
+    feedback: Optional[Text1000] = Field(None, description="Optional feedback")
+    tip_amount: Optional[NonNegMoney] = Field(None, description="Optional tip amount")
 
 
 # Staff Fulfillment Schemas
@@ -288,31 +323,31 @@ class OrderAcceptRequest(BaseModel):
 
 class OrderStartShoppingRequest(BaseModel):
     """Start shopping for an order."""
-    notes: Optional[str] = Field(None, max_length=500, description="Shopping notes")
+    notes: Optional[Text500] = Field(None, description="Shopping notes")
 
 
 class OrderCompleteShoppingRequest(BaseModel):
     """Complete shopping for an order."""
     receipt_photo_url: Optional[str] = Field(None, description="URL to receipt photo")
-    notes: Optional[str] = Field(None, max_length=500, description="Shopping completion notes")
+    notes: Optional[Text500] = Field(None, description="Shopping completion notes")
 
 
 class OrderStoreRequest(BaseModel):
     """Store items at location."""
     storage_location: str = Field(..., min_length=1, max_length=100, description="Storage location")
-    notes: Optional[str] = Field(None, max_length=500, description="Storage notes")
+    notes: Optional[Text500] = Field(None, description="Storage notes")
 
 
 class OrderDeliverRequest(BaseModel):
     """Deliver order to customer."""
     delivery_photo_url: Optional[str] = Field(None, description="URL to delivery photo")
-    notes: Optional[str] = Field(None, max_length=500, description="Delivery notes")
+    notes: Optional[Text500] = Field(None, description="Delivery notes")
 
 
 class OrderRefundRequest(BaseModel):
     """Request a refund for an order."""
-    refund_amount: Decimal = Field(..., ge=0, description="Refund amount")
-    refund_reason: str = Field(..., min_length=1, max_length=500, description="Refund reason")
+    refund_amount: NonNegMoney = Field(..., description="Refund amount")
+    refund_reason: Reason500 = Field(..., description="Refund reason")
 
 
 # Configuration Schemas
@@ -320,14 +355,14 @@ class OrderRefundRequest(BaseModel):
 class ConvenienceStoreConfigBase(BaseModel):
     """Base schema for convenience store configuration."""
     is_enabled: bool = Field(default=True, description="Feature enabled")
-    default_service_fee_percent: Decimal = Field(default=Decimal("15.00"), ge=0, le=100, description="Default service fee %")
-    minimum_order_amount: Decimal = Field(default=Decimal("5.00"), ge=0, description="Minimum order amount")
-    maximum_order_amount: Decimal = Field(default=Decimal("200.00"), ge=0, description="Maximum order amount")
+    default_service_fee_percent: PercentMoney = Field(default=Decimal("15.00"), description="Default service fee %")
+    minimum_order_amount: NonNegMoney = Field(default=Decimal("5.00"), description="Minimum order amount")
+    maximum_order_amount: NonNegMoney = Field(default=Decimal("200.00"), description="Maximum order amount")
     default_complimentary_parking_minutes: int = Field(default=15, ge=0, description="Default complimentary parking minutes")
     average_fulfillment_time_minutes: int = Field(default=30, ge=1, description="Average fulfillment time")
     operating_hours: Optional[Dict[str, Any]] = Field(None, description="Operating hours by day")
-    welcome_message: Optional[str] = Field(None, max_length=500, description="Welcome message")
-    instructions_message: Optional[str] = Field(None, max_length=1000, description="Instructions message")
+    welcome_message: Optional[Text500] = Field(None, description="Welcome message")
+    instructions_message: Optional[Text1000] = Field(None, description="Instructions message")
     storage_locations: Optional[List[str]] = Field(None, description="Available storage locations")
 
 
@@ -339,26 +374,26 @@ class ConvenienceStoreConfigCreate(ConvenienceStoreConfigBase):
 class ConvenienceStoreConfigUpdate(BaseModel):
     """Update convenience store configuration."""
     is_enabled: Optional[bool] = None
-    default_service_fee_percent: Optional[Decimal] = Field(None, ge=0, le=100)
-    minimum_order_amount: Optional[Decimal] = Field(None, ge=0)
-    maximum_order_amount: Optional[Decimal] = Field(None, ge=0)
+    default_service_fee_percent: Optional[PercentMoney] = None
+    minimum_order_amount: Optional[NonNegMoney] = None
+    maximum_order_amount: Optional[NonNegMoney] = None
     default_complimentary_parking_minutes: Optional[int] = Field(None, ge=0)
     average_fulfillment_time_minutes: Optional[int] = Field(None, ge=1)
     operating_hours: Optional[Dict[str, Any]] = None
-    welcome_message: Optional[str] = Field(None, max_length=500)
-    instructions_message: Optional[str] = Field(None, max_length=1000)
+    welcome_message: Optional[Text500] = None
+    instructions_message: Optional[Text1000] = None
     storage_locations: Optional[List[str]] = None
 
 
 class ConvenienceStoreConfigResponse(ConvenienceStoreConfigBase):
     """Response schema for convenience store configuration."""
     id: UUID
+    operating_hours: SkipValidation[Optional[Dict[str, Any]]] = None  # Stored JSON, passed through
     venue_id: UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Bulk Import Schema
@@ -369,7 +404,7 @@ class ItemImportRow(BaseModel):
     description: Optional[str] = None
     category: Optional[str] = None
     base_price: Decimal
-    markup_percent: Decimal = Decimal("0")
+    markup_percent: Decimal = ZERO_DECIMAL
     source_store: str
     source_address: Optional[str] = None
     sku: Optional[str] = None
@@ -378,15 +413,7 @@ class ItemImportRow(BaseModel):
 
 class ItemBulkImportRequest(BaseModel):
     """Bulk import items."""
-    items: List[ItemImportRow] = Field(..., min_items=1, description="Items to import")
-
-    @field_validator("items")
-    @classmethod
-    def validate_items(cls, v):
-        """Ensure at least one item."""
-        if not v or len(v) == 0:
-            raise ValueError("At least one item is required")
-        return v
+    items: List[ItemImportRow] = Field(..., min_length=1, description="Items to import")
 
 
 class ItemBulkImportResponse(BaseModel):
@@ -406,9 +433,32 @@ class CategoriesResponse(BaseModel):
 
 # Pricing Calculation
 
-class PricingBreakdown(BaseModel):
-    """Pricing breakdown for order."""
+class PricingBreakdown(NamedTuple):
+    """
+    Pricing breakdown for order.
+
+    Always computed server-side from trusted values, so it is a plain
+    NamedTuple rather than a validated model.
+    """
     subtotal: Decimal
     service_fee: Decimal
     tax: Decimal
     total: Decimal
+
+
+# Resolve any pending forward references at import time so the first request
+# never pays for core schema construction. The row dataclasses above are
+# built when decorated.
+for _model in (
+    ConvenienceItemResponse,
+    OrderEventResponse,
+    ConvenienceOrderResponse,
+):
+    _model.model_rebuild()
+
+
+# Cached adapters for validating ORM row lists in one call and serializing
+# paginated lists without the wrapper models
+ITEM_LIST_ADAPTER = TypeAdapter(List[ConvenienceItemResponse])
+ORDER_ITEM_LIST_ADAPTER = TypeAdapter(List[OrderItemResponse])
+ORDER_SUMMARY_LIST_ADAPTER = TypeAdapter(List[ConvenienceOrderSummary])
@@ -1,10 +1,25 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, Dict, Any, List
+from math import sqrt as _sqrt
+from pydantic import BaseModel, Field, SkipValidation, StringConstraints, field_validator
+from typing import Annotated, Optional, Dict, Any, List, FrozenSet, Iterable, Literal
 from datetime import datetime, date
 from uuid import UUID
 from decimal import Decimal
 from enum import Enum
 
+from app.schemas.common import Name200, PosInt100, Text500, Timestamp, RESPONSE_CONFIG
+
+
+# Field types shared between create/update and request schemas
+BusinessType = Annotated[str, StringConstraints(max_length=50)]
+ContactEmail = Annotated[str, StringConstraints(max_length=255)]
+ContactPhone = Annotated[str, StringConstraints(max_length=20)]
+OpportunityTitle = Annotated[str, StringConstraints(min_length=1, max_length=100)]
+ClaimCode = Annotated[str, StringConstraints(min_length=1, max_length=20)]
+
+
+# Rough meters per degree of latitude, used for the flat-earth distance estimate
+METERS_PER_DEGREE = 111000
+
 
 # Enums
 
@@ -17,6 +32,10 @@ class OpportunityTypeEnum(str, Enum):
     BUNDLE = "bundle"
 
 
+# Literal mirror of OpportunityTypeEnum for response models (keep in sync)
+OpportunityTypeStr = Literal["experience", "convenience", "discovery", "service", "bundle"]
+
+
 class InteractionTypeEnum(str, Enum):
     """Types of user interactions."""
     IMPRESSED = "impressed"
@@ -27,6 +46,10 @@ class InteractionTypeEnum(str, Enum):
     EXPIRED = "expired"
 
 
+# Literal mirror of InteractionTypeEnum for response models (keep in sync)
+InteractionTypeStr = Literal["impressed", "viewed", "accepted", "dismissed", "completed", "expired"]
+
+
 class FrequencyPreferenceEnum(str, Enum):
     """Frequency preferences."""
     ALL = "all"
@@ -38,13 +61,13 @@ class FrequencyPreferenceEnum(str, Enum):
 
 class PartnerBase(BaseModel):
     """Base partner schema."""
-    business_name: str = Field(..., min_length=1, max_length=200)
-    business_type: Optional[str] = Field(None, max_length=50)
-    contact_email: str = Field(..., max_length=255)
-    contact_phone: Optional[str] = Field(None, max_length=20)
+    business_name: Name200
+    business_type: Optional[BusinessType] = None
+    contact_email: ContactEmail
+    contact_phone: Optional[ContactPhone] = None
     address: Optional[str] = None
-    location_lat: Optional[Decimal] = None
-    location_lng: Optional[Decimal] = None
+    location_lat: Optional[float] = None
+    location_lng: Optional[float] = None
 
 
 class PartnerCreate(PartnerBase):
@@ -52,18 +75,18 @@ class PartnerCreate(PartnerBase):
     webhook_url: Optional[str] = None
     billing_email: Optional[str] = None
     commission_rate: Decimal = Field(Decimal("0.15"), ge=0, le=1)
-    max_active_opportunities: int = Field(10, ge=1, le=100)
+    max_active_opportunities: PosInt100 = 10
 
 
 class PartnerUpdate(BaseModel):
     """Update partner information."""
-    business_name: Optional[str] = Field(None, min_length=1, max_length=200)
-    business_type: Optional[str] = Field(None, max_length=50)
-    contact_email: Optional[str] = Field(None, max_length=255)
-    contact_phone: Optional[str] = Field(None, max_length=20)
+    business_name: Optional[Name200] = None
+    business_type: Optional[BusinessType] = None
+    contact_email: Optional[ContactEmail] = None
+    contact_phone: Optional[ContactPhone] = None
     address: Optional[str] = None
-    location_lat: Optional[Decimal] = None
-    location_lng: Optional[Decimal] = None
+    location_lat: Optional[float] = None
+    location_lng: Optional[float] = None
     webhook_url: Optional[str] = None
     billing_email: Optional[str] = None
     is_active: Optional[bool] = None
@@ -80,15 +103,14 @@ class PartnerResponse(PartnerBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Opportunity Schemas
 
 class OpportunityBase(BaseModel):
     """Base opportunity schema."""
-    title: str = Field(..., min_length=1, max_length=100)
+    title: OpportunityTitle
     value_proposition: str = Field(..., min_length=1)
     opportunity_type: OpportunityTypeEnum
     trigger_rules: Dict[str, Any] = Field(default_factory=dict)
@@ -97,8 +119,8 @@ class OpportunityBase(BaseModel):
     availability_schedule: Optional[Dict[str, Any]] = None
     total_capacity: Optional[int] = Field(None, ge=1)
     value_details: Dict[str, Any]
-    location_lat: Optional[Decimal] = None
-    location_lng: Optional[Decimal] = None
+    location_lat: Optional[float] = None
+    location_lng: Optional[float] = None
     address: Optional[str] = None
     walking_distance_meters: Optional[int] = Field(None, ge=0)
 
@@ -108,7 +130,7 @@ class OpportunityCreate(OpportunityBase):
     partner_id: UUID
     max_impressions_per_user: int = Field(3, ge=1, le=10)
     cooldown_hours: int = Field(24, ge=1, le=168)
-    priority_score: int = Field(50, ge=1, le=100)
+    priority_score: PosInt100 = 50
 
     @field_validator('valid_until')
     @classmethod
@@ -121,24 +143,26 @@ class OpportunityCreate(OpportunityBase):
     @classmethod
     def validate_value_details(cls, v):
         """Ensure opportunity provides real value."""
-        has_discount = (
-            v.get('discount_percentage', 0) >= 10 or
-            v.get('discount_amount', 0) >= 5
+        # Return on the first qualifying value instead of evaluating them all
+        get = v.get
+        if get('discount_percentage', 0) >= 10:
+            return v
+        if get('discount_amount', 0) >= 5:
+            return v
+        if get('parking_extension_minutes', 0) >= 15:
+            return v
+        if get('perks'):
+            return v
+
+        raise ValueError(
+            'Opportunity must provide meaningful value: '
+            '10%+ discount, $5+ discount, 15+ min parking, or perks'
         )
-        has_parking = v.get('parking_extension_minutes', 0) >= 15
-        has_perks = len(v.get('perks', [])) > 0
-
-        if not (has_discount or has_parking or has_perks):
-            raise ValueError(
-                'Opportunity must provide meaningful value: '
-                '10%+ discount, $5+ discount, 15+ min parking, or perks'
-            )
-        return v
 
 
 class OpportunityUpdate(BaseModel):
     """Update an opportunity."""
-    title: Optional[str] = Field(None, min_length=1, max_length=100)
+    title: Optional[OpportunityTitle] = None
     value_proposition: Optional[str] = Field(None, min_length=1)
     opportunity_type: Optional[OpportunityTypeEnum] = None
     trigger_rules: Optional[Dict[str, Any]] = None
@@ -147,17 +171,22 @@ class OpportunityUpdate(BaseModel):
     availability_schedule: Optional[Dict[str, Any]] = None
     total_capacity: Optional[int] = Field(None, ge=1)
     value_details: Optional[Dict[str, Any]] = None
-    location_lat: Optional[Decimal] = None
-    location_lng: Optional[Decimal] = None
+    location_lat: Optional[float] = None
+    location_lng: Optional[float] = None
     address: Optional[str] = None
     walking_distance_meters: Optional[int] = Field(None, ge=0)
     is_active: Optional[bool] = None
-    priority_score: Optional[int] = Field(None, ge=1, le=100)
+    priority_score: Optional[PosInt100] = None
 
 
 class OpportunityResponse(OpportunityBase):
     """Opportunity response for users."""
     id: UUID
+    opportunity_type: OpportunityTypeStr
+    # JSON columns are trusted once stored; pass them through unvalidated
+    trigger_rules: SkipValidation[Dict[str, Any]] = Field(default_factory=dict)
+    availability_schedule: SkipValidation[Optional[Dict[str, Any]]] = None
+    value_details: SkipValidation[Dict[str, Any]]
     partner_id: UUID
     used_capacity: int
     priority_score: int
@@ -166,20 +195,20 @@ class OpportunityResponse(OpportunityBase):
     created_at: datetime
     calculated_distance: Optional[int] = None  # Calculated based on user location
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
+
+    @staticmethod
+    def _rough_distance(opportunity, user_lat: Optional[float], user_lng: Optional[float]) -> Optional[int]:
+        """Rough distance in meters from the user (Haversine would be more accurate)."""
+        if not (user_lat and user_lng and opportunity.location_lat and opportunity.location_lng):
+            return None
+        lat_diff = opportunity.location_lat - user_lat
+        lng_diff = opportunity.location_lng - user_lng
+        return int(_sqrt(lat_diff * lat_diff + lng_diff * lng_diff) * METERS_PER_DEGREE)
 
     @classmethod
     def from_orm_with_distance(cls, opportunity, user_lat: Optional[float] = None, user_lng: Optional[float] = None):
         """Create from ORM with calculated distance."""
-        distance = None
-        if user_lat and user_lng and opportunity.location_lat and opportunity.location_lng:
-            # Simple distance calculation (Haversine would be more accurate)
-            import math
-            lat_diff = float(opportunity.location_lat) - user_lat
-            lng_diff = float(opportunity.location_lng) - user_lng
-            distance = int(math.sqrt(lat_diff**2 + lng_diff**2) * 111000)  # Rough meters
-
         return cls(
             id=opportunity.id,
             partner_id=opportunity.partner_id,
@@ -201,9 +230,19 @@ class OpportunityResponse(OpportunityBase):
             is_active=opportunity.is_active,
             is_approved=opportunity.is_approved,
             created_at=opportunity.created_at,
-            calculated_distance=distance
+            calculated_distance=cls._rough_distance(opportunity, user_lat, user_lng)
         )
 
+    @classmethod
+    def from_orm_with_distance_batch(
+        cls,
+        opportunities: Iterable,
+        user_lat: Optional[float] = None,
+        user_lng: Optional[float] = None,
+    ) -> List["OpportunityResponse"]:
+        """Create responses for several opportunities sharing one user location."""
+        return [cls.from_orm_with_distance(opp, user_lat, user_lng) for opp in opportunities]
+
 
 # Interaction Schemas
 
@@ -215,12 +254,12 @@ class OpportunityAccept(BaseModel):
 class OpportunityDismiss(BaseModel):
     """Dismiss an opportunity."""
     reason: str = Field(..., max_length=50)
-    feedback: Optional[str] = Field(None, max_length=500)
+    feedback: Optional[Text500] = None
 
 
 class OpportunityComplete(BaseModel):
     """Complete/redeem an opportunity."""
-    claim_code: str = Field(..., min_length=1, max_length=20)
+    claim_code: ClaimCode
     partner_confirmation: Optional[str] = None
 
 
@@ -247,15 +286,14 @@ class OpportunityInteractionResponse(BaseModel):
     """Interaction history response."""
     id: UUID
     opportunity_id: UUID
-    interaction_type: InteractionTypeEnum
-    interaction_context: Optional[Dict[str, Any]] = None
-    value_claimed: Optional[Dict[str, Any]] = None
-    value_redeemed: Optional[Dict[str, Any]] = None
-    created_at: datetime
-    completed_at: Optional[datetime] = None
+    interaction_type: InteractionTypeStr
+    interaction_context: SkipValidation[Optional[Dict[str, Any]]] = None
+    value_claimed: SkipValidation[Optional[Dict[str, Any]]] = None
+    value_redeemed: SkipValidation[Optional[Dict[str, Any]]] = None
+    created_at: Timestamp
+    completed_at: Optional[Timestamp] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Preferences Schemas
@@ -283,12 +321,11 @@ class OpportunityPreferencesResponse(BaseModel):
     no_opportunity_days: List[str]
     preferred_categories: List[str]
     blocked_categories: List[str]
-    blocked_partner_ids: List[UUID]
+    blocked_partner_ids: FrozenSet[UUID]  # Membership-only; serialized as a JSON array
     max_walking_distance_meters: int
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # Analytics Schemas
@@ -304,14 +341,14 @@ class PartnerAnalyticsRequest(BaseModel):
     """Request analytics for a date range."""
     date_start: date
     date_end: date
-    granularity: str = Field("daily", pattern="^(hourly|daily)$")
+    granularity: Literal["hourly", "daily"] = "daily"
 
 
 # Partner API Validation
 
 class ValidateClaimCode(BaseModel):
     """Validate a user's claim code."""
-    claim_code: str = Field(..., min_length=1, max_length=20)
+    claim_code: ClaimCode
 
 
 class ClaimCodeValidationResponse(BaseModel):
@@ -319,6 +356,12 @@ class ClaimCodeValidationResponse(BaseModel):
     valid: bool
     opportunity_id: Optional[UUID] = None
     user_id: Optional[UUID] = None
-    value_details: Optional[Dict[str, Any]] = None
+    value_details: SkipValidation[Optional[Dict[str, Any]]] = None
     claimed_at: Optional[datetime] = None
     message: str
+
+
+# Resolve any pending forward references at import time so the first request
+# never pays for core schema construction.
+for _model in (OpportunityResponse, OpportunityInteractionResponse):
+    _model.model_rebuild()
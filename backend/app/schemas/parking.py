@@ -4,6 +4,9 @@ from datetime import datetime
 from uuid import UUID
 from decimal import Decimal
 
+from app.schemas.common import ORM_CONFIG, normalize_phone, normalize_plate, to_decimal
+from app.schemas.common import VehicleInfo  # noqa: F401  (kept importable from this module)
+
 
 # Parking Lot Schemas
 
@@ -26,14 +29,18 @@ class ParkingLotPublic(BaseModel):
     max_duration_hours: int = 24
     dynamic_multiplier: Decimal = Decimal("1.0")
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
     @classmethod
     def from_orm_with_pricing(cls, lot):
-        """Create from ORM model with pricing config."""
+        """
+        Create from ORM model with pricing config.
+
+        The lot row and its pricing_config are trusted, so the model is built
+        with model_construct instead of running field validation.
+        """
         pricing = lot.pricing_config or {}
-        return cls(
+        return cls.model_construct(
             id=lot.id,
             name=lot.name,
             description=lot.description,
@@ -42,12 +49,12 @@ class ParkingLotPublic(BaseModel):
             location_lat=lot.location_lat,
             location_lng=lot.location_lng,
             is_active=lot.is_active,
-            base_rate=Decimal(str(pricing.get("base_rate", 10.00))),
-            hourly_rate=Decimal(str(pricing.get("hourly_rate", 5.00))),
-            max_daily_rate=Decimal(str(pricing.get("max_daily", 50.00))),
+            base_rate=to_decimal(pricing.get("base_rate", 10.00)),
+            hourly_rate=to_decimal(pricing.get("hourly_rate", 5.00)),
+            max_daily_rate=to_decimal(pricing.get("max_daily", 50.00)),
             min_duration_minutes=pricing.get("min_duration_minutes", 15),
             max_duration_hours=pricing.get("max_duration_hours", 24),
-            dynamic_multiplier=Decimal(str(pricing.get("dynamic_multiplier", 1.0))),
+            dynamic_multiplier=to_decimal(pricing.get("dynamic_multiplier", 1.0)),
         )
 
 
@@ -96,21 +103,6 @@ class ParkingSpaceInfo(BaseModel):
 
 # Parking Session Schemas
 
-class VehicleInfo(BaseModel):
-    """Vehicle information for parking session."""
-    plate: str = Field(..., min_length=1, max_length=20, description="License plate number")
-    make: Optional[str] = Field(None, max_length=50, description="Vehicle make (e.g., Toyota)")
-    model: Optional[str] = Field(None, max_length=50, description="Vehicle model (e.g., Camry)")
-    color: Optional[str] = Field(None, max_length=30, description="Vehicle color")
-
-    @field_validator("plate")
-    @classmethod
-    def validate_plate(cls, v):
-        """Validate and normalize license plate."""
-        # Remove spaces and convert to uppercase
-        return v.strip().upper().replace(" ", "")
-
-
 class ParkingSessionCreate(BaseModel):
     """Create a new parking session (public - no auth)."""
     lot_id: UUID
@@ -133,19 +125,13 @@ class ParkingSessionCreate(BaseModel):
     @classmethod
     def validate_plate(cls, v):
         """Validate and normalize license plate."""
-        return v.strip().upper().replace(" ", "")
+        return normalize_plate(v)
 
     @field_validator("contact_phone")
     @classmethod
     def validate_phone(cls, v):
         """Basic phone validation."""
-        if v:
-            # Remove common formatting characters
-            phone = v.replace("-", "").replace("(", "").replace(")", "").replace(" ", "")
-            if not phone.startswith("+"):
-                phone = "+1" + phone  # Default to US
-            return phone
-        return v
+        return normalize_phone(v)
 
 
 class ParkingSessionResponse(BaseModel):
@@ -178,8 +164,7 @@ class ParkingSessionResponse(BaseModel):
 
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 
 class ParkingSessionExtend(BaseModel):
@@ -229,3 +214,12 @@ class ExpirationNotification(BaseModel):
     expires_at: datetime
     minutes_until_expiry: int
     extend_url: str
+
+
+# Build every ORM-backed schema at import time so the first request never pays
+# for core schema construction.
+for _model in (
+    ParkingLotPublic,
+    ParkingSessionResponse,
+):
+    _model.model_rebuild()
@@ -1,10 +1,14 @@
-from pydantic import BaseModel, Field, field_validator, EmailStr
-from typing import Optional, List, Dict, Any
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter, field_serializer, field_validator
+from pydantic.dataclasses import dataclass
+from typing import Annotated, Optional, List, Dict, FrozenSet, Literal
 from datetime import datetime
 from uuid import UUID
 from decimal import Decimal
 from enum import Enum
 
+from app.schemas.common import ORM_CONFIG, EmailAddress, OperatingHours, enum_lookup, normalize_phone, normalize_plate
+from app.schemas.common import VehicleInfo  # noqa: F401  (kept importable from this module)
+
 
 # Enums
 
@@ -46,6 +50,31 @@ class ValetPriorityLevel(str, Enum):
     URGENT = "urgent"
 
 
+# Enum field types with a fast value -> member lookup
+SessionStatusField = Annotated[ValetSessionStatus, enum_lookup(ValetSessionStatus)]
+StaffStatusField = Annotated[ValetStaffStatus, enum_lookup(ValetStaffStatus)]
+IncidentTypeField = Annotated[ValetIncidentType, enum_lookup(ValetIncidentType)]
+PriorityField = Annotated[ValetPriorityLevel, enum_lookup(ValetPriorityLevel)]
+
+
+IncidentSeverity = Literal["low", "medium", "high", "critical"]
+
+
+def _check_key_tag(v: str) -> str:
+    """Key tags are exactly three ASCII digits (e.g. "007")."""
+    if len(v) != 3 or not (v.isascii() and v.isdigit()):
+        raise ValueError("key tag must be a 3-digit number")
+    return v
+
+
+KeyTagNumber = Annotated[str, AfterValidator(_check_key_tag)]
+
+
+# Config for small row models built once per session/event in list responses:
+# immutable, and strict about unexpected keys.
+ROW_CONFIG = ConfigDict(from_attributes=True, extra="forbid", frozen=True, revalidate_instances="never")
+
+
 # Common Schemas
 
 class ParkingLocation(BaseModel):
@@ -55,60 +84,46 @@ class ParkingLocation(BaseModel):
     spot_number: Optional[str] = Field(None, max_length=20, description="Specific spot number")
     notes: Optional[str] = Field(None, max_length=500, description="Additional location notes")
 
-    class Config:
-        from_attributes = True
+    # Also the request body of ValetStatusUpdate.parking_location, so it
+    # keeps the lenient config rather than ROW_CONFIG
+    model_config = ORM_CONFIG
 
 
-class VehicleInfo(BaseModel):
-    """Vehicle information for valet service."""
-    plate: str = Field(..., min_length=1, max_length=20, description="License plate number")
-    make: Optional[str] = Field(None, max_length=50, description="Vehicle make (e.g., Toyota)")
-    model: Optional[str] = Field(None, max_length=50, description="Vehicle model (e.g., Camry)")
-    color: Optional[str] = Field(None, max_length=30, description="Vehicle color")
-    year: Optional[int] = Field(None, ge=1900, le=2100, description="Vehicle year")
-    notes: Optional[str] = Field(None, max_length=500, description="Special notes (e.g., scratches, modifications)")
+@dataclass(config=ConfigDict(from_attributes=True, extra="forbid"), slots=True, frozen=True)
+class StatusEvent:
+    """
+    Timeline event for status changes.
 
-    @field_validator("plate")
-    @classmethod
-    def validate_plate(cls, v):
-        """Validate and normalize license plate."""
-        return v.strip().upper().replace(" ", "")
-
-
-class StatusEvent(BaseModel):
-    """Timeline event for status changes."""
-    status: ValetSessionStatus
+    A slotted dataclass rather than a model: a session timeline can hold
+    dozens of these.
+    """
+    status: SessionStatusField
     timestamp: datetime
     notes: Optional[str] = None
     staff_id: Optional[UUID] = None
     staff_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 class PaymentInfo(BaseModel):
     """Payment information for valet session."""
-    amount: Decimal = Field(..., ge=0, description="Payment amount")
-    tip: Optional[Decimal] = Field(None, ge=0, description="Tip amount")
-    payment_method: Optional[str] = Field(None, max_length=50, description="Payment method")
-    transaction_id: Optional[str] = Field(None, max_length=100, description="Payment transaction ID")
+    amount: Decimal = Field(..., description="Payment amount")
+    tip: Optional[Decimal] = Field(None, description="Tip amount")
+    payment_method: Optional[str] = Field(None, description="Payment method")
+    transaction_id: Optional[str] = Field(None, description="Payment transaction ID")
     paid_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 
 class PricingInfo(BaseModel):
     """Pricing information for valet service."""
-    base_rate: Decimal = Field(..., ge=0, description="Base valet service rate")
-    hourly_rate: Optional[Decimal] = Field(None, ge=0, description="Hourly rate for extended parking")
-    estimated_total: Decimal = Field(..., ge=0, description="Estimated total cost")
-    actual_total: Optional[Decimal] = Field(None, ge=0, description="Actual total cost")
-    currency: str = Field(default="USD", max_length=3, description="Currency code")
+    base_rate: Decimal = Field(..., description="Base valet service rate")
+    hourly_rate: Optional[Decimal] = Field(None, description="Hourly rate for extended parking")
+    estimated_total: Decimal = Field(..., description="Estimated total cost")
+    actual_total: Optional[Decimal] = Field(None, description="Actual total cost")
+    currency: str = Field(default="USD", description="Currency code")
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 
 # User-facing Schemas
@@ -131,7 +146,7 @@ class ValetSessionCreate(BaseModel):
     estimated_duration_hours: Optional[float] = Field(None, gt=0, le=48, description="Estimated parking duration")
 
     # Contact info
-    contact_email: Optional[EmailStr] = None
+    contact_email: Optional[EmailAddress] = None
     contact_phone: Optional[str] = Field(None, max_length=20)
 
     # Special requests
@@ -141,18 +156,13 @@ class ValetSessionCreate(BaseModel):
     @classmethod
     def validate_plate(cls, v):
         """Validate and normalize license plate."""
-        return v.strip().upper().replace(" ", "")
+        return normalize_plate(v)
 
     @field_validator("contact_phone")
     @classmethod
     def validate_phone(cls, v):
         """Basic phone validation."""
-        if v:
-            phone = v.replace("-", "").replace("(", "").replace(")", "").replace(" ", "")
-            if not phone.startswith("+"):
-                phone = "+1" + phone  # Default to US
-            return phone
-        return v
+        return normalize_phone(v)
 
 
 class ValetSessionCheckin(BaseModel):
@@ -167,7 +177,7 @@ class ValetRetrievalRequest(BaseModel):
     session_id: Optional[UUID] = None
     access_code: Optional[str] = Field(None, description="Session access code (alternative to session_id)")
     estimated_pickup_time: Optional[datetime] = Field(None, description="When customer expects to pick up")
-    priority: ValetPriorityLevel = Field(default=ValetPriorityLevel.NORMAL, description="Request priority")
+    priority: PriorityField = Field(default=ValetPriorityLevel.NORMAL, description="Request priority")
 
 
 class ValetRating(BaseModel):
@@ -191,7 +201,7 @@ class SavedVehicleCreate(BaseModel):
     @classmethod
     def validate_plate(cls, v):
         """Validate and normalize license plate."""
-        return v.strip().upper().replace(" ", "")
+        return normalize_plate(v)
 
 
 class SavedVehicleResponse(BaseModel):
@@ -206,8 +216,7 @@ class SavedVehicleResponse(BaseModel):
     is_default: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 
 # Key Management Schemas (moved here for forward reference resolution)
@@ -220,8 +229,7 @@ class KeyStorageLocation(BaseModel):
     box_label: Optional[str] = None
     position: str
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 
 class KeyManagement(BaseModel):
@@ -236,8 +244,7 @@ class KeyManagement(BaseModel):
     grabbed_by: Optional[str] = None  # Staff member name
     grabbed_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 
 class ValetSessionResponse(BaseModel):
@@ -256,8 +263,8 @@ class ValetSessionResponse(BaseModel):
     vehicle_year: Optional[int]
 
     # Status
-    status: ValetSessionStatus
-    priority: ValetPriorityLevel
+    status: SessionStatusField
+    priority: PriorityField
 
     # Timing
     requested_at: datetime
@@ -286,18 +293,17 @@ class ValetSessionResponse(BaseModel):
     key_management: Optional[KeyManagement] = None
 
     # Timeline
-    timeline: List[StatusEvent] = []
+    timeline: List[StatusEvent] = Field(default_factory=list)
 
     # Rating
-    rating: Optional[int] = Field(None, ge=1, le=5)
+    rating: Optional[int] = None
     feedback: Optional[str] = None
 
     # Timestamps
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 
 class ValetAvailability(BaseModel):
@@ -309,7 +315,7 @@ class ValetAvailability(BaseModel):
     max_capacity: int
     estimated_wait_minutes: Optional[int] = None
     pricing: PricingInfo
-    operating_hours: Optional[Dict[str, Any]] = None
+    operating_hours: Optional[OperatingHours] = None
     special_notes: Optional[str] = None
 
 
@@ -319,14 +325,13 @@ class ValetHistoryItem(BaseModel):
     venue_name: str
     vehicle_plate: str
     vehicle_info: Optional[str] = None  # "2020 Toyota Camry"
-    status: ValetSessionStatus
+    status: SessionStatusField
     arrival_time: Optional[datetime]
     completed_at: Optional[datetime]
     total_cost: Optional[Decimal]
     rating: Optional[int]
 
-    class Config:
-        from_attributes = True
+    model_config = ROW_CONFIG
 
 
 class ValetHistory(BaseModel):
@@ -345,8 +350,8 @@ class ValetQueueItem(BaseModel):
     vehicle_plate: str
     vehicle_info: Optional[str] = None  # "2020 Toyota Camry - Red"
     customer_name: Optional[str] = None
-    status: ValetSessionStatus
-    priority: ValetPriorityLevel
+    status: SessionStatusField
+    priority: PriorityField
     arrival_time: Optional[datetime]
     wait_time_minutes: Optional[int] = None
     parking_location: Optional[ParkingLocation]
@@ -354,8 +359,7 @@ class ValetQueueItem(BaseModel):
     assigned_valet_name: Optional[str]
     special_requests: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ROW_CONFIG
 
 
 class ValetQueueResponse(BaseModel):
@@ -372,7 +376,7 @@ class ValetQueueResponse(BaseModel):
 class ValetStatusUpdate(BaseModel):
     """Update valet session status (staff action)."""
     session_id: UUID
-    new_status: ValetSessionStatus
+    new_status: SessionStatusField
     notes: Optional[str] = Field(None, max_length=1000, description="Status change notes")
     parking_location: Optional[ParkingLocation] = None
     estimated_ready_time: Optional[datetime] = None
@@ -381,8 +385,8 @@ class ValetStatusUpdate(BaseModel):
 class ValetIncidentCreate(BaseModel):
     """Report an incident during valet service."""
     session_id: UUID
-    incident_type: ValetIncidentType
-    severity: str = Field(..., pattern="^(low|medium|high|critical)$", description="Incident severity")
+    incident_type: IncidentTypeField
+    severity: IncidentSeverity = Field(..., description="Incident severity")
     description: str = Field(..., min_length=10, max_length=2000, description="Detailed incident description")
     reported_by: UUID = Field(..., description="Staff member reporting the incident")
     photos: Optional[List[str]] = Field(None, description="URLs to incident photos")
@@ -393,7 +397,7 @@ class ValetIncidentResponse(BaseModel):
     """Incident report response."""
     id: UUID
     session_id: UUID
-    incident_type: ValetIncidentType
+    incident_type: IncidentTypeField
     severity: str
     description: str
     reported_by: UUID
@@ -404,8 +408,7 @@ class ValetIncidentResponse(BaseModel):
     resolved: bool
     resolved_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 
 class ValetCapacityResponse(BaseModel):
@@ -462,18 +465,17 @@ class ValetSearchResult(BaseModel):
     vehicle_info: Optional[str]
     customer_name: Optional[str]
     customer_phone: Optional[str]
-    status: ValetSessionStatus
+    status: SessionStatusField
     parking_location: Optional[ParkingLocation]
     checked_in_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 
 class ValetStaffUpdate(BaseModel):
     """Update staff status."""
     staff_id: UUID
-    status: ValetStaffStatus
+    status: StaffStatusField
     notes: Optional[str] = Field(None, max_length=500)
 
 
@@ -481,13 +483,12 @@ class ValetStaffInfo(BaseModel):
     """Staff member information."""
     id: UUID
     name: str
-    status: ValetStaffStatus
+    status: StaffStatusField
     current_session_id: Optional[UUID] = None
     sessions_today: int
     avg_rating: Optional[float] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 
 # Assignment Schemas
@@ -496,7 +497,7 @@ class ValetAssignment(BaseModel):
     """Assign valet to session."""
     session_id: UUID
     valet_id: UUID
-    priority: ValetPriorityLevel = ValetPriorityLevel.NORMAL
+    priority: PriorityField = ValetPriorityLevel.NORMAL
 
 
 class ValetReassignment(BaseModel):
@@ -532,7 +533,7 @@ class ValetNotification(BaseModel):
 
 class KeyAssignmentInput(BaseModel):
     """Input for assigning keys to valet session."""
-    key_tag_number: str = Field(..., pattern=r"^\d{3}$", description="3-digit numeric key tag (001-999)")
+    key_tag_number: KeyTagNumber = Field(..., description="3-digit numeric key tag (001-999)")
     zone: str = Field(..., min_length=1, max_length=50)
     box: str = Field(..., min_length=1, max_length=50)
     position: str = Field(..., min_length=1, max_length=20)
@@ -560,14 +561,43 @@ class KeyStorageConfigResponse(BaseModel):
     """Key storage configuration response."""
     venue_id: UUID
     zones: List[KeyStorageZone]
-    occupied_positions: Dict[str, List[str]] = {}  # zone_id -> [occupied positions]
+    occupied_positions: Dict[str, FrozenSet[str]] = {}  # zone_id -> {occupied positions}
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
+
+    @field_serializer("occupied_positions")
+    def serialize_occupied_positions(self, value: Dict[str, FrozenSet[str]]) -> Dict[str, List[str]]:
+        """Emit positions as sorted lists so responses are stable."""
+        return {zone_id: sorted(positions) for zone_id, positions in value.items()}
 
 
 class KeyStorageConfigUpdate(BaseModel):
     """Input for updating key storage configuration."""
     zones: List[KeyStorageZone]
+
+
+# Build every ORM-backed schema at import time so the first request never pays
+# for core schema construction.
+for _model in (
+    ParkingLocation,
+    PaymentInfo,
+    PricingInfo,
+    SavedVehicleResponse,
+    KeyStorageLocation,
+    KeyManagement,
+    ValetSessionResponse,
+    ValetHistoryItem,
+    ValetQueueItem,
+    ValetIncidentResponse,
+    ValetSearchResult,
+    ValetStaffInfo,
+    KeyStorageConfigResponse,
+):
+    _model.model_rebuild()
+
+
+# Cached adapters for serializing list responses without wrapper models
+VALET_HISTORY_ITEM_LIST_ADAPTER = TypeAdapter(List[ValetHistoryItem])
+VALET_SEARCH_RESULT_LIST_ADAPTER = TypeAdapter(List[ValetSearchResult])
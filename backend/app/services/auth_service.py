@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 import secrets
@@ -10,35 +12,73 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     verify_password,
+    verify_and_update_password,
     get_password_hash,
+    hash_reset_token,
     verify_token,
 )
 from app.core.redis_client import redis_client
 
 
+# Compares the stored refresh token inside Redis, so validating a refresh
+# is one round trip and the stored token is never sent back to us. On a
+# match it also returns the cached active flag ("1", "0", or "" on a miss);
+# on a mismatch it returns nil.
+_CHECK_REFRESH_TOKEN = redis_client.register_script(
+    """
+    if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+        return false
+    end
+    return redis.call('GET', KEYS[2]) or ''
+    """
+)
+
+# How long a user's active flag is trusted before refresh re-reads Postgres
+USER_ACTIVE_TTL = 60
+
+REFRESH_TOKEN_TTL = 7 * 24 * 60 * 60  # 7 days
+LAST_LOGIN_TTL = 24 * 60 * 60  # 1 day
+
+
+def _user_active_key(user_id) -> str:
+    return f"user:{user_id}:active"
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """
+    Reference hash verified against when a login email is unknown.
+
+    Built on first use rather than at import so it picks up Argon2
+    parameters calibrated at startup, and costs the same to verify as a
+    real user's hash.
+    """
+    return get_password_hash(secrets.token_urlsafe(16))
+
+
 class AuthService:
     """Service for authentication operations."""
 
     @staticmethod
     def register_user(db: Session, user_data: UserCreate) -> User:
         """Register a new user."""
-        # Check if user already exists
-        existing_user = db.query(User).filter(User.email == user_data.email).first()
-        if existing_user:
+        # Check email and (if provided) phone in one query; both are unique
+        # indexes, so this is two index probes in a single round trip
+        conflict = User.email == user_data.email
+        if user_data.phone:
+            conflict = or_(conflict, User.phone == user_data.phone)
+
+        existing = db.query(User.email, User.phone).filter(conflict).first()
+        if existing:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered",
+                detail=(
+                    "Email already registered"
+                    if existing.email == user_data.email
+                    else "Phone number already registered"
+                ),
             )
 
-        # Check phone if provided
-        if user_data.phone:
-            existing_phone = db.query(User).filter(User.phone == user_data.phone).first()
-            if existing_phone:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Phone number already registered",
-                )
-
         # Create new user
         hashed_password = get_password_hash(user_data.password)
         new_user = User(
@@ -61,9 +101,13 @@ class AuthService:
         user = db.query(User).filter(User.email == email).first()
 
         if not user:
+            # Spend the same time as a wrong password so response timing
+            # doesn't reveal which emails have accounts
+            verify_password(password, _dummy_password_hash())
             return None
 
-        if not verify_password(password, user.hashed_password):
+        is_valid, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not is_valid:
             return None
 
         if not user.is_active:
@@ -72,9 +116,18 @@ class AuthService:
                 detail="User account is inactive",
             )
 
-        # Update last login
-        user.last_login = datetime.utcnow()
-        db.commit()
+        # Migrate legacy bcrypt hashes (or outdated Argon2 parameters)
+        if new_hash:
+            user.hashed_password = new_hash
+            db.commit()
+
+        # last_login is buffered in Redis and written back in bulk by
+        # BackgroundTasks, so login doesn't wait on a commit. It is set here
+        # rather than in create_tokens so registering doesn't count as a login.
+        pipe = redis_client.pipeline()
+        pipe.set(f"last_login:{user.id}", datetime.utcnow().isoformat(), ex=LAST_LOGIN_TTL)
+        pipe.set(_user_active_key(user.id), "1", ex=USER_ACTIVE_TTL)
+        pipe.execute()
 
         return user
 
@@ -84,12 +137,12 @@ class AuthService:
         access_token = create_access_token(data={"sub": str(user_id)})
         refresh_token = create_refresh_token(data={"sub": str(user_id)})
 
-        # Store refresh token in Redis with expiration
-        redis_client.set(
-            f"refresh_token:{user_id}",
-            refresh_token,
-            expire=7 * 24 * 60 * 60,  # 7 days
-        )
+        # Store refresh token and session count in one round trip
+        pipe = redis_client.pipeline()
+        pipe.set(f"refresh_token:{user_id}", refresh_token, ex=REFRESH_TOKEN_TTL)
+        pipe.incr(f"session_count:{user_id}")
+        pipe.expire(f"session_count:{user_id}", REFRESH_TOKEN_TTL)
+        pipe.execute()
 
         return {
             "access_token": access_token,
@@ -110,17 +163,24 @@ class AuthService:
                 detail="Invalid token",
             )
 
-        # Verify token exists in Redis
-        stored_token = redis_client.get(f"refresh_token:{user_id}")
-        if not stored_token or stored_token != refresh_token:
+        # Verify token matches the one stored in Redis
+        active_key = _user_active_key(user_id)
+        active = _CHECK_REFRESH_TOKEN(
+            keys=[f"refresh_token:{user_id}", active_key], args=[refresh_token]
+        )
+        if active is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid or expired refresh token",
             )
 
-        # Verify user still exists and is active
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user or not user.is_active:
+        # Verify user still exists and is active, using the cached flag if set
+        if not active:
+            row = db.query(User.is_active).filter(User.id == user_id).first()
+            active = "1" if row and row.is_active else "0"
+            redis_client.set(active_key, active, expire=USER_ACTIVE_TTL)
+
+        if active != "1":
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found or inactive",
@@ -137,7 +197,10 @@ class AuthService:
     @staticmethod
     def logout(user_id: str):
         """Logout user by removing refresh token."""
-        redis_client.delete(f"refresh_token:{user_id}")
+        pipe = redis_client.pipeline()
+        pipe.delete(f"refresh_token:{user_id}", _user_active_key(user_id))
+        pipe.decr(f"session_count:{user_id}")
+        pipe.execute()
 
     @staticmethod
     def request_password_reset(db: Session, email: str) -> str:
@@ -150,7 +213,7 @@ class AuthService:
 
         # Generate reset token
         reset_token = secrets.token_urlsafe(32)
-        user.reset_token = reset_token
+        user.reset_token = hash_reset_token(reset_token)
         user.reset_token_expires = datetime.utcnow() + timedelta(hours=1)
 
         db.commit()
@@ -163,7 +226,14 @@ class AuthService:
     @staticmethod
     def reset_password(db: Session, token: str, new_password: str) -> str:
         """Reset user password using reset token."""
-        user = db.query(User).filter(User.reset_token == token).first()
+        user = (
+            db.query(User)
+            .filter(
+                User.reset_token == hash_reset_token(token),
+                User.reset_token_expires > datetime.utcnow(),
+            )
+            .first()
+        )
 
         if not user:
             raise HTTPException(
@@ -171,12 +241,6 @@ class AuthService:
                 detail="Invalid or expired reset token",
             )
 
-        if user.reset_token_expires < datetime.utcnow():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Reset token has expired",
-            )
-
         # Update password
         user.hashed_password = get_password_hash(new_password)
         user.reset_token = None
@@ -184,6 +248,8 @@ class AuthService:
 
         db.commit()
 
+        redis_client.delete(_user_active_key(user.id))
+
         return "Password reset successful"
 
     @staticmethod
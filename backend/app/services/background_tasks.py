@@ -1,16 +1,32 @@
 import asyncio
 import logging
-from datetime import datetime
-from typing import Optional
-from sqlalchemy.orm import Session
-
-from app.core.database import SessionLocal
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+from sqlalchemy import DateTime, case, column, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.core.redis_client import redis_client
 from app.models.parking import ParkingSession, ParkingLot, ParkingSpace
-from app.services.parking_service import ParkingService
+from app.models.user import User
+from app.services.parking_service import ParkingService, PARKING_EXPIRY_SCHEDULE_KEY
 from app.services.notification_service import NotificationService
 
 logger = logging.getLogger(__name__)
 
+# Sessions expired per transaction by the cleanup task
+EXPIRED_SESSION_BATCH_SIZE = 500
+
+# Sessions are notified this long before they expire
+EXPIRY_NOTICE_MINUTES = 30
+
+# Most expiration notifications sent at the same time
+NOTIFICATION_CONCURRENCY = 20
+
 
 class BackgroundTasks:
     """Background tasks for parking system."""
@@ -70,17 +86,26 @@ class BackgroundTasks:
             except Exception as e:
                 logger.error(f"Error processing expiring sessions: {e}", exc_info=True)
 
-            # Wait before next check
-            await asyncio.sleep(check_interval_minutes * 60)
+            # Wait until the next session enters its notice window
+            await asyncio.sleep(
+                cls._seconds_until_next_expiry(
+                    EXPIRY_NOTICE_MINUTES * 60, check_interval_minutes * 60
+                )
+            )
 
     @classmethod
     async def _process_expiring_sessions(cls):
         """Check for expiring sessions and send notifications."""
-        db = SessionLocal()
-        try:
+        async with AsyncSessionLocal() as db:
+            # One timestamp for the whole tick: the query window and the
+            # notification time recorded on every session
+            now = datetime.utcnow()
+
             # Get sessions expiring in the next 30 minutes
-            expiring_sessions = ParkingService.get_expiring_sessions(
-                db, minutes_threshold=30
+            expiring_sessions = await db.run_sync(
+                ParkingService.get_expiring_sessions,
+                minutes_threshold=EXPIRY_NOTICE_MINUTES,
+                now=now,
             )
 
             if not expiring_sessions:
@@ -89,111 +114,158 @@ class BackgroundTasks:
 
             logger.info(f"Found {len(expiring_sessions)} expiring sessions")
 
-            for session in expiring_sessions:
-                try:
-                    await cls._notify_expiring_session(db, session)
-                except Exception as e:
-                    logger.error(
-                        f"Error notifying session {session.id}: {e}", exc_info=True
-                    )
+            # One batched send for the whole tick: emails share provider
+            # requests, SMS sends run concurrently up to the cap
+            results = await NotificationService.send_expiration_notifications_batch(
+                [cls._notification_target(s) for s in expiring_sessions],
+                sms_concurrency=NOTIFICATION_CONCURRENCY,
+            )
+            notified_ids = [
+                session.id
+                for session, result in zip(expiring_sessions, results)
+                if result["email"] or result["sms"]
+            ]
+            if not notified_ids:
+                return
+
+            # Mark every notified session in one statement and one commit
+            await db.execute(
+                update(ParkingSession)
+                .where(ParkingSession.id.in_(notified_ids))
+                .values(status="expiring_soon", last_notification_sent=now)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            logger.info(f"Marked {len(notified_ids)} sessions as 'expiring_soon'")
 
-        finally:
-            db.close()
+    @staticmethod
+    def _notification_target(session: ParkingSession) -> Tuple[ParkingSession, str, Optional[str]]:
+        """Pair a session with the lot name and space number its notice shows."""
+        # Lot and space are eager-loaded by get_expiring_sessions
+        lot = session.parking_lot
+        space = session.space
+
+        lot_name = lot.name if lot else "Unknown Lot"
+        space_number = space.space_number if space else None
+        return session, lot_name, space_number
 
     @classmethod
-    async def _notify_expiring_session(cls, db: Session, session: ParkingSession):
+    def _seconds_until_next_expiry(cls, lead_seconds: float, max_seconds: float) -> float:
         """
-        Send notification for an expiring session.
+        Work out how long a loop can sleep before its next scheduled event.
+
+        Looks up the next session in the Redis expiry schedule whose expiry,
+        less lead_seconds, is still in the future. max_seconds caps the sleep
+        so sessions missing from the schedule (or a Redis outage) are still
+        picked up on the old polling interval.
 
         Args:
-            db: Database session
-            session: Parking session that is expiring
-        """
-        # Get lot and space information
-        lot = db.query(ParkingLot).filter(ParkingLot.id == session.lot_id).first()
-        space = None
-        if session.space_id:
-            space = (
-                db.query(ParkingSpace)
-                .filter(ParkingSpace.id == session.space_id)
-                .first()
-            )
+            lead_seconds: How long before expiry the loop needs to wake
+            max_seconds: Longest allowed sleep
 
-        lot_name = lot.name if lot else "Unknown Lot"
-        space_number = space.space_number if space else None
+        Returns:
+            Seconds to sleep, at least one
+        """
+        now = time.time()
+        try:
+            next_expiry = redis_client.next_score_after(
+                PARKING_EXPIRY_SCHEDULE_KEY, now + lead_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Could not read expiry schedule: {e}")
+            return max_seconds
 
-        # Send notifications
-        results = await NotificationService.send_expiration_notification(
-            session, lot_name, space_number
-        )
+        if next_expiry is None:
+            return max_seconds
 
-        # Update session status to expiring_soon
-        if results["email"] or results["sms"]:
-            session.status = "expiring_soon"
-            session.last_notification_sent = datetime.utcnow()
-            db.commit()
-            logger.info(f"Updated session {session.id} status to 'expiring_soon'")
+        return min(max(next_expiry - lead_seconds - now, 1), max_seconds)
 
     @classmethod
     async def _process_expired_sessions(cls):
         """Check for expired sessions and mark them as expired."""
-        db = SessionLocal()
-        try:
-            # Get active sessions that have expired
+        async with AsyncSessionLocal() as db:
             now = datetime.utcnow()
-            expired_sessions = (
-                db.query(ParkingSession)
-                .filter(
-                    ParkingSession.status.in_(["active", "expiring_soon"]),
-                    ParkingSession.expires_at <= now,
-                )
-                .all()
-            )
-
-            if not expired_sessions:
+            total = 0
+            while True:
+                expired_count = await cls._expire_session_batch(db, now)
+                await db.commit()
+                total += expired_count
+                if expired_count < EXPIRED_SESSION_BATCH_SIZE:
+                    break
+
+            # Entries at or before the cutoff have been handled
+            cutoff = now.replace(tzinfo=timezone.utc).timestamp()
+            redis_client.zremrangebyscore(PARKING_EXPIRY_SCHEDULE_KEY, "-inf", cutoff)
+
+            if not total:
                 logger.debug("No expired sessions found")
                 return
 
-            logger.info(f"Found {len(expired_sessions)} expired sessions")
-
-            for session in expired_sessions:
-                try:
-                    # Mark session as expired
-                    session.status = "expired"
-                    session.end_time = now
-
-                    # Free up the parking space
-                    if session.space_id:
-                        space = (
-                            db.query(ParkingSpace)
-                            .filter(ParkingSpace.id == session.space_id)
-                            .first()
-                        )
-                        if space:
-                            space.is_occupied = False
-
-                    # Increment available spaces in lot
-                    lot = (
-                        db.query(ParkingLot)
-                        .filter(ParkingLot.id == session.lot_id)
-                        .first()
-                    )
-                    if lot:
-                        lot.available_spaces += 1
-
-                    logger.info(
-                        f"Marked session {session.id} as expired and freed space"
-                    )
-
-                except Exception as e:
-                    logger.error(
-                        f"Error expiring session {session.id}: {e}", exc_info=True
-                    )
-
-            db.commit()
-
-        finally:
-            db.close()
+            logger.info(f"Marked {total} expired sessions")
+
+    @classmethod
+    async def _expire_session_batch(cls, db: AsyncSession, now: datetime) -> int:
+        """
+        Expire one batch of sessions and free their spaces.
+
+        The batch is claimed with FOR UPDATE SKIP LOCKED, so several app
+        replicas can run this concurrently: each one skips rows another
+        replica is already expiring instead of freeing the same space twice.
+
+        Args:
+            db: Database session
+            now: Expiration cutoff (also recorded as end_time)
+
+        Returns:
+            Number of sessions expired
+        """
+        batch = (
+            select(ParkingSession.id)
+            .where(
+                ParkingSession.status.in_(["active", "expiring_soon"]),
+                ParkingSession.expires_at <= now,
+            )
+            .limit(EXPIRED_SESSION_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+        )
+
+        # Mark the batch expired in one statement; RETURNING hands back the
+        # spaces and lots to free without loading any session objects
+        result = await db.execute(
+            update(ParkingSession)
+            .where(ParkingSession.id.in_(batch.scalar_subquery()))
+            .values(status="expired", end_time=now)
+            .returning(ParkingSession.lot_id, ParkingSession.space_id)
+            .execution_options(synchronize_session=False)
+        )
+        expired = result.all()
+
+        if not expired:
+            return 0
+
+        # Free up the parking spaces
+        space_ids = [row.space_id for row in expired if row.space_id]
+        if space_ids:
+            await db.execute(
+                update(ParkingSpace)
+                .where(ParkingSpace.id.in_(space_ids))
+                .values(is_occupied=False)
+                .execution_options(synchronize_session=False)
+            )
+
+        # Give each lot back one space per expired session
+        freed_per_lot = Counter(row.lot_id for row in expired)
+        await db.execute(
+            update(ParkingLot)
+            .where(ParkingLot.id.in_(freed_per_lot))
+            .values(
+                available_spaces=ParkingLot.available_spaces
+                + case(freed_per_lot, value=ParkingLot.id, else_=0)
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        return len(expired)
 
     @classmethod
     def start_expired_session_cleanup(cls, check_interval_minutes: int = 10):
@@ -222,5 +294,74 @@ class BackgroundTasks:
             except Exception as e:
                 logger.error(f"Error processing expired sessions: {e}", exc_info=True)
 
-            # Wait before next check
-            await asyncio.sleep(check_interval_minutes * 60)
+            # Wait until the next session expires
+            await asyncio.sleep(
+                cls._seconds_until_next_expiry(0, check_interval_minutes * 60)
+            )
+
+    @classmethod
+    def start_last_login_flusher(cls, flush_interval_seconds: int = 60):
+        """
+        Start background task that writes buffered last-login times to Postgres.
+
+        Args:
+            flush_interval_seconds: How often to flush (default: 60 seconds)
+        """
+        asyncio.create_task(cls._flush_last_logins_loop(flush_interval_seconds))
+        logger.info(
+            f"Started last-login flusher (interval: {flush_interval_seconds} seconds)"
+        )
+
+    @classmethod
+    async def _flush_last_logins_loop(cls, flush_interval_seconds: int):
+        """
+        Background loop that periodically flushes buffered last-login times.
+
+        Args:
+            flush_interval_seconds: How often to flush
+        """
+        while cls._is_running:
+            try:
+                await cls._flush_last_logins()
+            except Exception as e:
+                logger.error(f"Error flushing last-login times: {e}", exc_info=True)
+
+            await asyncio.sleep(flush_interval_seconds)
+
+    @classmethod
+    async def _flush_last_logins(cls):
+        """Move last_login:{user_id} keys from Redis into users.last_login."""
+        keys = list(redis_client.scan_iter(match="last_login:*"))
+        if not keys:
+            return
+
+        # GETDEL reads and removes each key atomically, so a login that lands
+        # mid-flush leaves its own key behind for the next pass
+        pipe = redis_client.pipeline()
+        for key in keys:
+            pipe.getdel(key)
+        timestamps = pipe.execute()
+
+        rows = [
+            (uuid.UUID(key.split(":", 1)[1]), datetime.fromisoformat(ts))
+            for key, ts in zip(keys, timestamps)
+            if ts
+        ]
+        if not rows:
+            return
+
+        logins = values(
+            column("id", UUID(as_uuid=True)),
+            column("last_login", DateTime),
+            name="logins",
+        ).data(rows)
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(User)
+                .where(User.id == logins.c.id)
+                .values(last_login=logins.c.last_login)
+            )
+            await db.commit()
+
+        logger.debug(f"Flushed {len(rows)} last-login times")
@@ -6,16 +6,20 @@ including item management, order processing, pricing calculations, and fulfillme
 """
 
 import logging
-import secrets
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, FrozenSet, NamedTuple, Tuple
 from uuid import UUID, uuid4
 
-from sqlalchemy import and_, or_, desc, func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, delete, or_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload, selectinload
 from fastapi import HTTPException, status
 
+from app.core.pagination import paginate
 from app.models.convenience import (
     ConvenienceItem,
     ConvenienceOrder,
@@ -23,29 +27,182 @@ from app.models.convenience import (
     ConvenienceOrderEvent,
     ConvenienceStoreConfig,
     ConvenienceOrderStatus,
-    PaymentStatus,
     OrderItemStatus,
     ConvenienceItemCategory,
+    order_number_seq,
 )
 from app.models.venue import Venue
 from app.models.user import User
 from app.models.valet import ValetSession
+from app.schemas.common import from_orm_trusted
 from app.schemas.convenience import (
     ConvenienceItemCreate,
     ConvenienceItemUpdate,
     ConvenienceItemResponse,
     ConvenienceOrderCreate,
     ConvenienceOrderResponse,
-    OrderItemResponse,
+    ConvenienceOrderSummary,
     OrderEventResponse,
     ConvenienceStoreConfigCreate,
     ConvenienceStoreConfigUpdate,
     ConvenienceStoreConfigResponse,
     PricingBreakdown,
+    ORDER_ITEM_LIST_ADAPTER,
 )
 
 logger = logging.getLogger(__name__)
 
+# Sort keys for paginated lists; each ends in the primary key so cursors are
+# unambiguous
+ITEM_SORT = (ConvenienceItem.name, ConvenienceItem.id)
+ORDER_SORT = (ConvenienceOrder.created_at, ConvenienceOrder.id)
+
+# Everything _build_order_response reads, loaded up front: venue and staff
+# ride along on the order row, items and events (with their authors) come
+# from one extra SELECT each, however many orders are on the page. Only the
+# venue and user columns the response shows are fetched.
+ORDER_DETAIL_LOADS = (
+    joinedload(ConvenienceOrder.venue).load_only(Venue.name),
+    joinedload(ConvenienceOrder.assigned_staff).load_only(User.first_name, User.last_name),
+    selectinload(ConvenienceOrder.items),
+    selectinload(ConvenienceOrder.events)
+    .joinedload(ConvenienceOrderEvent.created_by)
+    .load_only(User.first_name, User.last_name),
+)
+
+# Order list pages only show summaries: the venue name and a line count.
+# Events, their authors and staff are never loaded for them.
+ORDER_SUMMARY_LOADS = (
+    joinedload(ConvenienceOrder.venue).load_only(Venue.name),
+    selectinload(ConvenienceOrder.items).load_only(ConvenienceOrderItem.id),
+)
+
+# Statuses a customer may still cancel from, and those they may rate
+CANCELLABLE_STATUSES = frozenset({
+    ConvenienceOrderStatus.PENDING.value,
+    ConvenienceOrderStatus.CONFIRMED.value,
+    ConvenienceOrderStatus.SHOPPING.value,
+})
+RATEABLE_STATUSES = frozenset({
+    ConvenienceOrderStatus.COMPLETED.value,
+    ConvenienceOrderStatus.DELIVERED.value,
+})
+
+# Serialized store configs keyed by (config id, updated_at). Any update bumps
+# updated_at, so stale entries are never served; they just age out.
+_CONFIG_JSON_CACHE_SIZE = 1024
+_config_json_cache: "OrderedDict[Tuple[UUID, datetime], bytes]" = OrderedDict()
+_config_json_lock = threading.Lock()
+
+
+def _config_json(config: ConvenienceStoreConfig) -> bytes:
+    """Return the JSON encoding of a config row, reusing cached bytes."""
+    key = (config.id, config.updated_at)
+    with _config_json_lock:
+        cached = _config_json_cache.get(key)
+        if cached is not None:
+            _config_json_cache.move_to_end(key)
+            return cached
+
+    payload = from_orm_trusted(ConvenienceStoreConfigResponse, config).model_dump_json().encode()
+
+    with _config_json_lock:
+        _config_json_cache[key] = payload
+        if len(_config_json_cache) > _CONFIG_JSON_CACHE_SIZE:
+            _config_json_cache.popitem(last=False)
+    return payload
+
+
+def _to_cents(amount: Decimal) -> int:
+    """Convert a two-place money amount (or percentage) to integer hundredths."""
+    return int(amount * 100)
+
+
+def _from_cents(cents: int) -> Decimal:
+    """Convert integer cents back to a two-place Decimal."""
+    return Decimal(cents).scaleb(-2)
+
+
+class OrderSettings(NamedTuple):
+    """The part of ConvenienceStoreConfig that order placement reads."""
+    is_enabled: bool
+    default_service_fee_percent: Decimal
+    minimum_order_amount: Decimal
+    maximum_order_amount: Decimal
+    average_fulfillment_time_minutes: int
+    default_complimentary_parking_minutes: int
+    # Derived once per cache fill so pricing is pure integer arithmetic
+    service_fee_basis_points: int
+
+
+# The OrderSettings fields read straight from the config row
+_ORDER_SETTINGS_COLUMNS = OrderSettings._fields[:-1]
+
+
+# Order settings keyed by venue. Each worker caches for up to a minute;
+# update_config drops the local entry, other workers catch up on expiry.
+_ORDER_SETTINGS_TTL_SECONDS = 60
+_ORDER_SETTINGS_CACHE_SIZE = 1024
+_order_settings_cache: "OrderedDict[UUID, Tuple[float, OrderSettings]]" = OrderedDict()
+_order_settings_lock = threading.Lock()
+
+
+def _get_order_settings(db: Session, venue_id: UUID) -> Optional[OrderSettings]:
+    """Return a venue's order settings, or None if the store isn't configured."""
+    now = time.monotonic()
+    with _order_settings_lock:
+        cached = _order_settings_cache.get(venue_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+    row = db.query(
+        *(getattr(ConvenienceStoreConfig, field) for field in _ORDER_SETTINGS_COLUMNS)
+    ).filter(ConvenienceStoreConfig.venue_id == venue_id).first()
+    if row is None:
+        return None
+
+    settings = OrderSettings(*row, _to_cents(row.default_service_fee_percent))
+    with _order_settings_lock:
+        _order_settings_cache[venue_id] = (now + _ORDER_SETTINGS_TTL_SECONDS, settings)
+        _order_settings_cache.move_to_end(venue_id)
+        if len(_order_settings_cache) > _ORDER_SETTINGS_CACHE_SIZE:
+            _order_settings_cache.popitem(last=False)
+    return settings
+
+
+def _invalidate_order_settings(venue_id: UUID) -> None:
+    """Drop a venue's cached order settings after its config changes."""
+    with _order_settings_lock:
+        _order_settings_cache.pop(venue_id, None)
+
+
+def _item_to_response(item: ConvenienceItem) -> ConvenienceItemResponse:
+    """Build an item response from a row without re-validating it."""
+    return ConvenienceItemResponse.model_construct(
+        id=item.id,
+        venue_id=item.venue_id,
+        name=item.name,
+        description=item.description,
+        image_url=item.image_url,
+        category=ConvenienceItemCategory(item.category) if item.category else None,
+        base_price=item.base_price,
+        markup_amount=item.markup_amount,
+        markup_percent=item.markup_percent,
+        final_price=item.final_price,
+        source_store=item.source_store,
+        source_address=item.source_address,
+        estimated_shopping_time_minutes=item.estimated_shopping_time_minutes,
+        requires_age_verification=item.requires_age_verification,
+        max_quantity_per_order=item.max_quantity_per_order,
+        is_active=item.is_active,
+        tags=item.tags,
+        sku=item.sku,
+        barcode=item.barcode,
+        created_at=item.created_at,
+        updated_at=item.updated_at,
+        created_by_id=item.created_by_id,
+    )
+
 
 class ConvenienceItemService:
     """Service for managing convenience store items."""
@@ -78,11 +235,6 @@ class ConvenienceItemService:
                 detail="Venue not found"
             )
 
-        # Calculate final price
-        final_price = item_data.base_price + item_data.markup_amount
-        if item_data.markup_percent > 0:
-            final_price += (item_data.base_price * item_data.markup_percent / Decimal("100"))
-
         # Create item
         item = ConvenienceItem(
             id=uuid4(),
@@ -94,7 +246,6 @@ class ConvenienceItemService:
             base_price=item_data.base_price,
             markup_amount=item_data.markup_amount,
             markup_percent=item_data.markup_percent,
-            final_price=final_price,
             source_store=item_data.source_store,
             source_address=item_data.source_address,
             estimated_shopping_time_minutes=item_data.estimated_shopping_time_minutes,
@@ -107,12 +258,13 @@ class ConvenienceItemService:
         )
 
         db.add(item)
+        db.flush()
+        response = _item_to_response(item)
         db.commit()
-        db.refresh(item)
 
-        logger.info(f"Created convenience item {item.id} - {item.name}")
+        logger.info("Created convenience item %s - %s", response.id, response.name)
 
-        return ConvenienceItemResponse.model_validate(item)
+        return response
 
     @staticmethod
     def get_item(db: Session, item_id: UUID) -> ConvenienceItemResponse:
@@ -136,7 +288,7 @@ class ConvenienceItemService:
                 detail="Item not found"
             )
 
-        return ConvenienceItemResponse.model_validate(item)
+        return _item_to_response(item)
 
     @staticmethod
     def list_items(
@@ -146,8 +298,9 @@ class ConvenienceItemService:
         is_active: Optional[bool] = None,
         search: Optional[str] = None,
         page: int = 1,
-        page_size: int = 50
-    ) -> Tuple[List[ConvenienceItemResponse], int]:
+        page_size: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[ConvenienceItemResponse], Optional[int], Optional[str]]:
         """
         List items for a venue with filters.
 
@@ -159,9 +312,10 @@ class ConvenienceItemService:
             search: Search in name/description
             page: Page number
             page_size: Items per page
+            cursor: Keyset cursor from a previous page (skips the count)
 
         Returns:
-            Tuple of (items list, total count)
+            Tuple of (items list, total count or None, next page cursor)
         """
         query = db.query(ConvenienceItem).filter(ConvenienceItem.venue_id == venue_id)
 
@@ -180,12 +334,9 @@ class ConvenienceItemService:
                 )
             )
 
-        total = query.count()
+        items, total, next_cursor = paginate(query, ITEM_SORT, cursor, page, page_size)
 
-        offset = (page - 1) * page_size
-        items = query.order_by(ConvenienceItem.name).offset(offset).limit(page_size).all()
-
-        return ([ConvenienceItemResponse.model_validate(item) for item in items], total)
+        return ([_item_to_response(item) for item in items], total, next_cursor)
 
     @staticmethod
     def update_item(
@@ -225,45 +376,46 @@ class ConvenienceItemService:
             if field != "category":  # Already handled
                 setattr(item, field, value)
 
-        # Recalculate final price if pricing fields changed
-        if any(field in update_data for field in ["base_price", "markup_amount", "markup_percent"]):
-            final_price = item.base_price + item.markup_amount
-            if item.markup_percent > 0:
-                final_price += (item.base_price * item.markup_percent / Decimal("100"))
-            item.final_price = final_price
-
         item.updated_at = datetime.utcnow()
 
+        db.flush()
+        response = _item_to_response(item)
         db.commit()
-        db.refresh(item)
 
-        logger.info(f"Updated convenience item {item.id}")
+        logger.info("Updated convenience item %s", item_id)
 
-        return ConvenienceItemResponse.model_validate(item)
+        return response
 
     @staticmethod
-    def delete_item(db: Session, item_id: UUID) -> None:
+    def delete_item(db: Session, item_id: UUID, venue_id: Optional[UUID] = None) -> None:
         """
         Delete an item.
 
+        Issues the DELETE directly; order lines keep their snapshot and the
+        database nulls their item_id.
+
         Args:
             db: Database session
             item_id: Item ID
+            venue_id: If given, only delete the item if it belongs to this venue
 
         Raises:
             HTTPException: If item not found
         """
-        item = db.query(ConvenienceItem).filter(ConvenienceItem.id == item_id).first()
-        if not item:
+        stmt = delete(ConvenienceItem).where(ConvenienceItem.id == item_id)
+        if venue_id is not None:
+            stmt = stmt.where(ConvenienceItem.venue_id == venue_id)
+
+        deleted = db.execute(stmt.returning(ConvenienceItem.id)).first()
+        if deleted is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Item not found"
             )
 
-        db.delete(item)
         db.commit()
 
-        logger.info(f"Deleted convenience item {item_id}")
+        logger.info("Deleted convenience item %s", item_id)
 
     @staticmethod
     def toggle_item_active(db: Session, item_id: UUID) -> ConvenienceItemResponse:
@@ -290,82 +442,71 @@ class ConvenienceItemService:
         item.is_active = not item.is_active
         item.updated_at = datetime.utcnow()
 
+        db.flush()
+        response = _item_to_response(item)
         db.commit()
-        db.refresh(item)
 
-        logger.info(f"Toggled item {item_id} active status to {item.is_active}")
+        logger.info("Toggled item %s active status to %s", item_id, response.is_active)
 
-        return ConvenienceItemResponse.model_validate(item)
+        return response
 
 
 class ConvenienceOrderService:
     """Service for managing convenience orders."""
 
     # Status transition rules
-    VALID_TRANSITIONS: Dict[str, List[str]] = {
-        ConvenienceOrderStatus.PENDING.value: [
+    VALID_TRANSITIONS: Dict[str, FrozenSet[str]] = {
+        ConvenienceOrderStatus.PENDING.value: frozenset({
             ConvenienceOrderStatus.CONFIRMED.value,
             ConvenienceOrderStatus.CANCELLED.value
-        ],
-        ConvenienceOrderStatus.CONFIRMED.value: [
+        }),
+        ConvenienceOrderStatus.CONFIRMED.value: frozenset({
             ConvenienceOrderStatus.SHOPPING.value,
             ConvenienceOrderStatus.CANCELLED.value
-        ],
-        ConvenienceOrderStatus.SHOPPING.value: [
+        }),
+        ConvenienceOrderStatus.SHOPPING.value: frozenset({
             ConvenienceOrderStatus.PURCHASED.value,
             ConvenienceOrderStatus.CANCELLED.value
-        ],
-        ConvenienceOrderStatus.PURCHASED.value: [
+        }),
+        ConvenienceOrderStatus.PURCHASED.value: frozenset({
             ConvenienceOrderStatus.STORED.value,
             ConvenienceOrderStatus.READY.value
-        ],
-        ConvenienceOrderStatus.STORED.value: [
+        }),
+        ConvenienceOrderStatus.STORED.value: frozenset({
             ConvenienceOrderStatus.READY.value
-        ],
-        ConvenienceOrderStatus.READY.value: [
+        }),
+        ConvenienceOrderStatus.READY.value: frozenset({
             ConvenienceOrderStatus.DELIVERED.value
-        ],
-        ConvenienceOrderStatus.DELIVERED.value: [
+        }),
+        ConvenienceOrderStatus.DELIVERED.value: frozenset({
             ConvenienceOrderStatus.COMPLETED.value
-        ],
-        ConvenienceOrderStatus.COMPLETED.value: [],
-        ConvenienceOrderStatus.CANCELLED.value: [
+        }),
+        ConvenienceOrderStatus.COMPLETED.value: frozenset(),
+        ConvenienceOrderStatus.CANCELLED.value: frozenset({
             ConvenienceOrderStatus.REFUNDED.value
-        ],
-        ConvenienceOrderStatus.REFUNDED.value: [],
+        }),
+        ConvenienceOrderStatus.REFUNDED.value: frozenset(),
     }
 
     @staticmethod
     def generate_order_number(db: Session) -> str:
         """
-        Generate unique order number in CS-XXXX format.
+        Generate unique order number in CS-XXXXX format.
 
         Args:
             db: Database session
 
         Returns:
-            Unique order number (e.g., "CS-1234")
+            Unique order number (e.g., "CS-10234")
         """
-        max_attempts = 100
-        for _ in range(max_attempts):
-            number = secrets.randbelow(10000)
-            order_number = f"CS-{number:04d}"
-
-            exists = db.query(ConvenienceOrder).filter(
-                ConvenienceOrder.order_number == order_number
-            ).first()
-
-            if not exists:
-                return order_number
-
-        # Fallback to UUID-based generation
-        return f"CS-{uuid4().hex[:4].upper()}"
+        return f"CS-{db.scalar(order_number_seq.next_value())}"
 
     @staticmethod
     def calculate_pricing(
         db: Session,
         venue_id: UUID,
-        items: List[Tuple[ConvenienceItem, int]]
+        items: List[Tuple[ConvenienceItem, int]],
+        config: Optional[OrderSettings] = None
     ) -> PricingBreakdown:
         """
         Calculate pricing for an order.
@@ -374,14 +515,13 @@ class ConvenienceOrderService:
             db: Database session
             venue_id: Venue ID
             items: List of (item, quantity) tuples
+            config: Venue order settings, if the caller already has them
 
         Returns:
             Pricing breakdown
         """
-        # Get config
-        config = db.query(ConvenienceStoreConfig).filter(
-            ConvenienceStoreConfig.venue_id == venue_id
-        ).first()
+        if config is None:
+            config = _get_order_settings(db, venue_id)
 
         if not config:
             raise HTTPException(
@@ -389,25 +529,23 @@ class ConvenienceOrderService:
                 detail="Convenience store not configured for this venue"
             )
 
-        # Calculate subtotal
-        subtotal = Decimal("0")
-        for item, quantity in items:
-            subtotal += item.final_price * quantity
+        # Work in integer cents; prices and percentages are Numeric(_, 2) so
+        # the conversion is exact.
+        subtotal_cents = sum(_to_cents(item.final_price) * quantity for item, quantity in items)
 
-        # Calculate service fee
-        service_fee = subtotal * (config.default_service_fee_percent / Decimal("100"))
+        # Service fee, rounded half up to the cent like the Numeric columns
+        service_fee_cents = (subtotal_cents * config.service_fee_basis_points + 5000) // 10000
 
         # Calculate tax (placeholder - would integrate with tax service)
-        tax = Decimal("0")
+        tax_cents = 0
 
-        # Calculate total
-        total = subtotal + service_fee + tax
+        total_cents = subtotal_cents + service_fee_cents + tax_cents
 
         return PricingBreakdown(
-            subtotal=subtotal,
-            service_fee=service_fee,
-            tax=tax,
-            total=total
+            subtotal=_from_cents(subtotal_cents),
+            service_fee=_from_cents(service_fee_cents),
+            tax=_from_cents(tax_cents),
+            total=_from_cents(total_cents)
         )
 
     @staticmethod
@@ -430,17 +568,29 @@ class ConvenienceOrderService:
         Raises:
             HTTPException: If venue not found, items invalid, or validation fails
         """
+        # Load the venue and the requested items in one query: one row per
+        # matching active item, or a single (venue, None) row if none match
+        item_ids = {order_item.item_id for order_item in order_data.items}
+        rows = db.query(Venue, ConvenienceItem).options(
+            load_only(Venue.name)
+        ).outerjoin(
+            ConvenienceItem,
+            and_(
+                ConvenienceItem.venue_id == Venue.id,
+                ConvenienceItem.id.in_(item_ids),
+                ConvenienceItem.is_active == True
+            )
+        ).filter(Venue.id == order_data.venue_id).all()
+
         # Validate venue and config
-        venue = db.query(Venue).filter(Venue.id == order_data.venue_id).first()
-        if not venue:
+        if not rows:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Venue not found"
             )
+        venue = rows[0][0]
 
-        config = db.query(ConvenienceStoreConfig).filter(
-            ConvenienceStoreConfig.venue_id == order_data.venue_id
-        ).first()
+        config = _get_order_settings(db, order_data.venue_id)
 
         if not config:
             raise HTTPException(
@@ -454,16 +604,12 @@ class ConvenienceOrderService:
                 detail="Convenience store is not enabled for this venue"
             )
 
-        # Validate and fetch items
+        # Validate items
+        items_by_id = {item.id: item for _, item in rows if item is not None}
+
         items_with_quantities = []
         for order_item in order_data.items:
-            item = db.query(ConvenienceItem).filter(
-                and_(
-                    ConvenienceItem.id == order_item.item_id,
-                    ConvenienceItem.venue_id == order_data.venue_id,
-                    ConvenienceItem.is_active == True
-                )
-            ).first()
+            item = items_by_id.get(order_item.item_id)
 
             if not item:
                 raise HTTPException(
@@ -481,7 +627,7 @@ class ConvenienceOrderService:
 
         # Calculate pricing
         pricing = ConvenienceOrderService.calculate_pricing(
-            db, order_data.venue_id, items_with_quantities
+            db, order_data.venue_id, items_with_quantities, config=config
         )
 
         # Validate order amount
@@ -509,11 +655,14 @@ class ConvenienceOrderService:
             minutes=max_shopping_time + config.average_fulfillment_time_minutes
         )
 
-        # Create order
+        # Create order with its lines and initial event. All primary keys and
+        # defaults are client-side, so the flush sends one INSERT per table
+        # (the ORM batches the lines into a single multi-row statement).
+        order_id = uuid4()
         order = ConvenienceOrder(
-            id=uuid4(),
+            id=order_id,
             order_number=order_number,
-            venue_id=order_data.venue_id,
+            venue=venue,
             user_id=user_id,
             parking_session_id=order_data.parking_session_id,
             status=ConvenienceOrderStatus.PENDING.value,
@@ -525,37 +674,32 @@ class ConvenienceOrderService:
             special_instructions=order_data.special_instructions,
             estimated_ready_time=estimated_ready_time,
             complimentary_time_added_minutes=config.default_complimentary_parking_minutes,
+            items=[
+                ConvenienceOrderItem(
+                    id=uuid4(),
+                    order_id=order_id,
+                    item_id=item.id,
+                    item_name=item.name,
+                    item_description=item.description,
+                    item_image_url=item.image_url,
+                    source_store=item.source_store,
+                    quantity=quantity,
+                    unit_price=item.final_price,
+                    line_total=item.final_price * quantity,
+                )
+                for item, quantity in items_with_quantities
+            ],
+            events=[
+                ConvenienceOrderEvent(
+                    id=uuid4(),
+                    order_id=order_id,
+                    status=ConvenienceOrderStatus.PENDING.value,
+                    notes="Order placed",
+                    created_by_id=user_id,
+                )
+            ],
         )
-
         db.add(order)
-        db.flush()  # Get order ID
-
-        # Create order items
-        for item, quantity in items_with_quantities:
-            line_total = item.final_price * quantity
-            order_item = ConvenienceOrderItem(
-                id=uuid4(),
-                order_id=order.id,
-                item_id=item.id,
-                item_name=item.name,
-                item_description=item.description,
-                item_image_url=item.image_url,
-                source_store=item.source_store,
-                quantity=quantity,
-                unit_price=item.final_price,
-                line_total=line_total,
-            )
-            db.add(order_item)
-
-        # Log initial event
-        event = ConvenienceOrderEvent(
-            id=uuid4(),
-            order_id=order.id,
-            status=ConvenienceOrderStatus.PENDING.value,
-            notes="Order placed",
-            created_by_id=user_id,
-        )
-        db.add(event)
 
         # Extend parking time if parking session provided
         if order_data.parking_session_id:
@@ -564,14 +708,17 @@ class ConvenienceOrderService:
             ).first()
             if parking_session:
                 # TODO: Implement parking time extension
-                logger.info(f"Would extend parking session {parking_session.id} by {config.default_complimentary_parking_minutes} minutes")
+                logger.info(
+                    "Would extend parking session %s by %s minutes",
+                    parking_session.id, config.default_complimentary_parking_minutes
+                )
 
+        response = ConvenienceOrderService._flush_and_build_response(db, order)
         db.commit()
-        db.refresh(order)
 
-        logger.info(f"Created convenience order {order.id} - {order_number}")
+        logger.info("Created convenience order %s - %s", order_id, order_number)
 
-        return ConvenienceOrderService._build_order_response(db, order)
+        return response
 
     @staticmethod
     def get_order(db: Session, order_id: UUID) -> ConvenienceOrderResponse:
@@ -588,17 +735,45 @@ class ConvenienceOrderService:
         Raises:
             HTTPException: If order not found
         """
-        order = db.query(ConvenienceOrder).filter(
+        order = ConvenienceOrderService._load_order_detail(db, order_id)
+
+        if not order:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Order not found"
+            )
+
+        return ConvenienceOrderService._build_order_response(order)
+
+    @staticmethod
+    def get_order_refs(db: Session, order_id: UUID):
+        """
+        Get just the venue and customer of an order.
+
+        For endpoints that only need to check who may act on the order
+        before handing off to a transition, which loads the order itself.
+
+        Args:
+            db: Database session
+            order_id: Order ID
+
+        Returns:
+            Row with venue_id and user_id
+
+        Raises:
+            HTTPException: If order not found
+        """
+        refs = db.query(ConvenienceOrder.venue_id, ConvenienceOrder.user_id).filter(
             ConvenienceOrder.id == order_id
         ).first()
 
-        if not order:
+        if not refs:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Order not found"
             )
 
-        return ConvenienceOrderService._build_order_response(db, order)
+        return refs
 
     @staticmethod
     def list_user_orders(
@@ -606,10 +781,11 @@ class ConvenienceOrderService:
         user_id: UUID,
         status: Optional[str] = None,
         page: int = 1,
-        page_size: int = 20
-    ) -> Tuple[List[ConvenienceOrderResponse], int]:
+        page_size: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[ConvenienceOrderSummary], Optional[int], Optional[str]]:
         """
-        List orders for a user.
+        List order summaries for a user.
 
         Args:
             db: Database session
@@ -617,9 +793,10 @@ class ConvenienceOrderService:
             status: Filter by status
             page: Page number
             page_size: Items per page
+            cursor: Keyset cursor from a previous page (skips the count)
 
         Returns:
-            Tuple of (orders list, total count)
+            Tuple of (order summaries, total count or None, next page cursor)
         """
         query = db.query(ConvenienceOrder).filter(
             ConvenienceOrder.user_id == user_id
@@ -628,12 +805,15 @@ class ConvenienceOrderService:
         if status:
             query = query.filter(ConvenienceOrder.status == status)
 
-        total = query.count()
-
-        offset = (page - 1) * page_size
-        orders = query.order_by(desc(ConvenienceOrder.created_at)).offset(offset).limit(page_size).all()
+        orders, total, next_cursor = paginate(
+            query.options(*ORDER_SUMMARY_LOADS), ORDER_SORT, cursor, page, page_size, descending=True
+        )
 
-        return ([ConvenienceOrderService._build_order_response(db, order) for order in orders], total)
+        return (
+            [ConvenienceOrderService._build_order_summary(order) for order in orders],
+            total,
+            next_cursor,
+        )
 
     @staticmethod
     def list_venue_orders(
@@ -641,10 +821,11 @@ class ConvenienceOrderService:
         venue_id: UUID,
         status: Optional[str] = None,
         page: int = 1,
-        page_size: int = 50
-    ) -> Tuple[List[ConvenienceOrderResponse], int]:
+        page_size: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[ConvenienceOrderSummary], Optional[int], Optional[str]]:
         """
-        List orders for a venue.
+        List order summaries for a venue.
 
         Args:
             db: Database session
@@ -652,9 +833,10 @@ class ConvenienceOrderService:
             status: Filter by status
             page: Page number
             page_size: Items per page
+            cursor: Keyset cursor from a previous page (skips the count)
 
         Returns:
-            Tuple of (orders list, total count)
+            Tuple of (order summaries, total count or None, next page cursor)
         """
         query = db.query(ConvenienceOrder).filter(
             ConvenienceOrder.venue_id == venue_id
@@ -663,12 +845,15 @@ class ConvenienceOrderService:
         if status:
             query = query.filter(ConvenienceOrder.status == status)
 
-        total = query.count()
-
-        offset = (page - 1) * page_size
-        orders = query.order_by(desc(ConvenienceOrder.created_at)).offset(offset).limit(page_size).all()
+        orders, total, next_cursor = paginate(
+            query.options(*ORDER_SUMMARY_LOADS), ORDER_SORT, cursor, page, page_size, descending=True
+        )
 
-        return ([ConvenienceOrderService._build_order_response(db, order) for order in orders], total)
+        return (
+            [ConvenienceOrderService._build_order_summary(order) for order in orders],
+            total,
+            next_cursor,
+        )
 
     @staticmethod
     def cancel_order(
@@ -692,9 +877,7 @@ class ConvenienceOrderService:
         Raises:
             HTTPException: If order not found or cannot be cancelled
         """
-        order = db.query(ConvenienceOrder).filter(
-            ConvenienceOrder.id == order_id
-        ).first()
+        order = ConvenienceOrderService._lock_order_detail(db, order_id)
 
         if not order:
             raise HTTPException(
@@ -703,37 +886,34 @@ class ConvenienceOrderService:
             )
 
         # Can only cancel pending, confirmed, or shopping orders
-        if order.status not in [
-            ConvenienceOrderStatus.PENDING.value,
-            ConvenienceOrderStatus.CONFIRMED.value,
-            ConvenienceOrderStatus.SHOPPING.value
-        ]:
+        if order.status not in CANCELLABLE_STATUSES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Cannot cancel order with status {order.status}"
             )
 
+        now = datetime.utcnow()
+
         old_status = order.status
         order.status = ConvenienceOrderStatus.CANCELLED.value
-        order.cancelled_at = datetime.utcnow()
+        order.cancelled_at = now
         order.cancellation_reason = cancellation_reason
 
         # Log event
-        event = ConvenienceOrderEvent(
+        order.events.append(ConvenienceOrderEvent(
             id=uuid4(),
             order_id=order.id,
             status=ConvenienceOrderStatus.CANCELLED.value,
             notes=f"Order cancelled: {cancellation_reason}",
             created_by_id=user_id,
-        )
-        db.add(event)
+        ))
 
+        response = ConvenienceOrderService._flush_and_build_response(db, order)
         db.commit()
-        db.refresh(order)
 
-        logger.info(f"Cancelled order {order_id}: {cancellation_reason}")
+        logger.info("Cancelled order %s: %s", order_id, cancellation_reason)
 
-        return ConvenienceOrderService._build_order_response(db, order)
+        return response
 
     @staticmethod
     def rate_order(
@@ -761,9 +941,7 @@ class ConvenienceOrderService:
         Raises:
             HTTPException: If order not found or not completed
         """
-        order = db.query(ConvenienceOrder).filter(
-            ConvenienceOrder.id == order_id
-        ).first()
+        order = ConvenienceOrderService._lock_order_detail(db, order_id)
 
         if not order:
             raise HTTPException(
@@ -771,10 +949,7 @@ class ConvenienceOrderService:
                 detail="Order not found"
             )
 
-        if order.status not in [
-            ConvenienceOrderStatus.COMPLETED.value,
-            ConvenienceOrderStatus.DELIVERED.value
-        ]:
+        if order.status not in RATEABLE_STATUSES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Can only rate completed or delivered orders"
@@ -793,50 +968,86 @@ class ConvenienceOrderService:
             order.tip_amount = tip_amount
             order.total_amount += tip_amount
 
+        response = ConvenienceOrderService._flush_and_build_response(db, order)
         db.commit()
-        db.refresh(order)
 
-        logger.info(f"Order {order_id} rated: {rating} stars")
+        logger.info("Order %s rated: %s stars", order_id, rating)
 
-        return ConvenienceOrderService._build_order_response(db, order)
+        return response
 
     @staticmethod
-    def _build_order_response(
-        db: Session,
-        order: ConvenienceOrder
-    ) -> ConvenienceOrderResponse:
-        """Build complete order response from model."""
-        # Get venue name
-        venue = db.query(Venue).filter(Venue.id == order.venue_id).first()
-        venue_name = venue.name if venue else None
-
-        # Get assigned staff name
-        assigned_staff_name = None
-        if order.assigned_staff_id:
-            staff = db.query(User).filter(User.id == order.assigned_staff_id).first()
-            if staff:
-                assigned_staff_name = f"{staff.first_name} {staff.last_name}"
-
-        # Get order items
-        items = db.query(ConvenienceOrderItem).filter(
-            ConvenienceOrderItem.order_id == order.id
-        ).all()
-        item_responses = [OrderItemResponse.model_validate(item) for item in items]
-
-        # Get events
-        events = db.query(ConvenienceOrderEvent).filter(
-            ConvenienceOrderEvent.order_id == order.id
-        ).order_by(ConvenienceOrderEvent.created_at).all()
+    def _load_order_detail(db: Session, order_id: UUID) -> Optional[ConvenienceOrder]:
+        """Load an order with everything _build_order_response needs."""
+        return db.query(ConvenienceOrder).options(*ORDER_DETAIL_LOADS).filter(
+            ConvenienceOrder.id == order_id
+        ).first()
+
+    @staticmethod
+    def _lock_order_detail(db: Session, order_id: UUID) -> Optional[ConvenienceOrder]:
+        """
+        Load an order like _load_order_detail, holding a row lock on it.
+
+        The lock lasts until the caller commits, so concurrent status
+        changes to the same order are serialized instead of overwriting
+        each other. populate_existing makes the locked row's values replace
+        any copy already in the session (e.g. from an ownership check), so
+        the status guard never reads stale data.
+
+        Any other relationship on the order raises instead of lazy loading,
+        so a transition that starts reading one fails loudly in tests rather
+        than quietly adding a query per call.
+        """
+        return db.query(ConvenienceOrder).options(
+            *ORDER_DETAIL_LOADS, raiseload("*")
+        ).filter(
+            ConvenienceOrder.id == order_id
+        ).with_for_update(of=ConvenienceOrder).populate_existing().first()
+
+    @staticmethod
+    def _flush_and_build_response(db: Session, order: ConvenienceOrder) -> ConvenienceOrderResponse:
+        """
+        Flush pending changes and build the response from the loaded order.
+
+        Call before commit: the session expires everything on commit, and
+        building from the already-loaded graph avoids reloading it.
+        """
+        db.flush()
+        return ConvenienceOrderService._build_order_response(order)
+
+    @staticmethod
+    def _build_order_summary(order: ConvenienceOrder) -> ConvenienceOrderSummary:
+        """Build a list-view summary from an order loaded with ORDER_SUMMARY_LOADS."""
+        return ConvenienceOrderSummary(
+            id=order.id,
+            order_number=order.order_number,
+            venue_name=order.venue.name if order.venue else None,
+            status=order.status,
+            total_amount=order.total_amount,
+            item_count=len(order.items),
+            estimated_ready_time=order.estimated_ready_time,
+            created_at=order.created_at
+        )
+
+    @staticmethod
+    def _build_order_response(order: ConvenienceOrder) -> ConvenienceOrderResponse:
+        """
+        Build complete order response from model.
+
+        Reads only relationships, so load the order with ORDER_DETAIL_LOADS
+        first or each one becomes a lazy load. The values come straight from
+        our own rows, so the models are constructed without validation.
+        """
+        venue_name = order.venue.name if order.venue else None
+
+        staff = order.assigned_staff
+        assigned_staff_name = f"{staff.first_name} {staff.last_name}" if staff else None
+
+        item_responses = ORDER_ITEM_LIST_ADAPTER.validate_python(order.items, from_attributes=True)
 
         event_responses = []
-        for event in events:
-            created_by_name = None
-            if event.created_by_id:
-                user = db.query(User).filter(User.id == event.created_by_id).first()
-                if user:
-                    created_by_name = f"{user.first_name} {user.last_name}"
-
-            event_responses.append(OrderEventResponse(
+        for event in order.events:
+            author = event.created_by
+            event_responses.append(OrderEventResponse.model_construct(
                 id=event.id,
                 order_id=event.order_id,
                 status=event.status,
@@ -844,24 +1055,24 @@ class ConvenienceOrderService:
                 photo_url=event.photo_url,
                 location=event.location,
                 created_by_id=event.created_by_id,
-                created_by_name=created_by_name,
+                created_by_name=f"{author.first_name} {author.last_name}" if author else None,
                 created_at=event.created_at
             ))
 
-        return ConvenienceOrderResponse(
+        return ConvenienceOrderResponse.model_construct(
             id=order.id,
             order_number=order.order_number,
             venue_id=order.venue_id,
             venue_name=venue_name,
             user_id=order.user_id,
             parking_session_id=order.parking_session_id,
-            status=ConvenienceOrderStatus(order.status),
+            status=order.status,
             subtotal=order.subtotal,
             service_fee=order.service_fee,
             tax=order.tax,
             tip_amount=order.tip_amount,
             total_amount=order.total_amount,
-            payment_status=PaymentStatus(order.payment_status),
+            payment_status=order.payment_status,
             payment_method=order.payment_method,
             assigned_staff_id=order.assigned_staff_id,
             assigned_staff_name=assigned_staff_name,
@@ -917,9 +1128,7 @@ class ConvenienceStaffService:
         Raises:
             HTTPException: If order not found or wrong status
         """
-        order = db.query(ConvenienceOrder).filter(
-            ConvenienceOrder.id == order_id
-        ).first()
+        order = ConvenienceOrderService._lock_order_detail(db, order_id)
 
         if not order:
             raise HTTPException(
@@ -933,29 +1142,32 @@ class ConvenienceStaffService:
                 detail=f"Cannot accept order with status {order.status}"
             )
 
+        now = datetime.utcnow()
+
         order.status = ConvenienceOrderStatus.CONFIRMED.value
-        order.assigned_staff_id = staff_id
-        order.confirmed_at = datetime.utcnow()
+        # Set the relationship, not just the id, so the response built from
+        # this instance names the staff member (already in the session)
+        order.assigned_staff = db.get(User, staff_id)
+        order.confirmed_at = now
 
         if estimated_ready_time:
             order.estimated_ready_time = estimated_ready_time
 
         # Log event
-        event = ConvenienceOrderEvent(
+        order.events.append(ConvenienceOrderEvent(
             id=uuid4(),
             order_id=order.id,
             status=ConvenienceOrderStatus.CONFIRMED.value,
             notes="Order accepted by staff",
             created_by_id=staff_id,
-        )
-        db.add(event)
+        ))
 
+        response = ConvenienceOrderService._flush_and_build_response(db, order)
         db.commit()
-        db.refresh(order)
 
-        logger.info(f"Order {order_id} accepted by staff {staff_id}")
+        logger.info("Order %s accepted by staff %s", order_id, staff_id)
 
-        return ConvenienceOrderService._build_order_response(db, order)
+        return response
 
     @staticmethod
     def start_shopping(
@@ -976,9 +1188,7 @@ class ConvenienceStaffService:
         Returns:
             Updated order response
         """
-        order = db.query(ConvenienceOrder).filter(
-            ConvenienceOrder.id == order_id
-        ).first()
+        order = ConvenienceOrderService._lock_order_detail(db, order_id)
 
         if not order:
             raise HTTPException(
@@ -992,25 +1202,26 @@ class ConvenienceStaffService:
                 detail=f"Cannot start shopping for order with status {order.status}"
             )
 
+        now = datetime.utcnow()
+
         order.status = ConvenienceOrderStatus.SHOPPING.value
-        order.shopping_started_at = datetime.utcnow()
+        order.shopping_started_at = now
 
         # Log event
-        event = ConvenienceOrderEvent(
+        order.events.append(ConvenienceOrderEvent(
             id=uuid4(),
             order_id=order.id,
             status=ConvenienceOrderStatus.SHOPPING.value,
             notes=notes or "Shopping started",
             created_by_id=staff_id,
-        )
-        db.add(event)
+        ))
 
+        response = ConvenienceOrderService._flush_and_build_response(db, order)
         db.commit()
-        db.refresh(order)
 
-        logger.info(f"Shopping started for order {order_id}")
+        logger.info("Shopping started for order %s", order_id)
 
-        return ConvenienceOrderService._build_order_response(db, order)
+        return response
 
     @staticmethod
     def complete_shopping(
@@ -1033,9 +1244,7 @@ class ConvenienceStaffService:
         Returns:
             Updated order response
         """
-        order = db.query(ConvenienceOrder).filter(
-            ConvenienceOrder.id == order_id
-        ).first()
+        order = ConvenienceOrderService._lock_order_detail(db, order_id)
 
         if not order:
             raise HTTPException(
@@ -1049,29 +1258,30 @@ class ConvenienceStaffService:
                 detail=f"Cannot complete shopping for order with status {order.status}"
             )
 
+        now = datetime.utcnow()
+
         order.status = ConvenienceOrderStatus.PURCHASED.value
-        order.purchased_at = datetime.utcnow()
+        order.purchased_at = now
 
         if receipt_photo_url:
             order.receipt_photo_url = receipt_photo_url
 
         # Log event
-        event = ConvenienceOrderEvent(
+        order.events.append(ConvenienceOrderEvent(
             id=uuid4(),
             order_id=order.id,
             status=ConvenienceOrderStatus.PURCHASED.value,
             notes=notes or "Shopping completed, items purchased",
             photo_url=receipt_photo_url,
             created_by_id=staff_id,
-        )
-        db.add(event)
+        ))
 
+        response = ConvenienceOrderService._flush_and_build_response(db, order)
         db.commit()
-        db.refresh(order)
 
-        logger.info(f"Shopping completed for order {order_id}")
+        logger.info("Shopping completed for order %s", order_id)
 
-        return ConvenienceOrderService._build_order_response(db, order)
+        return response
 
     @staticmethod
     def store_order(
@@ -1094,9 +1304,7 @@ class ConvenienceStaffService:
         Returns:
             Updated order response
         """
-        order = db.query(ConvenienceOrder).filter(
-            ConvenienceOrder.id == order_id
-        ).first()
+        order = ConvenienceOrderService._lock_order_detail(db, order_id)
 
         if not order:
             raise HTTPException(
@@ -1110,41 +1318,41 @@ class ConvenienceStaffService:
                 detail=f"Cannot store order with status {order.status}"
             )
 
-        order.status = ConvenienceOrderStatus.STORED.value
-        order.stored_at = datetime.utcnow()
-        order.storage_location = storage_location
+        now = datetime.utcnow()
 
-        # Also mark as ready
+        # Storing makes the order ready straight away; STORED is only
+        # recorded in the event history
         order.status = ConvenienceOrderStatus.READY.value
-        order.ready_at = datetime.utcnow()
+        order.stored_at = now
+        order.storage_location = storage_location
+        order.ready_at = now
 
         # Log events
-        event1 = ConvenienceOrderEvent(
-            id=uuid4(),
-            order_id=order.id,
-            status=ConvenienceOrderStatus.STORED.value,
-            notes=notes or f"Items stored at {storage_location}",
-            location=storage_location,
-            created_by_id=staff_id,
-        )
-        db.add(event1)
-
-        event2 = ConvenienceOrderEvent(
-            id=uuid4(),
-            order_id=order.id,
-            status=ConvenienceOrderStatus.READY.value,
-            notes="Order ready for pickup/delivery",
-            location=storage_location,
-            created_by_id=staff_id,
-        )
-        db.add(event2)
-
+        order.events.extend([
+            ConvenienceOrderEvent(
+                id=uuid4(),
+                order_id=order.id,
+                status=ConvenienceOrderStatus.STORED.value,
+                notes=notes or f"Items stored at {storage_location}",
+                location=storage_location,
+                created_by_id=staff_id,
+            ),
+            ConvenienceOrderEvent(
+                id=uuid4(),
+                order_id=order.id,
+                status=ConvenienceOrderStatus.READY.value,
+                notes="Order ready for pickup/delivery",
+                location=storage_location,
+                created_by_id=staff_id,
+            ),
+        ])
+
+        response = ConvenienceOrderService._flush_and_build_response(db, order)
         db.commit()
-        db.refresh(order)
 
-        logger.info(f"Order {order_id} stored at {storage_location}")
+        logger.info("Order %s stored at %s", order_id, storage_location)
 
-        return ConvenienceOrderService._build_order_response(db, order)
+        return response
 
     @staticmethod
     def deliver_order(
@@ -1167,9 +1375,7 @@ class ConvenienceStaffService:
         Returns:
             Updated order response
         """
-        order = db.query(ConvenienceOrder).filter(
-            ConvenienceOrder.id == order_id
-        ).first()
+        order = ConvenienceOrderService._lock_order_detail(db, order_id)
 
         if not order:
             raise HTTPException(
@@ -1183,42 +1389,42 @@ class ConvenienceStaffService:
                 detail=f"Cannot deliver order with status {order.status}"
             )
 
-        order.status = ConvenienceOrderStatus.DELIVERED.value
-        order.delivered_at = datetime.utcnow()
+        now = datetime.utcnow()
+
+        # Delivery auto-completes the order; DELIVERED is only recorded in
+        # the event history
+        order.status = ConvenienceOrderStatus.COMPLETED.value
+        order.delivered_at = now
+        order.completed_at = now
 
         if delivery_photo_url:
             order.delivery_photo_url = delivery_photo_url
 
-        # Auto-complete
-        order.status = ConvenienceOrderStatus.COMPLETED.value
-        order.completed_at = datetime.utcnow()
-
         # Log events
-        event1 = ConvenienceOrderEvent(
-            id=uuid4(),
-            order_id=order.id,
-            status=ConvenienceOrderStatus.DELIVERED.value,
-            notes=notes or "Order delivered to customer",
-            photo_url=delivery_photo_url,
-            created_by_id=staff_id,
-        )
-        db.add(event1)
-
-        event2 = ConvenienceOrderEvent(
-            id=uuid4(),
-            order_id=order.id,
-            status=ConvenienceOrderStatus.COMPLETED.value,
-            notes="Order completed",
-            created_by_id=staff_id,
-        )
-        db.add(event2)
+        order.events.extend([
+            ConvenienceOrderEvent(
+                id=uuid4(),
+                order_id=order.id,
+                status=ConvenienceOrderStatus.DELIVERED.value,
+                notes=notes or "Order delivered to customer",
+                photo_url=delivery_photo_url,
+                created_by_id=staff_id,
+            ),
+            ConvenienceOrderEvent(
+                id=uuid4(),
+                order_id=order.id,
+                status=ConvenienceOrderStatus.COMPLETED.value,
+                notes="Order completed",
+                created_by_id=staff_id,
+            ),
+        ])
 
+        response = ConvenienceOrderService._flush_and_build_response(db, order)
         db.commit()
-        db.refresh(order)
 
-        logger.info(f"Order {order_id} delivered and completed")
+        logger.info("Order %s delivered and completed", order_id)
 
-        return ConvenienceOrderService._build_order_response(db, order)
+        return response
 
 
 class ConvenienceConfigService:
@@ -1239,22 +1445,69 @@ class ConvenienceConfigService:
         Returns:
             Config response
         """
+        config = ConvenienceConfigService._get_or_create_config_row(db, venue_id)
+        response = from_orm_trusted(ConvenienceStoreConfigResponse, config)
+        db.commit()
+        return response
+
+    @staticmethod
+    def get_public_config_json(db: Session, venue_id: UUID) -> bytes:
+        """
+        Get the serialized config for the customer-facing store page.
+
+        Args:
+            db: Database session
+            venue_id: Venue ID
+
+        Returns:
+            Config response encoded as JSON
+
+        Raises:
+            HTTPException: If the store is disabled for this venue
+        """
+        config = ConvenienceConfigService._get_or_create_config_row(db, venue_id)
+
+        if not config.is_enabled:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Convenience store not available at this venue"
+            )
+
+        payload = _config_json(config)
+        db.commit()
+        return payload
+
+    @staticmethod
+    def _get_or_create_config_row(db: Session, venue_id: UUID) -> ConvenienceStoreConfig:
+        """
+        Get the config row for a venue, creating it with defaults if missing.
+
+        The caller commits, after it has read what it needs from the row, so
+        the returned object isn't expired and reloaded by the commit.
+        """
         config = db.query(ConvenienceStoreConfig).filter(
             ConvenienceStoreConfig.venue_id == venue_id
         ).first()
 
         if not config:
-            # Create default config
-            config = ConvenienceStoreConfig(
+            # Create default config. The upsert returns the row in the same
+            # round trip, and a concurrent first request that inserted it
+            # already gets that row back instead of a unique violation (the
+            # no-op DO UPDATE is what makes RETURNING emit the existing row).
+            stmt = pg_insert(ConvenienceStoreConfig).values(
                 id=uuid4(),
                 venue_id=venue_id,
                 storage_locations=["Vehicle Trunk", "Front Desk", "Refrigerator", "Locker"]
             )
-            db.add(config)
-            db.commit()
-            db.refresh(config)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ConvenienceStoreConfig.venue_id],
+                set_={"venue_id": stmt.excluded.venue_id},
+            ).returning(ConvenienceStoreConfig)
+            config = db.scalars(
+                stmt, execution_options={"populate_existing": True}
+            ).one()
 
-        return ConvenienceStoreConfigResponse.model_validate(config)
+        return config
 
     @staticmethod
     def update_config(
@@ -1293,6 +1546,8 @@ class ConvenienceConfigService:
         db.commit()
         db.refresh(config)
 
-        logger.info(f"Updated convenience store config for venue {venue_id}")
+        _invalidate_order_settings(venue_id)
+
+        logger.info("Updated convenience store config for venue %s", venue_id)
 
-        return ConvenienceStoreConfigResponse.model_validate(config)
+        return from_orm_trusted(ConvenienceStoreConfigResponse, config)
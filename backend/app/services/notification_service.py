@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Optional
 from datetime import datetime
@@ -7,6 +8,81 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Settings don't change at runtime, so the extend link prefix is resolved once
+# TODO: Update with actual frontend URL once deployed
+_EXTEND_URL_PREFIX = getattr(settings, "FRONTEND_URL", "http://localhost:3000") + "/parking/extend/"
+
+# Most recipients per batched email request (SendGrid's personalizations limit)
+EMAIL_BATCH_SIZE = 1000
+
+# Most SMS messages in flight at once during a batched send
+SMS_BATCH_CONCURRENCY = 20
+
+_EXPIRATION_EMAIL_SUBJECT = "⏰ Your parking session is expiring in {time_str}".format_map
+
+# Message bodies are fixed; only the fields change per call. Each template is
+# parsed once here and filled with format_map from a dict of the fields.
+_EXPIRATION_EMAIL_BODY = """
+Hello,
+
+Your parking session at {lot_name}{space_info} is expiring soon!
+
+Vehicle: {vehicle_plate}
+Time Remaining: {time_str}
+Expires At: {expires_at}
+
+To extend your parking time, click here:
+{extend_url}
+
+Or use your access code: {access_code}
+
+Thank you for using TruFan Parking!
+
+---
+This is an automated notification. Please do not reply to this email.
+""".format_map
+
+_EXPIRATION_SMS_BODY = """TruFan Parking Alert:
+
+Your parking at {lot_name}{space_info} expires in {time_str}.
+
+Vehicle: {vehicle_plate}
+Code: {access_code}
+
+Extend now: {extend_url}
+""".format_map
+
+_PAYMENT_CONFIRMATION_BODY = """TruFan Parking Confirmation:
+
+Your parking session is confirmed!
+
+Lot: {lot_name}{space_info}
+Vehicle: {vehicle_plate}
+Valid Until: {expires_at}
+Amount Paid: ${actual_price}
+
+Access Code: {access_code}
+
+Save this code to extend or end your session early.
+""".format_map
+
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+def _format_expires(dt: datetime) -> str:
+    """
+    Format an expiry time as strftime('%I:%M %p on %B %d, %Y') would.
+
+    Built from the datetime's fields directly, which skips strftime's
+    format parsing and locale lookups on the notification sweep path.
+    """
+    hour = dt.hour % 12 or 12
+    meridiem = "AM" if dt.hour < 12 else "PM"
+    return f"{hour:02d}:{dt.minute:02d} {meridiem} on {_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year}"
+
 
 class NotificationService:
     """Service for sending notifications via email and SMS."""
@@ -33,9 +109,27 @@ class NotificationService:
     @staticmethod
     def _generate_extend_url(access_code: str) -> str:
         """Generate URL for extending parking session."""
-        # TODO: Update with actual frontend URL once deployed
-        base_url = settings.FRONTEND_URL if hasattr(settings, "FRONTEND_URL") else "http://localhost:3000"
-        return f"{base_url}/parking/extend/{access_code}"
+        return _EXTEND_URL_PREFIX + access_code
+
+    @staticmethod
+    def _expiration_fields(
+        session: ParkingSession,
+        lot_name: str,
+        space_number: Optional[str] = None,
+    ) -> dict[str, str]:
+        """Collect the fields the expiration email and SMS templates fill in."""
+        minutes_remaining, time_str = NotificationService._format_expiration_time(
+            session.expires_at
+        )
+        return {
+            "lot_name": lot_name,
+            "space_info": f" (Space {space_number})" if space_number else "",
+            "vehicle_plate": session.vehicle_plate,
+            "time_str": time_str,
+            "expires_at": _format_expires(session.expires_at),
+            "extend_url": NotificationService._generate_extend_url(session.access_code),
+            "access_code": session.access_code,
+        }
 
     @staticmethod
     async def send_expiration_email(
@@ -55,52 +149,28 @@ class NotificationService:
             True if email sent successfully, False otherwise
         """
         if not session.contact_email:
-            logger.warning(f"No email address for session {session.id}")
+            logger.warning("No email address for session %s", session.id)
             return False
 
-        minutes_remaining, time_str = NotificationService._format_expiration_time(
-            session.expires_at
-        )
-        extend_url = NotificationService._generate_extend_url(session.access_code)
-
-        # Format space information
-        space_info = f" (Space {space_number})" if space_number else ""
+        fields = NotificationService._expiration_fields(session, lot_name, space_number)
 
         # Email subject and body
-        subject = f"⏰ Your parking session is expiring in {time_str}"
-        body = f"""
-Hello,
-
-Your parking session at {lot_name}{space_info} is expiring soon!
-
-Vehicle: {session.vehicle_plate}
-Time Remaining: {time_str}
-Expires At: {session.expires_at.strftime('%I:%M %p on %B %d, %Y')}
-
-To extend your parking time, click here:
-{extend_url}
-
-Or use your access code: {session.access_code}
-
-Thank you for using TruFan Parking!
-
----
-This is an automated notification. Please do not reply to this email.
-"""
+        subject = _EXPIRATION_EMAIL_SUBJECT(fields)
+        body = _EXPIRATION_EMAIL_BODY(fields)
 
         try:
             # TODO: Implement actual email sending with SendGrid/AWS SES
             # For now, just log the notification
-            logger.info(f"EMAIL NOTIFICATION (simulated)")
-            logger.info(f"To: {session.contact_email}")
-            logger.info(f"Subject: {subject}")
-            logger.info(f"Body preview: {body[:100]}...")
+            logger.info("EMAIL NOTIFICATION (simulated)")
+            logger.info("To: %s", session.contact_email)
+            logger.info("Subject: %s", subject)
+            logger.info("Body preview: %s...", body[:100])
 
             # Simulate successful send
             return True
 
         except Exception as e:
-            logger.error(f"Failed to send expiration email for session {session.id}: {e}")
+            logger.error("Failed to send expiration email for session %s: %s", session.id, e)
             return False
 
     @staticmethod
@@ -121,40 +191,26 @@ This is an automated notification. Please do not reply to this email.
             True if SMS sent successfully, False otherwise
         """
         if not session.contact_phone:
-            logger.warning(f"No phone number for session {session.id}")
+            logger.warning("No phone number for session %s", session.id)
             return False
 
-        minutes_remaining, time_str = NotificationService._format_expiration_time(
-            session.expires_at
-        )
-        extend_url = NotificationService._generate_extend_url(session.access_code)
-
-        # Format space information
-        space_info = f" (Space {space_number})" if space_number else ""
+        fields = NotificationService._expiration_fields(session, lot_name, space_number)
 
         # SMS message (keep it short)
-        message = f"""TruFan Parking Alert:
-
-Your parking at {lot_name}{space_info} expires in {time_str}.
-
-Vehicle: {session.vehicle_plate}
-Code: {session.access_code}
-
-Extend now: {extend_url}
-"""
+        message = _EXPIRATION_SMS_BODY(fields)
 
         try:
             # TODO: Implement actual SMS sending with Twilio
             # For now, just log the notification
-            logger.info(f"SMS NOTIFICATION (simulated)")
-            logger.info(f"To: {session.contact_phone}")
-            logger.info(f"Message: {message[:100]}...")
+            logger.info("SMS NOTIFICATION (simulated)")
+            logger.info("To: %s", session.contact_phone)
+            logger.info("Message: %s...", message[:100])
 
             # Simulate successful send
             return True
 
         except Exception as e:
-            logger.error(f"Failed to send expiration SMS for session {session.id}: {e}")
+            logger.error("Failed to send expiration SMS for session %s: %s", session.id, e)
             return False
 
     @staticmethod
@@ -176,31 +232,131 @@ Extend now: {extend_url}
         """
         results = {"email": False, "sms": False}
 
-        # Send email notification if contact email is available
+        # Send email and SMS concurrently so the provider round trips overlap
+        channels = []
+        sends = []
         if session.contact_email:
-            results["email"] = await NotificationService.send_expiration_email(
+            channels.append("email")
+            sends.append(NotificationService.send_expiration_email(
                 session, lot_name, space_number
-            )
-
-        # Send SMS notification if contact phone is available
+            ))
         if session.contact_phone:
-            results["sms"] = await NotificationService.send_expiration_sms(
+            channels.append("sms")
+            sends.append(NotificationService.send_expiration_sms(
                 session, lot_name, space_number
-            )
+            ))
+
+        outcomes = await asyncio.gather(*sends, return_exceptions=True)
+        for channel, outcome in zip(channels, outcomes):
+            results[channel] = outcome is True
 
         # Log notification results
         if results["email"] or results["sms"]:
             logger.info(
-                f"Sent expiration notifications for session {session.id} "
-                f"(email: {results['email']}, sms: {results['sms']})"
+                "Sent expiration notifications for session %s (email: %s, sms: %s)",
+                session.id, results["email"], results["sms"]
             )
         else:
             logger.warning(
-                f"No notifications sent for session {session.id} - no contact methods available"
+                "No notifications sent for session %s - no contact methods available",
+                session.id
             )
 
         return results
 
+    @staticmethod
+    async def _send_email_batch(personalizations: list[dict]) -> bool:
+        """
+        Send one email request to many recipients.
+
+        Each recipient's body is rendered here from the same template as
+        send_expiration_email and passed as template data, so the provider
+        template only has to output it and the wording stays in this module.
+
+        Args:
+            personalizations: Per-recipient address, subject and rendered body
+
+        Returns:
+            True if the request was accepted, False otherwise
+        """
+        try:
+            # TODO: POST to SendGrid /mail/send with these personalizations
+            # For now, just log the batch
+            logger.info("EMAIL BATCH NOTIFICATION (simulated)")
+            logger.info("Recipients: %s", len(personalizations))
+            for personalization in personalizations:
+                logger.info("To: %s", personalization["to"][0]["email"])
+                logger.info("Subject: %s", personalization["subject"])
+                logger.info(
+                    "Body preview: %s...", personalization["dynamic_template_data"]["body"][:100]
+                )
+            return True
+
+        except Exception as e:
+            logger.error("Failed to send email batch of %s: %s", len(personalizations), e)
+            return False
+
+    @staticmethod
+    async def send_expiration_notifications_batch(
+        items: list[tuple[ParkingSession, str, Optional[str]]],
+        sms_concurrency: int = SMS_BATCH_CONCURRENCY,
+    ) -> list[dict[str, bool]]:
+        """
+        Send expiration notifications for many sessions at once.
+
+        Emails go out as one provider request per EMAIL_BATCH_SIZE recipients
+        instead of one per session. SMS messages have no batch API, so they
+        are sent concurrently, at most sms_concurrency at a time.
+
+        Args:
+            items: (session, lot name, optional space number) per session
+            sms_concurrency: Most SMS sends in flight at once
+
+        Returns:
+            One {"email": bool, "sms": bool} dict per item, in order
+        """
+        results = [{"email": False, "sms": False} for _ in items]
+
+        email_indexes = []
+        personalizations = []
+        sms_sends = []
+        semaphore = asyncio.Semaphore(sms_concurrency)
+
+        async def bounded_sms(
+            index: int, session: ParkingSession, lot_name: str, space_number: Optional[str]
+        ):
+            async with semaphore:
+                results[index]["sms"] = await NotificationService.send_expiration_sms(
+                    session, lot_name, space_number
+                )
+
+        for index, (session, lot_name, space_number) in enumerate(items):
+            if session.contact_email:
+                fields = NotificationService._expiration_fields(session, lot_name, space_number)
+                email_indexes.append(index)
+                personalizations.append({
+                    "to": [{"email": session.contact_email}],
+                    "subject": _EXPIRATION_EMAIL_SUBJECT(fields),
+                    "dynamic_template_data": {"body": _EXPIRATION_EMAIL_BODY(fields)},
+                })
+            if session.contact_phone:
+                sms_sends.append(bounded_sms(index, session, lot_name, space_number))
+
+        async def send_emails():
+            for start in range(0, len(personalizations), EMAIL_BATCH_SIZE):
+                sent = await NotificationService._send_email_batch(
+                    personalizations[start:start + EMAIL_BATCH_SIZE]
+                )
+                for index in email_indexes[start:start + EMAIL_BATCH_SIZE]:
+                    results[index]["email"] = sent
+
+        outcomes = await asyncio.gather(send_emails(), *sms_sends, return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error("Error sending expiration notification batch: %s", outcome)
+
+        return results
+
     @staticmethod
     async def send_payment_confirmation(
         session: ParkingSession,
@@ -220,35 +376,30 @@ Extend now: {extend_url}
         """
         space_info = f" (Space {space_number})" if space_number else ""
 
-        message = f"""TruFan Parking Confirmation:
-
-Your parking session is confirmed!
-
-Lot: {lot_name}{space_info}
-Vehicle: {session.vehicle_plate}
-Valid Until: {session.expires_at.strftime('%I:%M %p on %B %d, %Y')}
-Amount Paid: ${session.actual_price}
-
-Access Code: {session.access_code}
-
-Save this code to extend or end your session early.
-"""
+        message = _PAYMENT_CONFIRMATION_BODY({
+            "lot_name": lot_name,
+            "space_info": space_info,
+            "vehicle_plate": session.vehicle_plate,
+            "expires_at": _format_expires(session.expires_at),
+            "actual_price": session.actual_price,
+            "access_code": session.access_code,
+        })
 
         try:
             # Send to email if available
             if session.contact_email:
-                logger.info(f"PAYMENT CONFIRMATION EMAIL (simulated)")
-                logger.info(f"To: {session.contact_email}")
-                logger.info(f"Message: {message[:100]}...")
+                logger.info("PAYMENT CONFIRMATION EMAIL (simulated)")
+                logger.info("To: %s", session.contact_email)
+                logger.info("Message: %s...", message[:100])
 
             # Send to SMS if available
             if session.contact_phone:
-                logger.info(f"PAYMENT CONFIRMATION SMS (simulated)")
-                logger.info(f"To: {session.contact_phone}")
-                logger.info(f"Message: {message[:100]}...")
+                logger.info("PAYMENT CONFIRMATION SMS (simulated)")
+                logger.info("To: %s", session.contact_phone)
+                logger.info("Message: %s...", message[:100])
 
             return True
 
         except Exception as e:
-            logger.error(f"Failed to send payment confirmation for session {session.id}: {e}")
+            logger.error("Failed to send payment confirmation for session %s: %s", session.id, e)
             return False
@@ -29,6 +29,7 @@ from app.schemas.opportunity import (
     OpportunityAcceptResponse,
     InteractionContext,
 )
+from app.services.parking_service import ParkingService
 
 
 class UserContext:
@@ -144,12 +145,9 @@ class OpportunityEngine:
             await self._record_impressions(user_id, parking_session_id, top_opportunities)
 
         # Convert to response objects with distance
-        return [
-            OpportunityResponse.from_orm_with_distance(
-                opp, context.user_lat, context.user_lng
-            )
-            for opp in top_opportunities
-        ]
+        return OpportunityResponse.from_orm_with_distance_batch(
+            top_opportunities, context.user_lat, context.user_lng
+        )
 
     async def _get_parking_session(self, session_id: str) -> Optional[ParkingSession]:
         """Get parking session by ID."""
@@ -305,8 +303,8 @@ class OpportunityEngine:
         # Spatial proximity (0-25 points)
         if context.user_lat and context.user_lng and opportunity.location_lat:
             distance_score = self._calculate_distance_score(
-                float(opportunity.location_lat),
-                float(opportunity.location_lng),
+                opportunity.location_lat,
+                opportunity.location_lng,
                 context.user_lat,
                 context.user_lng,
                 context.max_acceptable_distance,
@@ -623,6 +621,7 @@ class OpportunityEngine:
         if session and session.expires_at:
             session.expires_at = session.expires_at + timedelta(minutes=minutes)
             self.db.commit()
+            ParkingService.schedule_expiry(session)
 
     async def dismiss_opportunity(
         self, user_id: str, opportunity_id: str, parking_session_id: str, reason: str, feedback: Optional[str] = None
@@ -1,13 +1,16 @@
-from datetime import datetime, timedelta
+import logging
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Optional, List
 from uuid import uuid4
 import secrets
 import string
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_, or_
 
+from app.core.redis_client import redis_client
 from app.models.parking import ParkingLot, ParkingSpace, ParkingSession
+from app.schemas.common import to_decimal
 from app.schemas.parking import (
     ParkingSessionCreate,
     ParkingSessionResponse,
@@ -18,9 +21,35 @@ from app.schemas.parking import (
 from fastapi import HTTPException, status
 
 
+logger = logging.getLogger(__name__)
+
+# Sorted set of session id -> expires_at (epoch seconds). BackgroundTasks
+# uses it to sleep until the next expiry instead of polling on a fixed
+# interval; the database stays the source of truth.
+PARKING_EXPIRY_SCHEDULE_KEY = "parking:expiry"
+
+
 class ParkingService:
     """Service for managing parking sessions and spaces."""
 
+    @staticmethod
+    def schedule_expiry(session: ParkingSession) -> None:
+        """Record (or move) a session's expiry in the Redis schedule."""
+        expires_at = session.expires_at.replace(tzinfo=timezone.utc).timestamp()
+        try:
+            redis_client.zadd(PARKING_EXPIRY_SCHEDULE_KEY, {str(session.id): expires_at})
+        except Exception as e:
+            # The background tasks fall back to their polling interval
+            logger.warning(f"Could not schedule expiry for session {session.id}: {e}")
+
+    @staticmethod
+    def unschedule_expiry(session: ParkingSession) -> None:
+        """Drop a session from the Redis expiry schedule."""
+        try:
+            redis_client.zrem(PARKING_EXPIRY_SCHEDULE_KEY, str(session.id))
+        except Exception as e:
+            logger.warning(f"Could not unschedule expiry for session {session.id}: {e}")
+
     @staticmethod
     def _generate_access_code(length: int = 8) -> str:
         """Generate unique access code for parking session."""
@@ -113,12 +142,12 @@ class ParkingService:
 
         # Get pricing config
         pricing = lot.pricing_config or {}
-        base_rate = Decimal(str(pricing.get("base_rate", 10.00)))
-        hourly_rate = Decimal(str(pricing.get("hourly_rate", 5.00)))
-        max_daily_rate = Decimal(str(pricing.get("max_daily", 50.00)))
+        base_rate = to_decimal(pricing.get("base_rate", 10.00))
+        hourly_rate = to_decimal(pricing.get("hourly_rate", 5.00))
+        max_daily_rate = to_decimal(pricing.get("max_daily", 50.00))
         min_duration_minutes = pricing.get("min_duration_minutes", 15)
         max_duration_hours = pricing.get("max_duration_hours", 24)
-        dynamic_multiplier = Decimal(str(pricing.get("dynamic_multiplier", 1.0)))
+        dynamic_multiplier = to_decimal(pricing.get("dynamic_multiplier", 1.0))
 
         # Validate duration
         if session_data.duration_hours * 60 < min_duration_minutes:
@@ -213,6 +242,7 @@ class ParkingService:
 
         db.commit()
         db.refresh(parking_session)
+        ParkingService.schedule_expiry(parking_session)
 
         # Build response
         return ParkingSessionResponse(
@@ -345,10 +375,10 @@ class ParkingService:
         # Get lot pricing
         lot = db.query(ParkingLot).filter(ParkingLot.id == session.lot_id).first()
         pricing = lot.pricing_config or {}
-        base_rate = Decimal(str(pricing.get("base_rate", 10.00)))
-        hourly_rate = Decimal(str(pricing.get("hourly_rate", 5.00)))
-        max_daily_rate = Decimal(str(pricing.get("max_daily", 50.00)))
-        dynamic_multiplier = Decimal(str(pricing.get("dynamic_multiplier", 1.0)))
+        base_rate = to_decimal(pricing.get("base_rate", 10.00))
+        hourly_rate = to_decimal(pricing.get("hourly_rate", 5.00))
+        max_daily_rate = to_decimal(pricing.get("max_daily", 50.00))
+        dynamic_multiplier = to_decimal(pricing.get("dynamic_multiplier", 1.0))
 
         # Calculate additional cost (no base rate, just hourly)
         additional_cost = ParkingService._calculate_parking_price(
@@ -372,6 +402,7 @@ class ParkingService:
 
         db.commit()
         db.refresh(session)
+        ParkingService.schedule_expiry(session)
 
         space = (
             db.query(ParkingSpace).filter(ParkingSpace.id == session.space_id).first()
@@ -440,6 +471,7 @@ class ParkingService:
 
         db.commit()
         db.refresh(session)
+        ParkingService.unschedule_expiry(session)
 
         space = (
             db.query(ParkingSpace).filter(ParkingSpace.id == session.space_id).first()
@@ -468,18 +500,24 @@ class ParkingService:
 
     @staticmethod
     def get_expiring_sessions(
-        db: Session, minutes_threshold: int = 30
+        db: Session, minutes_threshold: int = 30, now: Optional[datetime] = None
     ) -> List[ParkingSession]:
         """Get parking sessions that are expiring soon and need notification."""
-        threshold_time = datetime.utcnow() + timedelta(minutes=minutes_threshold)
+        now = now or datetime.utcnow()
+        threshold_time = now + timedelta(minutes=minutes_threshold)
 
+        # Lot and space are loaded in the same query for the notifications
         sessions = (
             db.query(ParkingSession)
+            .options(
+                joinedload(ParkingSession.parking_lot),
+                joinedload(ParkingSession.space),
+            )
             .filter(
                 and_(
                     ParkingSession.status == "active",
                     ParkingSession.expires_at <= threshold_time,
-                    ParkingSession.expires_at > datetime.utcnow(),
+                    ParkingSession.expires_at > now,
                 )
             )
             .all()
@@ -981,7 +981,7 @@ class ValetService:
                     parts.append(session.vehicle_model)
                 vehicle_info = " ".join(parts)
 
-            items.append(ValetHistoryItem(
+            items.append(ValetHistoryItem.model_construct(
                 id=session.id,
                 venue_name=venue.name if venue else "Unknown",
                 vehicle_plate=session.vehicle_plate,
@@ -993,7 +993,7 @@ class ValetService:
                 rating=session.rating
             ))
 
-        return ValetHistory(
+        return ValetHistory.model_construct(
             sessions=items,
             total=total,
             page=page,
@@ -1035,7 +1035,7 @@ class ValetService:
                 is_available=True,
                 current_capacity=0,
                 max_capacity=0,
-                pricing=PricingInfo(
+                pricing=PricingInfo.model_construct(
                     base_rate=pricing["base_price"],
                     estimated_total=pricing["base_price"] + pricing["service_fee"]
                 )
@@ -1049,6 +1049,8 @@ class ValetService:
             "parking"
         )
 
+        # Pricing comes from ValetPricing NUMERIC columns (or Decimal defaults),
+        # so PricingInfo is built without re-validating the amounts
         pricing = ValetService._get_pricing(db, venue_id, ServiceType.STANDARD.value)
 
         return ValetAvailability(
@@ -1058,7 +1060,7 @@ class ValetService:
             current_capacity=capacity.current_occupancy,
             max_capacity=capacity.total_capacity,
             estimated_wait_minutes=eta_minutes,
-            pricing=PricingInfo(
+            pricing=PricingInfo.model_construct(
                 base_rate=pricing["base_price"],
                 estimated_total=pricing["base_price"] + pricing["service_fee"]
             ),
@@ -1099,8 +1101,24 @@ class ValetService:
         pending_retrievals = []
         active_retrievals = []
 
+        # Resolve customer and attendant names for the whole queue in one query
+        user_ids = {
+            user_id
+            for session in sessions
+            for user_id in (session.user_id, session.attendant_id)
+            if user_id
+        }
+        user_names = {}
+        if user_ids:
+            user_names = {
+                row.id: f"{row.first_name} {row.last_name}"
+                for row in db.query(User.id, User.first_name, User.last_name).filter(
+                    User.id.in_(user_ids)
+                )
+            }
+
         for session in sessions:
-            item = ValetService._build_queue_item(db, session)
+            item = ValetService._build_queue_item(session, user_names)
 
             if session.status == ValetStatus.PENDING.value:
                 pending_checkins.append(item)
@@ -1121,7 +1139,7 @@ class ValetService:
             ValetCapacity.venue_id == venue_id
         ).first()
 
-        return ValetQueueResponse(
+        return ValetQueueResponse.model_construct(
             pending_checkins=pending_checkins,
             active_parking=active_parking,
             parked=parked,
@@ -1491,20 +1509,20 @@ class ValetService:
             }
 
         # Get occupied positions from active sessions
-        active_sessions = db.query(ValetSession).filter(
+        occupied_rows = db.query(
+            ValetSession.key_storage_zone,
+            ValetSession.key_storage_position
+        ).filter(
             ValetSession.venue_id == venue_id,
             ValetSession.key_status.in_(['in_storage', 'grabbed']),
             ValetSession.status.notin_(['completed', 'cancelled', 'no_show'])
         ).all()
 
-        # Build occupied positions map: zone_id -> [positions]
+        # Build occupied positions map: zone_id -> {positions}
         occupied_positions = {}
-        for session in active_sessions:
-            if session.key_storage_zone and session.key_storage_position:
-                zone_id = session.key_storage_zone
-                if zone_id not in occupied_positions:
-                    occupied_positions[zone_id] = []
-                occupied_positions[zone_id].append(session.key_storage_position)
+        for zone_id, position in occupied_rows:
+            if zone_id and position:
+                occupied_positions.setdefault(zone_id, set()).add(position)
 
         return {
             "venue_id": config.venue_id,
@@ -1600,7 +1618,7 @@ class ValetService:
         parking_loc = None
         if session.parking_location:
             # Parse location string (e.g., "Lot A - Row 3")
-            parking_loc = ParkingLocation(notes=session.parking_location)
+            parking_loc = ParkingLocation.model_construct(notes=session.parking_location)
 
         # Build key management info
         key_mgmt = None
@@ -1610,7 +1628,7 @@ class ValetService:
             # Build storage location if available
             storage_loc = None
             if session.key_storage_zone and session.key_storage_box and session.key_storage_position:
-                storage_loc = KeyStorageLocation(
+                storage_loc = KeyStorageLocation.model_construct(
                     zone=session.key_storage_zone,
                     box=session.key_storage_box,
                     position=session.key_storage_position
@@ -1630,7 +1648,7 @@ class ValetService:
                 if grabbed_by:
                     grabbed_by_name = f"{grabbed_by.first_name} {grabbed_by.last_name}"
 
-            key_mgmt = KeyManagement(
+            key_mgmt = KeyManagement.model_construct(
                 key_tag_number=session.key_tag_number,
                 storage_location=storage_loc,
                 key_status=session.key_status if hasattr(session, 'key_status') else None,
@@ -1642,7 +1660,9 @@ class ValetService:
                 grabbed_at=session.key_grabbed_at if hasattr(session, 'key_grabbed_at') else None
             )
 
-        return ValetSessionResponse(
+        # Values come straight from our own rows, so the response and its
+        # nested models are all built without re-validation
+        return ValetSessionResponse.model_construct(
             id=session.id,
             venue_id=session.venue_id,
             venue_name=venue.name if venue else "Unknown",
@@ -1663,11 +1683,11 @@ class ValetService:
             ready_at=session.ready_time,
             completed_at=session.check_out_time,
             parking_location=parking_loc,
-            pricing=PricingInfo(
+            pricing=PricingInfo.model_construct(
                 base_rate=session.base_price,
                 estimated_total=session.total_price
             ),
-            payment=PaymentInfo(
+            payment=PaymentInfo.model_construct(
                 amount=session.total_price,
                 tip=session.tip_amount
             ) if session.check_out_time else None,
@@ -1683,8 +1703,14 @@ class ValetService:
         )
 
     @staticmethod
-    def _build_queue_item(db: Session, session: ValetSession) -> ValetQueueItem:
-        """Build queue item from session."""
+    def _build_queue_item(session: ValetSession, user_names: Dict[UUID, str]) -> ValetQueueItem:
+        """
+        Build queue item from session.
+
+        Args:
+            session: Valet session
+            user_names: Prefetched user_id -> full name map for the queue
+        """
         vehicle_info = None
         if session.vehicle_make or session.vehicle_model:
             parts = []
@@ -1698,19 +1724,9 @@ class ValetService:
                 parts.append(f"- {session.vehicle_color}")
             vehicle_info = " ".join(parts)
 
-        # Get customer name
-        customer_name = None
-        if session.user_id:
-            user = db.query(User).filter(User.id == session.user_id).first()
-            if user:
-                customer_name = f"{user.first_name} {user.last_name}"
-
-        # Get attendant name
-        attendant_name = None
-        if session.attendant_id:
-            attendant = db.query(User).filter(User.id == session.attendant_id).first()
-            if attendant:
-                attendant_name = f"{attendant.first_name} {attendant.last_name}"
+        # Get customer and attendant names
+        customer_name = user_names.get(session.user_id)
+        attendant_name = user_names.get(session.attendant_id)
 
         # Calculate wait time
         wait_time = None
@@ -1723,7 +1739,8 @@ class ValetService:
         if session.parking_location:
             parking_loc = ParkingLocation(notes=session.parking_location)
 
-        return ValetQueueItem(
+        # Values come straight from our own rows, so skip re-validation
+        return ValetQueueItem.model_construct(
             session_id=session.id,
             vehicle_plate=session.vehicle_plate,
             vehicle_info=vehicle_info,
@@ -52,7 +52,8 @@ def create_convenience_store_tables():
             base_price NUMERIC(10, 2) NOT NULL,
             markup_amount NUMERIC(10, 2) DEFAULT 0 NOT NULL,
             markup_percent NUMERIC(5, 2) DEFAULT 0 NOT NULL,
-            final_price NUMERIC(10, 2) NOT NULL,
+            final_price NUMERIC(10, 2) GENERATED ALWAYS AS
+                (base_price + markup_amount + base_price * markup_percent / 100) STORED NOT NULL,
 
             -- Source
             source_store VARCHAR(200) NOT NULL,
@@ -76,16 +77,45 @@ def create_convenience_store_tables():
         );
         """,
 
+        # Older installs stored final_price as a plain column written by the
+        # API. Postgres can't convert a column in place, so swap it for the
+        # generated one.
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'convenience_items'
+                  AND column_name = 'final_price'
+                  AND is_generated = 'NEVER'
+            ) THEN
+                ALTER TABLE convenience_items DROP COLUMN final_price;
+                ALTER TABLE convenience_items ADD COLUMN final_price NUMERIC(10, 2)
+                    GENERATED ALWAYS AS
+                    (base_price + markup_amount + base_price * markup_percent / 100) STORED NOT NULL;
+            END IF;
+        END
+        $$;
+        """,
+
         # Create indexes for convenience_items
         """
         CREATE INDEX IF NOT EXISTS ix_convenience_items_id ON convenience_items(id);
         CREATE INDEX IF NOT EXISTS ix_convenience_items_venue_id ON convenience_items(venue_id);
         CREATE INDEX IF NOT EXISTS ix_convenience_items_is_active ON convenience_items(is_active);
-        CREATE INDEX IF NOT EXISTS ix_convenience_items_venue_active ON convenience_items(venue_id, is_active);
+        DROP INDEX IF EXISTS ix_convenience_items_venue_active;
+        CREATE INDEX IF NOT EXISTS ix_convenience_items_venue_active_name ON convenience_items(venue_id, is_active, name, id);
         CREATE INDEX IF NOT EXISTS ix_convenience_items_category ON convenience_items(category);
         CREATE INDEX IF NOT EXISTS ix_convenience_items_source_store ON convenience_items(source_store);
         """,
 
+        # Trigram indexes for the item search (name/description ILIKE '%term%')
+        """
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS ix_convenience_items_name_trgm ON convenience_items USING gin (name gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS ix_convenience_items_description_trgm ON convenience_items USING gin (description gin_trgm_ops);
+        """,
+
         # 2. Create convenience_orders table
         """
         CREATE TABLE IF NOT EXISTS convenience_orders (
@@ -158,7 +188,16 @@ def create_convenience_store_tables():
         CREATE INDEX IF NOT EXISTS ix_convenience_orders_user_id ON convenience_orders(user_id);
         CREATE INDEX IF NOT EXISTS ix_convenience_orders_parking_session_id ON convenience_orders(parking_session_id);
         CREATE INDEX IF NOT EXISTS ix_convenience_orders_status ON convenience_orders(status);
-        CREATE INDEX IF NOT EXISTS ix_convenience_orders_venue_status ON convenience_orders(venue_id, status);
+        DROP INDEX IF EXISTS ix_convenience_orders_venue_status;
+        CREATE INDEX IF NOT EXISTS ix_convenience_orders_venue_status_created ON convenience_orders(venue_id, status, created_at, id);
+        CREATE INDEX IF NOT EXISTS ix_convenience_orders_venue_created ON convenience_orders(venue_id, created_at, id);
+        CREATE INDEX IF NOT EXISTS ix_convenience_orders_user_created ON convenience_orders(user_id, created_at, id);
+        """,
+
+        # Order number sequence. Starts above the old random CS-0000..CS-9999
+        # range so new numbers never collide with existing orders.
+        """
+        CREATE SEQUENCE IF NOT EXISTS convenience_order_number_seq START WITH 10000;
         """,
 
         # 3. Create convenience_order_items table
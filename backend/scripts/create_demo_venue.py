@@ -597,21 +597,14 @@ def create_demo_venue():
             if existing_item:
                 continue
 
-            # Calculate final price
-            base_price = item_data["base_price"]
-            markup_amount = item_data.get("markup_amount", Decimal("0.00"))
-            markup_percent = item_data.get("markup_percent", Decimal("0.00"))
-            final_price = base_price + markup_amount + (base_price * markup_percent / 100)
-
             item = ConvenienceItem(
                 venue_id=venue.id,
                 name=item_data["name"],
                 description=item_data.get("description"),
                 category=item_data["category"],
-                base_price=base_price,
-                markup_amount=markup_amount,
-                markup_percent=markup_percent,
-                final_price=final_price,
+                base_price=item_data["base_price"],
+                markup_amount=item_data.get("markup_amount", Decimal("0.00")),
+                markup_percent=item_data.get("markup_percent", Decimal("0.00")),
                 source_store=item_data["source_store"],
                 source_address=item_data.get("source_address"),
                 estimated_shopping_time_minutes=item_data.get("estimated_shopping_time_minutes", 15),
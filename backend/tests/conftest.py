@@ -2,10 +2,12 @@ import pytest
 from typing import Generator
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlalchemy.orm import sessionmaker
 
 from app.main import app
-from app.core.database import Base, get_db
+from app.core.database import ASYNC_DATABASE_URL, AsyncSessionLocal, Base, get_db
 from app.core.config import settings
 
 
@@ -15,6 +17,12 @@ engine = create_engine(settings.DATABASE_URL)
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# pytest-asyncio gives each test its own event loop, and pooled asyncpg
+# connections can't move between loops, so don't pool async connections
+AsyncSessionLocal.configure(
+    bind=create_async_engine(ASYNC_DATABASE_URL, poolclass=NullPool)
+)
+
 
 @pytest.fixture(scope="function")
 def db() -> Generator:
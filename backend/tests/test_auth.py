@@ -221,3 +221,92 @@ class TestPasswordChange:
         )
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestLastLogin:
+    """Test buffered last-login times."""
+
+    def test_register_does_not_record_login(self, client, test_user):
+        """Test registering doesn't buffer a last-login time."""
+        from app.core.redis_client import redis_client
+
+        assert redis_client.get(f"last_login:{test_user['user']['id']}") is None
+
+    def test_login_records_login(self, client, test_user_data, test_user):
+        """Test logging in buffers a last-login time."""
+        from app.core.redis_client import redis_client
+
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"email": test_user_data["email"], "password": test_user_data["password"]},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        assert redis_client.get(f"last_login:{test_user['user']['id']}") is not None
+
+    @pytest.mark.asyncio
+    async def test_flush_last_logins(self, db, test_user):
+        """Test buffered times are moved from Redis into users.last_login."""
+        from datetime import datetime
+        from uuid import UUID
+        from app.core.redis_client import redis_client
+        from app.models.user import User
+        from app.services.background_tasks import BackgroundTasks
+
+        user_id = UUID(test_user["user"]["id"])
+        logged_in_at = datetime(2024, 3, 4, 5, 6, 7)
+        key = f"last_login:{user_id}"
+        redis_client.set(key, logged_in_at.isoformat(), expire=60)
+
+        await BackgroundTasks._flush_last_logins()
+
+        # The key is consumed and the time written back
+        assert redis_client.get(key) is None
+        db.expire_all()
+        assert db.get(User, user_id).last_login == logged_in_at
+
+
+class TestRefreshChecks:
+    """Test the Redis-side refresh token and active-flag checks."""
+
+    def test_refresh_with_replaced_token_fails(self, client, test_user):
+        """Test a valid JWT that isn't the stored refresh token is rejected."""
+        from app.core.redis_client import redis_client
+
+        # Stand in for a newer login having replaced the stored token
+        redis_client.set(
+            f"refresh_token:{test_user['user']['id']}", "some-newer-token", expire=60
+        )
+
+        response = client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": test_user["refresh_token"]}
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_refresh_caches_active_flag(self, client, test_user):
+        """Test a refresh without a cached flag reads Postgres and caches it."""
+        from app.core.redis_client import redis_client
+
+        key = f"user:{test_user['user']['id']}:active"
+        redis_client.delete(key)
+
+        response = client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": test_user["refresh_token"]}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert redis_client.get(key) == "1"
+
+    def test_refresh_uses_cached_inactive_flag(self, client, test_user):
+        """Test a cached inactive flag rejects the refresh without Postgres."""
+        from app.core.redis_client import redis_client
+
+        key = f"user:{test_user['user']['id']}:active"
+        redis_client.set(key, "0", expire=60)
+
+        response = client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": test_user["refresh_token"]}
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
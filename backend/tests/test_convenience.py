@@ -0,0 +1,190 @@
+import pytest
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy.exc import InvalidRequestError
+
+from app.models.convenience import ConvenienceItem, ConvenienceStoreConfig
+from app.models.user import User
+from app.models.venue import Venue
+from app.schemas.convenience import ConvenienceOrderCreate, OrderItemCreate
+from app.services.convenience_service import (
+    ConvenienceOrderService,
+    ConvenienceStaffService,
+    OrderSettings,
+)
+
+
+def _settings(fee_percent: str) -> OrderSettings:
+    """Order settings with the given service fee, as the settings cache builds them."""
+    fee = Decimal(fee_percent)
+    return OrderSettings(
+        is_enabled=True,
+        default_service_fee_percent=fee,
+        minimum_order_amount=Decimal("0.00"),
+        maximum_order_amount=Decimal("200.00"),
+        average_fulfillment_time_minutes=30,
+        default_complimentary_parking_minutes=15,
+        service_fee_basis_points=int(fee * 100),
+    )
+
+
+def _priced(final_price: str) -> ConvenienceItem:
+    """An unsaved item carrying only the price pricing reads."""
+    return ConvenienceItem(final_price=Decimal(final_price))
+
+
+@pytest.fixture
+def test_venue(db):
+    """Create a venue with a convenience store config."""
+    unique = uuid4().hex[:8]
+    venue = Venue(
+        id=uuid4(),
+        name="Convenience Test Venue",
+        slug=f"convenience-test-{unique}",
+        email=f"venue-{unique}@example.com",
+        phone="+15550001000",
+        address_line1="1 Store St",
+        city="Chicago",
+        state="IL",
+        zip_code="60601",
+    )
+    db.add(venue)
+    db.add(ConvenienceStoreConfig(id=uuid4(), venue_id=venue.id))
+    db.commit()
+    return venue
+
+
+@pytest.fixture
+def test_item(db, test_venue):
+    """Create an active item at the test venue."""
+    item = ConvenienceItem(
+        id=uuid4(),
+        venue_id=test_venue.id,
+        name="Bottled Water",
+        base_price=Decimal("2.50"),
+        markup_amount=Decimal("0.50"),
+        source_store="Walgreens",
+    )
+    db.add(item)
+    db.commit()
+    return item
+
+
+def _user(db, role_name: str) -> User:
+    unique = uuid4().hex[:8]
+    user = User(
+        id=uuid4(),
+        email=f"{role_name}-{unique}@example.com",
+        hashed_password="not-a-real-hash",
+        first_name=role_name.title(),
+        last_name="Tester",
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def test_customer(db):
+    """Create a customer."""
+    return _user(db, "customer")
+
+
+@pytest.fixture
+def test_staff(db):
+    """Create a staff member."""
+    return _user(db, "staff")
+
+
+class TestPricing:
+    """Test order pricing in integer cents."""
+
+    def test_service_fee_rounds_half_cent_up(self):
+        """Test a fee landing exactly on half a cent rounds up."""
+        # 15% of 1.50 is 0.225
+        pricing = ConvenienceOrderService.calculate_pricing(
+            None, uuid4(), [(_priced("1.50"), 1)], config=_settings("15.00")
+        )
+
+        assert pricing.subtotal == Decimal("1.50")
+        assert pricing.service_fee == Decimal("0.23")
+        assert pricing.total == Decimal("1.73")
+
+    def test_service_fee_rounds_below_half_cent_down(self):
+        """Test a fee below half a cent rounds down."""
+        # 15% of 1.01 is 0.1515
+        pricing = ConvenienceOrderService.calculate_pricing(
+            None, uuid4(), [(_priced("1.01"), 1)], config=_settings("15.00")
+        )
+
+        assert pricing.service_fee == Decimal("0.15")
+
+    def test_multi_quantity_lines(self):
+        """Test each line is price times quantity, and the fee is on the sum."""
+        items = [(_priced("2.99"), 3), (_priced("4.50"), 2)]
+
+        pricing = ConvenienceOrderService.calculate_pricing(
+            None, uuid4(), items, config=_settings("15.00")
+        )
+
+        # 8.97 + 9.00, then 15% of 17.97 is 2.6955
+        assert pricing.subtotal == Decimal("17.97")
+        assert pricing.service_fee == Decimal("2.70")
+        assert pricing.tax == Decimal("0.00")
+        assert pricing.total == Decimal("20.67")
+
+
+class TestOrderNumbers:
+    """Test order numbers drawn from the Postgres sequence."""
+
+    def test_numbers_increase(self, db):
+        """Test each order number comes after the previous one."""
+        first = ConvenienceOrderService.generate_order_number(db)
+        second = ConvenienceOrderService.generate_order_number(db)
+
+        assert first.startswith("CS-")
+        assert second.startswith("CS-")
+        assert int(first[3:]) >= 10000
+        assert int(second[3:]) > int(first[3:])
+
+
+class TestTransitionLoading:
+    """Test order transitions run on the eager-loaded order graph."""
+
+    def _create_order(self, db, venue, item, customer):
+        order_data = ConvenienceOrderCreate(
+            venue_id=venue.id,
+            items=[OrderItemCreate(item_id=item.id, quantity=2)],
+        )
+        return ConvenienceOrderService.create_order(db, order_data, customer.id)
+
+    def test_locked_order_raises_on_unplanned_lazy_load(
+        self, db, test_venue, test_item, test_customer
+    ):
+        """Test relationships outside ORDER_DETAIL_LOADS raise instead of loading."""
+        created = self._create_order(db, test_venue, test_item, test_customer)
+
+        order = ConvenienceOrderService._lock_order_detail(db, created.id)
+
+        assert [line.item_name for line in order.items] == ["Bottled Water"]
+        with pytest.raises(InvalidRequestError):
+            order.user
+        db.rollback()
+
+    def test_transitions_need_no_lazy_loads(
+        self, db, test_venue, test_item, test_customer, test_staff
+    ):
+        """Test accept and cancel build their responses without tripping raiseload."""
+        created = self._create_order(db, test_venue, test_item, test_customer)
+
+        accepted = ConvenienceStaffService.accept_order(db, created.id, test_staff.id)
+        assert accepted.status == "confirmed"
+        assert accepted.assigned_staff_name == "Staff Tester"
+
+        cancelled = ConvenienceOrderService.cancel_order(
+            db, created.id, test_customer.id, "Changed my mind"
+        )
+        assert cancelled.status == "cancelled"
+        assert "cancelled" in [event.status for event in cancelled.events]
+        assert len(cancelled.items) == 1
@@ -0,0 +1,157 @@
+import json
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from fastapi import HTTPException
+from pydantic import TypeAdapter
+
+from app.api.v1.responses import paginated_json_response
+from app.core.pagination import decode_cursor, encode_cursor, paginate
+from app.models.parking import ParkingLot, ParkingSession
+
+
+SORT = (ParkingSession.created_at, ParkingSession.id)
+
+
+@pytest.fixture
+def test_parking_lot(db):
+    """Create a test parking lot."""
+    lot = ParkingLot(
+        id=uuid4(),
+        name="Pagination Test Lot",
+        location_address="1 Cursor Way",
+        total_spaces=10,
+        available_spaces=10,
+        is_active=True,
+        pricing_config={},
+    )
+    db.add(lot)
+    db.commit()
+    db.refresh(lot)
+    return lot
+
+
+@pytest.fixture
+def tied_sessions(db, test_parking_lot):
+    """Create five sessions, three of which share a created_at."""
+    tied = datetime(2024, 1, 1, 12, 0, 0)
+    created = [tied - timedelta(minutes=1), tied, tied, tied, tied + timedelta(minutes=1)]
+    sessions = []
+    for i, created_at in enumerate(created):
+        session = ParkingSession(
+            id=uuid4(),
+            lot_id=test_parking_lot.id,
+            vehicle_plate=f"PAGE{i}",
+            start_time=created_at,
+            expires_at=created_at + timedelta(hours=1),
+            base_price=Decimal("10.00"),
+            status="active",
+            access_code=f"PAGE{i}",
+            created_at=created_at,
+        )
+        db.add(session)
+        sessions.append(session)
+    db.commit()
+    return sessions
+
+
+class TestCursorEncoding:
+    """Test cursor encoding and decoding."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes back to typed sort-key values."""
+        created_at = datetime(2024, 5, 17, 8, 30, 15, 123456)
+        session_id = uuid4()
+
+        cursor = encode_cursor([created_at, session_id])
+
+        assert decode_cursor(cursor, SORT) == [created_at, session_id]
+
+    @pytest.mark.parametrize("cursor", [
+        "not-base64!!",
+        encode_cursor(["2024-01-01T00:00:00"]),  # Too few values
+        encode_cursor(["yesterday", str(uuid4())]),  # Bad datetime
+        encode_cursor(["2024-01-01T00:00:00", "not-a-uuid"]),  # Bad UUID
+    ])
+    def test_malformed_cursor_is_400(self, cursor):
+        """Test malformed cursors are rejected as a bad request."""
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor, SORT)
+
+        assert exc_info.value.status_code == 400
+
+
+class TestKeysetPaging:
+    """Test paging through a query by cursor and by page number."""
+
+    def _query(self, db, lot):
+        return db.query(ParkingSession).filter(ParkingSession.lot_id == lot.id)
+
+    def test_descending_cursor_pages_cover_ties(self, db, test_parking_lot, tied_sessions):
+        """Test cursor pages return every row once, in order, across tied created_at."""
+        expected = sorted(tied_sessions, key=lambda s: (s.created_at, s.id), reverse=True)
+
+        seen = []
+        rows, total, cursor = paginate(
+            self._query(db, test_parking_lot), SORT, None, 1, 2, descending=True
+        )
+        seen.extend(rows)
+        while cursor:
+            rows, total, cursor = paginate(
+                self._query(db, test_parking_lot), SORT, cursor, 1, 2, descending=True
+            )
+            assert total is None
+            seen.extend(rows)
+
+        assert [s.id for s in seen] == [s.id for s in expected]
+
+    def test_page_number_path_returns_cursor(self, db, test_parking_lot, tied_sessions):
+        """Test page-number paging counts rows and hands back a next cursor."""
+        rows, total, cursor = paginate(
+            self._query(db, test_parking_lot), SORT, None, 1, 2, descending=True
+        )
+
+        assert total == 5
+        assert len(rows) == 2
+        assert cursor is not None
+
+        # Following the cursor continues where page 1 stopped
+        next_rows, _, _ = paginate(
+            self._query(db, test_parking_lot), SORT, cursor, 1, 2, descending=True
+        )
+        page_two, _, _ = paginate(
+            self._query(db, test_parking_lot), SORT, None, 2, 2, descending=True
+        )
+        assert [s.id for s in next_rows] == [s.id for s in page_two]
+
+    def test_last_page_has_no_cursor(self, db, test_parking_lot, tied_sessions):
+        """Test the last page by page number has no next cursor."""
+        rows, total, cursor = paginate(
+            self._query(db, test_parking_lot), SORT, None, 3, 2, descending=True
+        )
+
+        assert len(rows) == 1
+        assert cursor is None
+
+
+class TestPaginatedResponse:
+    """Test the paginated JSON body with and without a cursor field."""
+
+    def test_last_page_emits_null_cursor(self):
+        """Test next_cursor is present as null rather than omitted."""
+        response = paginated_json_response(
+            "items", TypeAdapter(list), [], 0, 1, 20, next_cursor=None
+        )
+
+        body = json.loads(response.body)
+        assert "next_cursor" in body
+        assert body["next_cursor"] is None
+
+    def test_no_cursor_field_without_next_cursor(self):
+        """Test wrappers without a next_cursor field keep their plain shape."""
+        response = paginated_json_response("sessions", TypeAdapter(list), [], 0, 1, 20)
+
+        body = json.loads(response.body)
+        assert body == {"sessions": [], "total": 0, "page": 1, "page_size": 20}
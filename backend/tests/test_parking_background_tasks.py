@@ -380,10 +380,10 @@ class TestBackgroundTaskNotifications:
         db.add(expiring_session)
         db.commit()
 
-        # Process the session
-        await BackgroundTasks._notify_expiring_session(db, expiring_session)
+        # Run the sweep that notifies it
+        await BackgroundTasks._process_expiring_sessions()
 
-        # Session status should be updated
+        # Session should be marked as notified
         db.refresh(expiring_session)
         assert expiring_session.status == "expiring_soon"
         assert expiring_session.last_notification_sent is not None
@@ -434,7 +434,7 @@ class TestBackgroundTaskNotifications:
         db.commit()
 
         # Process notification
-        await BackgroundTasks._notify_expiring_session(db, session)
+        await BackgroundTasks._process_expiring_sessions()
 
         # Check timestamp was set
         db.refresh(session)
@@ -499,7 +499,7 @@ class TestBackgroundTaskEdgeCases:
         db.commit()
 
         # Should handle gracefully (no notification sent, but status not updated)
-        await BackgroundTasks._notify_expiring_session(db, session)
+        await BackgroundTasks._process_expiring_sessions()
 
         db.refresh(session)
         # Status should remain active since no notification was sent
@@ -1,9 +1,12 @@
+import asyncio
+
 import pytest
 from datetime import datetime, timedelta
 from decimal import Decimal
 from uuid import uuid4
 
 from app.models.parking import ParkingLot, ParkingSpace, ParkingSession
+from app.services import notification_service
 from app.services.notification_service import NotificationService
 
 
@@ -412,3 +415,128 @@ class TestNotificationTiming:
         )
 
         assert results["email"] is True
+
+
+def _unsaved_session(code, email=None, phone=None):
+    """Build a session for batch tests; the batch path never touches the DB."""
+    return ParkingSession(
+        id=uuid4(),
+        lot_id=uuid4(),
+        vehicle_plate=code,
+        start_time=datetime.utcnow(),
+        expires_at=datetime.utcnow() + timedelta(minutes=20),
+        base_price=Decimal("15.00"),
+        status="active",
+        access_code=code,
+        contact_email=email,
+        contact_phone=phone,
+    )
+
+
+class TestBatchNotifications:
+    """Test batched expiration notifications for a sweep."""
+
+    @pytest.mark.asyncio
+    async def test_results_line_up_with_items(self, monkeypatch):
+        """Test each result describes the item at the same index."""
+        async def fail_for_second(session, lot_name, space_number=None):
+            return session.access_code != "SMS2"
+
+        monkeypatch.setattr(
+            NotificationService, "send_expiration_sms", staticmethod(fail_for_second)
+        )
+
+        items = [
+            (_unsaved_session("EMAIL1", email="one@example.com"), "Lot A", "A-1"),
+            (_unsaved_session("NONE"), "Lot A", None),
+            (_unsaved_session("SMS2", phone="+15550000002"), "Lot B", None),
+            (_unsaved_session("BOTH", email="both@example.com", phone="+15550000003"), "Lot B", "B-4"),
+        ]
+
+        results = await NotificationService.send_expiration_notifications_batch(items)
+
+        assert results == [
+            {"email": True, "sms": False},
+            {"email": False, "sms": False},
+            {"email": False, "sms": False},
+            {"email": True, "sms": True},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_emails_split_at_batch_size(self, monkeypatch):
+        """Test emails go out in requests of at most EMAIL_BATCH_SIZE recipients."""
+        batches = []
+
+        async def record_batch(personalizations):
+            batches.append([p["to"][0]["email"] for p in personalizations])
+            return True
+
+        monkeypatch.setattr(notification_service, "EMAIL_BATCH_SIZE", 2)
+        monkeypatch.setattr(
+            NotificationService, "_send_email_batch", staticmethod(record_batch)
+        )
+
+        items = [
+            (_unsaved_session(f"E{i}", email=f"user{i}@example.com"), "Lot", None)
+            for i in range(5)
+        ]
+
+        results = await NotificationService.send_expiration_notifications_batch(items)
+
+        assert batches == [
+            ["user0@example.com", "user1@example.com"],
+            ["user2@example.com", "user3@example.com"],
+            ["user4@example.com"],
+        ]
+        assert all(r["email"] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_email_batch_carries_rendered_body(self, monkeypatch):
+        """Test each batched email carries the same body send_expiration_email builds."""
+        sent = []
+
+        async def record_batch(personalizations):
+            sent.extend(personalizations)
+            return True
+
+        monkeypatch.setattr(
+            NotificationService, "_send_email_batch", staticmethod(record_batch)
+        )
+
+        session = _unsaved_session("BODY1", email="body@example.com")
+        await NotificationService.send_expiration_notifications_batch([(session, "Body Lot", "7")])
+
+        body = sent[0]["dynamic_template_data"]["body"]
+        assert "Body Lot (Space 7)" in body
+        assert "BODY1" in body
+        assert "/parking/extend/BODY1" in body
+
+    @pytest.mark.asyncio
+    async def test_sms_concurrency_cap(self, monkeypatch):
+        """Test no more than sms_concurrency SMS sends run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_sms(session, lot_name, space_number=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        monkeypatch.setattr(
+            NotificationService, "send_expiration_sms", staticmethod(slow_sms)
+        )
+
+        items = [
+            (_unsaved_session(f"S{i}", phone=f"+1555000{i:04d}"), "Lot", None)
+            for i in range(6)
+        ]
+
+        results = await NotificationService.send_expiration_notifications_batch(
+            items, sms_concurrency=2
+        )
+
+        assert peak == 2
+        assert all(r["sms"] for r in results)
@@ -1,7 +1,11 @@
 import pytest
+from passlib.hash import bcrypt
+
 from app.core.security import (
     verify_password,
+    verify_and_update_password,
     get_password_hash,
+    hash_reset_token,
     create_access_token,
     create_refresh_token,
     verify_token,
@@ -43,6 +47,37 @@ class TestPasswordHashing:
         assert verify_password(password, hash1) is True
         assert verify_password(password, hash2) is True
 
+    def test_new_hashes_use_argon2id(self):
+        """Test that new hashes are Argon2id."""
+        hashed = get_password_hash("TestPassword123")
+
+        assert hashed.startswith("$argon2id$")
+
+    def test_legacy_bcrypt_hash_is_upgraded(self):
+        """Test that bcrypt hashes still verify and get an Argon2id replacement."""
+        password = "TestPassword123"
+        legacy_hash = bcrypt.hash(password)
+
+        is_valid, new_hash = verify_and_update_password(password, legacy_hash)
+
+        assert is_valid is True
+        assert new_hash is not None
+        assert new_hash.startswith("$argon2id$")
+        assert verify_password(password, new_hash) is True
+
+
+class TestResetTokenHashing:
+    """Test password reset token hashing."""
+
+    def test_reset_token_hash_is_stable_and_opaque(self):
+        """Test the stored form is a fixed-length digest, not the token."""
+        token = "reset-token-value"
+        hashed = hash_reset_token(token)
+
+        assert hashed == hash_reset_token(token)
+        assert hashed != token
+        assert len(hashed) == 64
+
 
 class TestJWTTokens:
     """Test JWT token creation and verification."""
@@ -0,0 +1,41 @@
+"""index users.reset_token
+
+Revision ID: 5247c11d89bf
+Revises: a7f9e3b2c1d4
+Create Date: 2026-10-16 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5247c11d89bf'
+down_revision: Union[str, None] = 'a7f9e3b2c1d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only users with a pending reset carry a token, so a partial index stays
+    # tiny. CONCURRENTLY can't run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_reset_token_active',
+            'users',
+            ['reset_token'],
+            unique=False,
+            postgresql_where=sa.text('reset_token IS NOT NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_reset_token_active',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,41 @@
+"""index expires_at of live parking sessions
+
+Revision ID: adf2f477113e
+Revises: 5247c11d89bf
+Create Date: 2026-10-16 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'adf2f477113e'
+down_revision: Union[str, None] = '5247c11d89bf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The expiry notifier and cleanup only look at live sessions, which are a
+    # small slice of the table. CONCURRENTLY can't run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_parking_sessions_active_expires',
+            'parking_sessions',
+            ['expires_at'],
+            unique=False,
+            postgresql_where=sa.text("status IN ('active', 'expiring_soon')"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_parking_sessions_active_expires',
+            table_name='parking_sessions',
+            postgresql_concurrently=True,
+        )